@@ -0,0 +1,612 @@
+#!/usr/bin/env python3
+"""Benchmark the Universal Scheduler engine with many schedulers.
+
+Runs the scheduler switches together with the tick dispatcher, command
+queue and X-axis tracker inside an in-process Home Assistant core (no HTTP,
+no frontend) driven by a virtual clock, so hours of schedules pass in
+seconds. Schedulers get a seeded mix of domains, interpolation modes, point
+counts and time- or entity-based X-axes; X-axis sensors follow a random
+walk.
+
+Reported per scale: setup time, tick evaluation latency percentiles (all
+work due at one virtual instant, until Home Assistant is idle again),
+service calls issued, timers armed (total and peak alive), peak memory and
+the latency of config edits (what set_schedule_config does to an entity).
+A final create/delete churn checks that deleted schedulers leave no timers,
+listeners or references behind; leaks are reported and fail the run
+with a non-zero exit status, also with --single.
+
+Usage:
+    python benchmarks/bench_scheduler.py
+    python benchmarks/bench_scheduler.py --schedulers 1000 --hours 24
+    python benchmarks/bench_scheduler.py --json > results.json
+
+Each scale runs in its own process so memory figures do not add up.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+import gc
+import heapq
+import json
+import logging
+from pathlib import Path
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+import weakref
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.core import CoreState, HomeAssistant, callback  # noqa: E402
+from homeassistant.helpers import entity as entity_helper  # noqa: E402
+from homeassistant.helpers import entity_registry as er  # noqa: E402
+from homeassistant.helpers import restore_state  # noqa: E402
+from homeassistant.helpers.entity_component import EntityComponent  # noqa: E402
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.universal_scheduler import (  # noqa: E402
+    dispatcher as dispatcher_module,
+    switch as switch_module,
+    x_axis as x_axis_module,
+)
+from custom_components.universal_scheduler.command_queue import (  # noqa: E402
+    CommandQueue,
+)
+from custom_components.universal_scheduler.const import DOMAIN  # noqa: E402
+from custom_components.universal_scheduler.dispatcher import (  # noqa: E402
+    TickDispatcher,
+)
+from custom_components.universal_scheduler.metrics import COUNTERS  # noqa: E402
+from custom_components.universal_scheduler.switch import (  # noqa: E402
+    UniversalSchedulerSwitch,
+    async_remove_scheduler,
+)
+from custom_components.universal_scheduler.x_axis import XAxisTracker  # noqa: E402
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SCALES = (100, 1000, 5000)
+
+# Exit status of a run whose deleted schedulers leaked something
+LEAK_EXIT_CODE = 3
+
+# Target domain -> (services to register, min_y, max_y)
+DOMAINS = {
+    "light": (("turn_on", "turn_off"), 0, 100),
+    "climate": (("set_temperature",), 15, 25),
+    "input_number": (("set_value",), 0, 100),
+    "fan": (("turn_on", "turn_off", "set_percentage"), 0, 100),
+    "cover": (("open_cover", "close_cover", "set_cover_position"), 0, 100),
+}
+MODES = ("linear", "smooth", "step")
+POINT_COUNTS = (2, 4, 8, 24, 96)
+X_AXIS_MAX = 1000  # Range of the simulated X-axis sensors
+
+
+class VirtualClock:
+    """Virtual time and timer heap replacing wall-clock timers.
+
+    Timers armed by the integration (dispatcher instants and slots, X-axis
+    debounce windows, override recovery) land in a heap and fire when the
+    clock is advanced past them.
+    """
+
+    def __init__(self, start: datetime) -> None:
+        """Initialize the clock at the given (aware) time."""
+        self.now = start
+        self._heap: list[list] = []
+        self._seq = 0
+        self.armed = 0
+        self.alive = 0
+        self.peak_alive = 0
+
+    def patches(self) -> list:
+        """Return the patches routing time and timers through the clock."""
+        return [
+            patch.object(dt_util, "now", self.local_now),
+            patch.object(dt_util, "utcnow", self.utcnow),
+            patch.object(
+                dispatcher_module, "async_track_point_in_time", self.track_point
+            ),
+            patch.object(switch_module, "async_track_point_in_time", self.track_point),
+            patch.object(x_axis_module, "async_call_later", self.call_later),
+        ]
+
+    def local_now(self, time_zone=None) -> datetime:
+        """Return the virtual time in the given or default time zone."""
+        return self.now.astimezone(time_zone or dt_util.DEFAULT_TIME_ZONE)
+
+    def utcnow(self) -> datetime:
+        """Return the virtual time in UTC."""
+        return self.now.astimezone(dt_util.UTC)
+
+    def track_point(self, hass, action, when: datetime):
+        """Stand in for async_track_point_in_time."""
+        return self.call_at(when, action)
+
+    def call_later(self, hass, delay, action):
+        """Stand in for async_call_later."""
+        if isinstance(delay, timedelta):
+            delay = delay.total_seconds()
+        return self.call_at(self.now + timedelta(seconds=delay), action)
+
+    def call_at(self, when: datetime, action, count: bool = True):
+        """Run action(when) once the clock reaches when.
+
+        Returns a callback cancelling it. Only counted calls show up in the
+        timer statistics.
+        """
+        entry = [when, self._seq, action, False, count]
+        self._seq += 1
+        heapq.heappush(self._heap, entry)
+        if count:
+            self.armed += 1
+            self.alive += 1
+            self.peak_alive = max(self.peak_alive, self.alive)
+
+        @callback
+        def cancel() -> None:
+            """Cancel the call if it has not run yet."""
+            if not entry[3]:
+                entry[3] = True
+                entry[2] = None  # Like asyncio, drop the callback right away
+                if entry[4]:
+                    self.alive -= 1
+
+        return cancel
+
+    async def async_run_until(self, hass: HomeAssistant, end: datetime) -> list:
+        """Advance to end, returning the latency (s) of each busy instant."""
+        latencies = []
+        while self._heap and self._heap[0][0] <= end:
+            when = self._heap[0][0]
+            self.now = when
+            started = time.perf_counter()
+            ran = False
+            while self._heap and self._heap[0][0] == when:
+                entry = heapq.heappop(self._heap)
+                if entry[3]:
+                    continue
+                entry[3] = True
+                if entry[4]:
+                    self.alive -= 1
+                entry[2](when)
+                ran = True
+            await hass.async_block_till_done()
+            if ran:
+                latencies.append(time.perf_counter() - started)
+        self.now = end
+        return latencies
+
+
+def make_points(rng: random.Random, count: int, x_max: float, y_min, y_max):
+    """Return count random points spread over 0..x_max."""
+    xs = sorted(rng.uniform(0, x_max) for _ in range(count - 2))
+    return [
+        {"x": round(x, 2), "y": round(rng.uniform(y_min, y_max), 2)}
+        for x in (0, *xs, x_max)
+    ]
+
+
+def make_config(
+    rng: random.Random, index: int, sensors: list[str], entity_ratio: float
+) -> dict:
+    """Return a random scheduler config."""
+    domain = rng.choice(tuple(DOMAINS))
+    _, min_y, max_y = DOMAINS[domain]
+
+    graphs = []
+    # Some schedulers split weekdays and weekends over two graphs
+    weekday_sets = (
+        [[1, 2, 3, 4, 5], [0, 6]] if rng.random() < 0.3 else [[0, 1, 2, 3, 4, 5, 6]]
+    )
+    for number, weekdays in enumerate(weekday_sets, 1):
+        graph = {
+            "id": f"graph_{number}",
+            "label": f"Schedule {number}",
+            "weekdays": weekdays,
+            "attribute": None,
+            "mode": rng.choice(MODES),
+            "min_y": min_y,
+            "max_y": max_y,
+            "x_axis_type": "time",
+            "x_axis_entity": None,
+        }
+        if sensors and rng.random() < entity_ratio:
+            graph.update(
+                {
+                    "x_axis_type": "entity",
+                    "x_axis_entity": rng.choice(sensors),
+                    "x_axis_min": 0,
+                    "x_axis_max": X_AXIS_MAX,
+                    "x_axis_debounce": rng.choice((0, 0, 5, 30)),
+                    "x_axis_deadband": rng.choice((0, 0, 10, 50)),
+                }
+            )
+        x_max = X_AXIS_MAX if graph["x_axis_type"] == "entity" else 1440
+        graph["points"] = make_points(
+            rng, rng.choice(POINT_COUNTS), x_max, min_y, max_y
+        )
+        graphs.append(graph)
+
+    return {
+        "name": f"Bench {index}",
+        "target_entity": f"{domain}.bench_{index}",
+        "domain": domain,
+        "enabled": True,
+        "update_interval": rng.choice((30, 60, 300)),
+        "graphs": graphs,
+    }
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the pct percentile of values (nearest rank)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of this process in MB."""
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+async def async_run_scale(args: argparse.Namespace, count: int) -> dict:
+    """Simulate count schedulers and return the measurements."""
+    rng = random.Random(args.seed)
+    start = datetime(2024, 1, 8, args.start_hour, tzinfo=dt_util.UTC)
+    clock = VirtualClock(start)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        if hasattr(hass.config, "async_set_time_zone"):
+            await hass.config.async_set_time_zone("UTC")
+        else:
+            hass.config.set_time_zone("UTC")
+
+        for patcher in clock.patches():
+            patcher.start()
+        try:
+            return await _async_simulate(hass, args, count, rng, clock)
+        finally:
+            patch.stopall()
+            await hass.async_stop(force=True)
+
+
+async def _async_simulate(
+    hass: HomeAssistant,
+    args: argparse.Namespace,
+    count: int,
+    rng: random.Random,
+    clock: VirtualClock,
+) -> dict:
+    """Set up the schedulers, run the simulation and collect the results."""
+    # What bootstrap sets up before any integration adds entities
+    entity_helper.async_setup(hass)
+    await er.async_load(hass)
+    await restore_state.async_load(hass)
+    # Schedulers join a running instance and start right away, rather than in
+    # the staggered sweep that follows Home Assistant's startup
+    hass.set_state(CoreState.running)
+
+    service_calls = 0
+
+    async def count_call(call) -> None:
+        """Count a service call to a target entity."""
+        nonlocal service_calls
+        service_calls += 1
+
+    for domain, (services, _, _) in DOMAINS.items():
+        for service in services:
+            hass.services.async_register(domain, service, count_call)
+
+    hass.data[DOMAIN] = {
+        "schedulers": {},
+        "switch_entities": {},
+        "rate_limits": {},
+        "retired_metrics": dict.fromkeys(COUNTERS, 0),
+        "dispatcher": TickDispatcher(hass),
+        "x_axis": XAxisTracker(hass),
+    }
+    hass.data[DOMAIN]["command_queue"] = CommandQueue(hass, {})
+
+    # X-axis sensors, one per 50 schedulers, following a random walk
+    sensors = [f"sensor.bench_x_{i}" for i in range(max(1, count // 50))]
+    sensor_values = {}
+    for sensor in sensors:
+        sensor_values[sensor] = rng.uniform(0, X_AXIS_MAX)
+        hass.states.async_set(sensor, f"{sensor_values[sensor]:.1f}")
+
+    def sensor_updater(sensor: str):
+        """Return the action updating a sensor and re-arming itself."""
+
+        def update(_now) -> None:
+            """Move the sensor a random step."""
+            value = sensor_values[sensor] + rng.gauss(0, X_AXIS_MAX / 100)
+            sensor_values[sensor] = min(X_AXIS_MAX, max(0, value))
+            hass.states.async_set(sensor, f"{sensor_values[sensor]:.1f}")
+            clock.call_at(
+                clock.now + timedelta(seconds=args.sensor_period), update, False
+            )
+
+        return update
+
+    for sensor in sensors:
+        clock.call_at(
+            clock.now + timedelta(seconds=rng.uniform(0, args.sensor_period)),
+            sensor_updater(sensor),
+            False,
+        )
+
+    # Setup: create and add all scheduler switches (first evaluation included)
+    rss_before = peak_rss_mb()
+    started = time.perf_counter()
+    configs = [make_config(rng, i, sensors, args.entity_ratio) for i in range(count)]
+    entities = [
+        UniversalSchedulerSwitch(hass, cfg["name"], cfg["target_entity"], cfg)
+        for cfg in configs
+    ]
+    for entity in entities:
+        hass.data[DOMAIN]["switch_entities"][entity.target_entity] = entity
+    component = EntityComponent(_LOGGER, "switch", hass)
+    await component.async_add_entities(entities)
+    await hass.async_block_till_done()
+    setup_time = time.perf_counter() - started
+    setup_calls = service_calls
+
+    # Simulated run
+    started = time.perf_counter()
+    latencies = await clock.async_run_until(
+        hass, clock.now + timedelta(hours=args.hours)
+    )
+    run_time = time.perf_counter() - started
+    run_calls = service_calls - setup_calls
+
+    # Config edits, as applied by the set_schedule_config service
+    edit_latencies = []
+    for index in rng.sample(range(count), max(1, count // 10)):
+        entity, cfg = entities[index], configs[index]
+        edited = make_config(rng, index, sensors, args.entity_ratio)
+        started = time.perf_counter()
+        await entity.set_config(
+            target_entity=cfg["target_entity"],
+            domain=cfg["domain"],
+            attribute=None,
+            mode="linear",
+            min_y=0,
+            max_y=100,
+            points=[],
+            graphs=edited["graphs"],
+        )
+        await hass.async_block_till_done()
+        edit_latencies.append(time.perf_counter() - started)
+
+    leaks = await _async_churn(hass, args, count, rng, clock, component)
+
+    return {
+        "schedulers": count,
+        "sensors": len(sensors),
+        "simulated_hours": args.hours,
+        "setup_s": round(setup_time, 3),
+        "run_s": round(run_time, 3),
+        "ticks": len(latencies),
+        "tick_p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "tick_p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "tick_p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "tick_max_ms": round(max(latencies, default=0) * 1000, 3),
+        "setup_service_calls": setup_calls,
+        "service_calls": run_calls,
+        "timers_armed": clock.armed,
+        "timers_peak_alive": clock.peak_alive,
+        "peak_memory_mb": round(peak_rss_mb() - rss_before, 1),
+        "edit_p95_ms": round(percentile(edit_latencies, 95) * 1000, 3),
+        "evaluations": sum(entity.metrics.evaluations for entity in entities),
+        "suppressed": sum(entity.metrics.suppressed for entity in entities),
+        "errors": sum(entity.metrics.errors for entity in entities),
+        "leaks": leaks,
+    }
+
+
+def leak_counters(hass: HomeAssistant, clock: VirtualClock) -> dict[str, int]:
+    """Return the counts of everything a scheduler holds while it exists."""
+    domain_data = hass.data[DOMAIN]
+    return {
+        "timers": clock.alive,
+        "switch_entities": len(domain_data["switch_entities"]),
+        "state_listeners": sum(hass.bus.async_listeners().values()),
+        **domain_data["dispatcher"].async_stats(),
+        **domain_data["x_axis"].async_stats(),
+    }
+
+
+async def _async_churn(
+    hass: HomeAssistant,
+    args: argparse.Namespace,
+    count: int,
+    rng: random.Random,
+    clock: VirtualClock,
+    component: EntityComponent,
+) -> dict[str, int]:
+    """Create and delete schedulers repeatedly and return what they leaked.
+
+    Churned schedulers also detect manual overrides and follow a holiday
+    entity, so every kind of timer and listener is created and torn down.
+    """
+    hass.states.async_set("calendar.bench_holidays", "off")
+    # Own X-axis sensor, so the remaining schedulers are left alone
+    churn_sensor = "sensor.bench_churn"
+    hass.states.async_set(churn_sensor, "0")
+    baseline = leak_counters(hass, clock)
+    removed = []
+    size = max(1, count // 10)
+
+    for cycle in range(args.churn):
+        configs = [
+            make_config(rng, count * (cycle + 2) + i, [churn_sensor], 0.5)
+            for i in range(size)
+        ]
+        entities = []
+        for cfg in configs:
+            cfg["override_behavior"] = "until_next"
+            cfg["day_exceptions"] = [
+                {"entity_id": "calendar.bench_holidays", "weekday": 0}
+            ]
+            entity = UniversalSchedulerSwitch(
+                hass, cfg["name"], cfg["target_entity"], cfg
+            )
+            hass.data[DOMAIN]["switch_entities"][cfg["target_entity"]] = entity
+            entities.append(entity)
+        await component.async_add_entities(entities)
+        await hass.async_block_till_done()
+
+        # Pending X-axis debounce windows must go as well
+        hass.states.async_set(churn_sensor, f"{rng.uniform(0, X_AXIS_MAX):.1f}")
+        await hass.async_block_till_done()
+
+        # What delete_scheduler does
+        for cfg in configs:
+            await async_remove_scheduler(hass, cfg["target_entity"])
+        await hass.async_block_till_done()
+        removed.extend(weakref.ref(entity) for entity in entities)
+        del entities, entity
+
+    gc.collect()
+    after = leak_counters(hass, clock)
+    leaks = {key: after[key] - baseline[key] for key in baseline}
+    leaks["entities"] = sum(ref() is not None for ref in removed)
+    return {key: value for key, value in leaks.items() if value}
+
+
+COLUMNS = (
+    ("schedulers", "schedulers"),
+    ("setup_s", "setup s"),
+    ("ticks", "ticks"),
+    ("tick_p50_ms", "p50 ms"),
+    ("tick_p95_ms", "p95 ms"),
+    ("tick_p99_ms", "p99 ms"),
+    ("tick_max_ms", "max ms"),
+    ("service_calls", "calls"),
+    ("timers_armed", "timers"),
+    ("timers_peak_alive", "peak timers"),
+    ("peak_memory_mb", "mem MB"),
+    ("edit_p95_ms", "edit p95 ms"),
+    ("leaks", "leaks"),
+)
+
+
+def print_table(results: list[dict]) -> None:
+    """Print the results as a table."""
+    widths = [
+        max(len(title), *(len(str(result[key])) for result in results))
+        for key, title in COLUMNS
+    ]
+    print(
+        "  ".join(title.rjust(w) for (_, title), w in zip(COLUMNS, widths, strict=True))
+    )
+    for result in results:
+        print(
+            "  ".join(
+                str(result[key]).rjust(w)
+                for (key, _), w in zip(COLUMNS, widths, strict=True)
+            )
+        )
+
+
+def main() -> None:
+    """Run the benchmark for every requested scale."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--schedulers", type=int, nargs="+", default=list(DEFAULT_SCALES)
+    )
+    parser.add_argument("--hours", type=float, default=1, help="simulated hours")
+    parser.add_argument(
+        "--start-hour", type=int, default=6, help="simulated start hour (UTC)"
+    )
+    parser.add_argument(
+        "--entity-ratio",
+        type=float,
+        default=0.2,
+        help="share of graphs with an entity-based X-axis",
+    )
+    parser.add_argument(
+        "--sensor-period", type=float, default=30, help="X-axis sensor update period"
+    )
+    parser.add_argument(
+        "--churn", type=int, default=3, help="create/delete cycles of the leak check"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.single:
+        result = asyncio.run(async_run_scale(args, args.schedulers[0]))
+        print(json.dumps(result))
+        if result["leaks"]:
+            print(f"Deleted schedulers leaked: {result['leaks']}", file=sys.stderr)
+            sys.exit(LEAK_EXIT_CODE)
+        return
+
+    results = []
+    for count in args.schedulers:
+        command = [
+            sys.executable,
+            __file__,
+            "--single",
+            "--schedulers",
+            str(count),
+            *(
+                f"--{name.replace('_', '-')}={getattr(args, name)}"
+                for name in (
+                    "hours",
+                    "start_hour",
+                    "entity_ratio",
+                    "sensor_period",
+                    "churn",
+                )
+            ),
+            f"--seed={args.seed}",
+        ]
+        output = subprocess.run(command, capture_output=True, text=True)
+        if output.returncode not in (0, LEAK_EXIT_CODE):
+            sys.stderr.write(output.stderr)
+            sys.exit(f"Benchmark with {count} schedulers failed")
+        results.append(json.loads(output.stdout.strip().splitlines()[-1]))
+        if not args.json:
+            print(f"{count} schedulers done", file=sys.stderr)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            result["leaks"] = (
+                ", ".join(f"{key}={value}" for key, value in result["leaks"].items())
+                or "none"
+            )
+        print_table(results)
+
+    if any(result["leaks"] not in ({}, "none") for result in results):
+        sys.exit("Deleted schedulers leaked timers, listeners or references")
+
+
+if __name__ == "__main__":
+    main()
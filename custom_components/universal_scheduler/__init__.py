@@ -2,14 +2,28 @@ import logging
 import os
 import json
 import voluptuous as vol
-from homeassistant.core import HomeAssistant
+from voluptuous.humanize import humanize_error
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.components.http import StaticPathConfig
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
 from homeassistant.components.frontend import async_remove_panel, add_extra_js_url
 from homeassistant.components.panel_custom import async_register_panel
-from homeassistant.helpers.storage import Store
 from homeassistant.components import websocket_api
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+
+from .command_queue import CommandQueue
+from .configs import diff_schedulers, export_csv, merge_config, parse_import
+from .dispatcher import TickDispatcher
+from .metrics import COUNTERS
+from .models import DAY_EXCEPTION_SCHEMA, GRAPH_SCHEMA
+from .storage import SchedulerStorage
+from .x_axis import XAxisTracker
 
 # Import from const
 try:
@@ -19,7 +33,16 @@ try:
         SERVICE_SET_CONFIG,
         SERVICE_DELETE_SCHEDULER,
         SERVICE_APPLY_NOW,
+        SERVICE_APPLY_ALL,
+        SERVICE_APPLY_BY_AREA,
+        SERVICE_APPLY_BY_LABEL,
         SERVICE_GET_SCHEDULERS,
+        SERVICE_SET_RATE_LIMIT,
+        SERVICE_SET_CONFIG_BULK,
+        SERVICE_EXPORT_SCHEDULERS,
+        SERVICE_IMPORT_SCHEDULERS,
+        SIGNAL_SCHEDULERS_UPDATED,
+        PLATFORMS,
     )
 except ImportError:
     DOMAIN = "universal_scheduler"
@@ -27,110 +50,44 @@ except ImportError:
     SERVICE_SET_CONFIG = "set_schedule_config"
     SERVICE_DELETE_SCHEDULER = "delete_scheduler"
     SERVICE_APPLY_NOW = "apply_now"
+    SERVICE_APPLY_ALL = "apply_all"
+    SERVICE_APPLY_BY_AREA = "apply_by_area"
+    SERVICE_APPLY_BY_LABEL = "apply_by_label"
     SERVICE_GET_SCHEDULERS = "get_schedulers"
+    SERVICE_SET_RATE_LIMIT = "set_rate_limit"
+    SERVICE_SET_CONFIG_BULK = "set_schedule_config_bulk"
+    SERVICE_EXPORT_SCHEDULERS = "export_schedulers"
+    SERVICE_IMPORT_SCHEDULERS = "import_schedulers"
+    SIGNAL_SCHEDULERS_UPDATED = f"{DOMAIN}_schedulers_updated"
+    PLATFORMS = ["switch", "sensor"]
 
 _LOGGER = logging.getLogger(__name__)
 
 URL_BASE = "/universal_scheduler_assets"
-STORAGE_KEY = f"{DOMAIN}.schedulers"
-STORAGE_VERSION = 2  # Bumped for multi-graph support
-STORAGE_MINOR_VERSION = 1
-
-
-class SchedulerStore(Store):
-    """Store for scheduler data with migration support."""
-
-    async def _async_migrate_func(
-        self, old_major_version: int, old_minor_version: int, old_data: dict
-    ) -> dict:
-        """Migrate to the new version."""
-        if old_major_version == 1:
-            # Migrate from version 1 to version 2 (multi-graph format)
-            _LOGGER.info("Migrating scheduler storage from version 1 to 2")
-            schedulers = old_data.get("schedulers", {})
+# Minified bundles from frontend/dist; content-hashed names make them cacheable
+URL_DIST = "/universal_scheduler_dist"
 
-            for entity_id, cfg in schedulers.items():
-                if "graphs" not in cfg:
-                    # Extract graph-specific fields to create first graph
-                    graph = {
-                        "id": "graph_1",
-                        "label": cfg.pop("graph_label", "Schedule 1"),
-                        "weekdays": cfg.pop("weekdays", [0, 1, 2, 3, 4, 5, 6]),
-                        "attribute": cfg.pop("attribute", None),
-                        "mode": cfg.pop("mode", "linear"),
-                        "min_y": cfg.pop("min_y", 0),
-                        "max_y": cfg.pop("max_y", 100),
-                        "x_snap": cfg.pop("snap_minutes", 0)
-                        or 0,  # Convert snap_minutes to x_snap
-                        "y_snap": cfg.pop("y_snap", 0),
-                        "step_to_zero": cfg.pop("step_to_zero", False),
-                        "x_axis_type": "time",
-                        "x_axis_entity": None,
-                        "x_axis_min": None,
-                        "x_axis_max": None,
-                        "x_axis_unit": None,
-                        "points": cfg.pop(
-                            "points", [{"x": 0, "y": 0}, {"x": 1440, "y": 0}]
-                        ),
-                    }
-                    cfg["graphs"] = [graph]
-                    cfg.setdefault("graphs_per_row", 1)
-
-            old_data["multi_graph_migrated"] = True
-            return old_data
-
-        # For same major version, just return data
-        return old_data
-
-
-# Graph schema for individual graphs within a scheduler
-GRAPH_SCHEMA = vol.Schema(
-    {
-        vol.Required("id"): cv.string,
-        vol.Optional("label"): cv.string,
-        vol.Optional("weekdays"): list,  # [0-6], 0=Sunday
-        vol.Optional("attribute"): vol.Any(None, cv.string),
-        vol.Optional("mode"): cv.string,
-        vol.Optional("min_y"): vol.Coerce(float),
-        vol.Optional("max_y"): vol.Coerce(float),
-        vol.Optional("x_snap"): vol.Coerce(float),
-        vol.Optional("y_snap"): vol.Coerce(float),
-        vol.Optional("step_to_zero"): cv.boolean,
-        vol.Optional("x_axis_type"): cv.string,  # 'time' or 'entity'
-        vol.Optional("x_axis_entity"): vol.Any(
-            None, cv.string
-        ),  # entity for x-axis value
-        vol.Optional("x_axis_min"): vol.Any(
-            None, vol.Coerce(float)
-        ),  # min value for entity-based x-axis
-        vol.Optional("x_axis_max"): vol.Any(
-            None, vol.Coerce(float)
-        ),  # max value for entity-based x-axis
-        vol.Optional("x_axis_unit"): vol.Any(
-            None, cv.string
-        ),  # unit for entity-based x-axis display
-        vol.Optional("points"): list,
-    }
-)
 
 # Service schemas
 CREATE_SCHEDULER_SCHEMA = vol.Schema(
     {
         vol.Required("name"): cv.string,
-        vol.Required("entity_id"): cv.string,
+        vol.Required("entity_id"): cv.entity_id,
     }
 )
 
 SET_CONFIG_SCHEMA = vol.Schema(
     {
-        vol.Required("entity_id"): cv.string,
+        vol.Required("entity_id"): cv.entity_id,
         vol.Optional("target_entity"): cv.string,
         vol.Optional("name"): cv.string,
         vol.Optional("domain"): cv.string,
         vol.Optional("update_interval"): vol.Coerce(int),
         vol.Optional("enabled"): cv.boolean,
         vol.Optional("graphs_per_row"): vol.Coerce(int),
-        vol.Optional("graphs"): list,  # Array of graph configs
+        vol.Optional("graphs"): [GRAPH_SCHEMA],  # Array of graph configs
+        # Date-specific graph replacements (holidays, vacations), first match wins
+        vol.Optional("day_exceptions"): [DAY_EXCEPTION_SCHEMA],
         # Override behavior settings
         vol.Optional(
             "override_behavior"
@@ -138,6 +95,10 @@ SET_CONFIG_SCHEMA = vol.Schema(
         vol.Optional("override_duration"): vol.Coerce(
             int
         ),  # Duration in seconds for 'for_duration' mode
+        # Only re-send values when the target state differs from the schedule
+        vol.Optional("check_target_state"): cv.boolean,
+        # Order of the first evaluations after startup, higher goes first
+        vol.Optional("startup_priority"): vol.Coerce(int),
         # Legacy fields (for backward compatibility during migration)
         vol.Optional("attribute"): vol.Any(None, cv.string),
         vol.Optional("x_snap"): vol.Coerce(float),
@@ -153,6 +114,31 @@ SET_CONFIG_SCHEMA = vol.Schema(
     }
 )
 
+SET_CONFIG_BULK_SCHEMA = vol.Schema(
+    {
+        vol.Required("schedulers"): [SET_CONFIG_SCHEMA],
+        vol.Optional("dry_run", default=False): cv.boolean,
+    }
+)
+
+# Exported configs carry settings set_schedule_config does not take
+IMPORT_ITEM_SCHEMA = SET_CONFIG_SCHEMA.extend({}, extra=vol.REMOVE_EXTRA)
+
+EXPORT_SCHEDULERS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entity_id"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("format", default="json"): vol.In(["json", "csv"]),
+    }
+)
+
+IMPORT_SCHEDULERS_SCHEMA = vol.Schema(
+    {
+        vol.Required("data"): vol.Any(str, dict, list),  # JSON/CSV text or object
+        vol.Optional("format"): vol.In(["json", "csv"]),
+        vol.Optional("dry_run", default=False): cv.boolean,
+    }
+)
+
 DELETE_SCHEDULER_SCHEMA = vol.Schema(
     {
         vol.Required("entity_id"): cv.string,
@@ -165,16 +151,66 @@ APPLY_NOW_SCHEMA = vol.Schema(
     }
 )
 
+APPLY_BY_AREA_SCHEMA = vol.Schema(
+    {
+        vol.Required("area_id"): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+APPLY_BY_LABEL_SCHEMA = vol.Schema(
+    {
+        vol.Required("label_id"): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+SET_RATE_LIMIT_SCHEMA = vol.Schema(
+    {
+        vol.Required("integration"): cv.string,  # e.g. 'zwave_js', 'hue'
+        vol.Optional("max_concurrent"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("rate"): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),  # calls per second, 0 = unlimited
+        vol.Optional("burst"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+
+def _load_frontend_manifest(frontend_path: str) -> dict[str, str]:
+    """Return the hashed file names of the built bundles, by bundle name.
+
+    Bundles listed in frontend/dist/manifest.json but missing on disk are left
+    out, so they are served unminified instead of failing to load.
+    """
+    dist_path = os.path.join(frontend_path, "dist")
+    try:
+        with open(os.path.join(dist_path, "manifest.json"), encoding="utf-8") as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return {
+        name: filename
+        for name, filename in manifest.items()
+        if os.path.isfile(os.path.join(dist_path, filename))
+    }
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up Universal Scheduler from config entry."""
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN].setdefault("schedulers", {})
+    # Increases with every config change pushed to WebSocket subscribers
+    hass.data[DOMAIN].setdefault("revision", 0)
+
+    # Single dispatcher driving the update ticks of every scheduler
+    hass.data[DOMAIN]["dispatcher"] = TickDispatcher(hass)
+    # Single state listener per X-axis entity, shared by all schedulers
+    hass.data[DOMAIN]["x_axis"] = XAxisTracker(hass)
+    # Counters of deleted schedulers, kept in the engine metrics totals
+    hass.data[DOMAIN]["retired_metrics"] = dict.fromkeys(COUNTERS, 0)
+    hass.data[DOMAIN].setdefault("rate_limits", {})
 
     # Setup persistent storage with migration support
-    store = SchedulerStore(
-        hass, STORAGE_VERSION, STORAGE_KEY, minor_version=STORAGE_MINOR_VERSION
-    )
+    store = SchedulerStorage(hass)
     hass.data[DOMAIN]["store"] = store
 
     def migrate_to_multi_graph(cfg):
@@ -219,8 +255,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             interval_in_seconds = True
 
         # Migrate to multi-graph format if needed
+        migrated = []
         if not multi_graph_migrated:
             for entity_id, cfg in schedulers.items():
+                if "graphs" not in cfg:
+                    migrated.append(entity_id)
                 schedulers[entity_id] = migrate_to_multi_graph(cfg)
             multi_graph_migrated = True
             _LOGGER.info("Migrated schedulers to multi-graph format")
@@ -228,10 +267,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         hass.data[DOMAIN]["interval_in_seconds"] = interval_in_seconds
         hass.data[DOMAIN]["multi_graph_migrated"] = multi_graph_migrated
         hass.data[DOMAIN]["schedulers"] = schedulers
+        hass.data[DOMAIN]["rate_limits"] = stored_data.get("rate_limits", {})
+        # The main store no longer holds graphs, so migrated ones need their files
+        for entity_id in migrated:
+            store.async_schedule_save(entity_id, graphs_changed=True)
         _LOGGER.info(
             f"Loaded {len(hass.data[DOMAIN]['schedulers'])} schedulers from storage"
         )
 
+    # Rate-limited queue between the schedulers and the target integrations
+    hass.data[DOMAIN]["command_queue"] = CommandQueue(
+        hass, hass.data[DOMAIN]["rate_limits"]
+    )
+
     # Register WebSocket API for frontend to fetch schedulers
     @websocket_api.websocket_command(
         {vol.Required("type"): "universal_scheduler/get_schedulers"}
@@ -244,14 +292,65 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     websocket_api.async_register_command(hass, websocket_get_schedulers)
 
+    @websocket_api.websocket_command(
+        {vol.Required("type"): "universal_scheduler/subscribe"}
+    )
+    @callback
+    def websocket_subscribe(hass, connection, msg):
+        """Handle subscribe WebSocket command.
+
+        Sends a snapshot of all schedulers, then one delta per changed
+        scheduler (added, updated or removed) tagged with its revision.
+        """
+
+        @callback
+        def forward_delta(delta):
+            """Forward a scheduler config delta to the subscriber."""
+            connection.send_message(websocket_api.event_message(msg["id"], delta))
+
+        connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+            hass, SIGNAL_SCHEDULERS_UPDATED, forward_delta
+        )
+        connection.send_result(msg["id"])
+        connection.send_message(
+            websocket_api.event_message(
+                msg["id"],
+                {
+                    "action": "snapshot",
+                    "revision": hass.data[DOMAIN]["revision"],
+                    "schedulers": hass.data[DOMAIN]["schedulers"],
+                },
+            )
+        )
+
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
     # 1. Locate the JS file inside this component folder
     component_path = os.path.dirname(__file__)
     frontend_path = os.path.join(component_path, "frontend")
 
-    # 2. Register a static path to serve the JS
-    await hass.http.async_register_static_paths(
-        [StaticPathConfig(URL_BASE, frontend_path, cache_headers=False)]
-    )
+    # 2. Register static paths to serve the JS. The built bundles are served
+    # with long-lived cache headers; a new build changes their names.
+    manifest = await hass.async_add_executor_job(_load_frontend_manifest, frontend_path)
+    static_paths = [StaticPathConfig(URL_BASE, frontend_path, cache_headers=False)]
+    if manifest:
+        static_paths.append(
+            StaticPathConfig(
+                URL_DIST, os.path.join(frontend_path, "dist"), cache_headers=True
+            )
+        )
+    else:
+        _LOGGER.warning(
+            "Minified frontend bundles not found, serving the unminified ones; "
+            "run frontend/build.py to build them"
+        )
+    await hass.http.async_register_static_paths(static_paths)
+
+    def bundle_url(name: str) -> str:
+        """Return the URL of a frontend bundle, preferring the built one."""
+        if name in manifest:
+            return f"{URL_DIST}/{manifest[name]}"
+        return f"{URL_BASE}/{name}"
 
     # 3. Register custom panel using panel_custom's async_register_panel
     await async_register_panel(
@@ -260,44 +359,73 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         webcomponent_name="universal-curve-scheduler",
         sidebar_title="Curve Scheduler",
         sidebar_icon="mdi:chart-bell-curve-cumulative",
-        module_url=f"{URL_BASE}/panel.js",
+        module_url=bundle_url("panel.js"),
         embed_iframe=False,
         trust_external=False,
         require_admin=False,
     )
 
     # Register Lovelace card as extra JS module
-    add_extra_js_url(hass, f"{URL_BASE}/card.js")
+    add_extra_js_url(hass, bundle_url("card.js"))
     _LOGGER.info("Registered Universal Scheduler Lovelace card")
 
-    # Helper function to save schedulers to storage
-    async def save_schedulers():
-        """Save schedulers to persistent storage."""
-        await store.async_save(
+    # Helper to push a scheduler config change to WebSocket subscribers
+    @callback
+    def notify_change(entity_id: str, action: str):
+        """Send an added/updated/removed delta for one scheduler."""
+        hass.data[DOMAIN]["revision"] += 1
+        delta = {
+            "action": action,
+            "revision": hass.data[DOMAIN]["revision"],
+            "entity_id": entity_id,
+        }
+        if action != "removed":
+            delta["config"] = hass.data[DOMAIN]["schedulers"][entity_id]
+        async_dispatcher_send(hass, SIGNAL_SCHEDULERS_UPDATED, delta)
+
+    @callback
+    def notify_snapshot():
+        """Send all scheduler configs at once, after changes to many of them."""
+        hass.data[DOMAIN]["revision"] += 1
+        async_dispatcher_send(
+            hass,
+            SIGNAL_SCHEDULERS_UPDATED,
             {
+                "action": "snapshot",
+                "revision": hass.data[DOMAIN]["revision"],
                 "schedulers": hass.data[DOMAIN]["schedulers"],
-                "interval_in_seconds": hass.data[DOMAIN].get(
-                    "interval_in_seconds", True
-                ),
-                "multi_graph_migrated": hass.data[DOMAIN].get(
-                    "multi_graph_migrated", True
-                ),
-            }
+            },
         )
 
     # Helper to dynamically create or update switch entities
     async def _ensure_switch_entity(entity_id: str):
         """Create a new switch entity or update existing one for the scheduler."""
-        from .switch import UniversalSchedulerSwitch
+        await _ensure_switch_entities([entity_id])
 
-        config = hass.data[DOMAIN]["schedulers"].get(entity_id)
-        if not config:
-            return
+    async def _ensure_switch_entities(entity_ids: list[str]):
+        """Create or update the switch entities of schedulers.
+
+        New entities are added to Home Assistant in a single batch.
+        """
+        from .switch import UniversalSchedulerSwitch
 
         switch_entities = hass.data[DOMAIN].get("switch_entities", {})
         async_add_entities = hass.data[DOMAIN].get("async_add_entities")
+        new_entities = []
+
+        for entity_id in entity_ids:
+            config = hass.data[DOMAIN]["schedulers"].get(entity_id)
+            if not config:
+                continue
+            if entity_id not in switch_entities:
+                if async_add_entities:
+                    new_entity = UniversalSchedulerSwitch(
+                        hass, config.get("name", entity_id), entity_id, config
+                    )
+                    switch_entities[entity_id] = new_entity
+                    new_entities.append(new_entity)
+                continue
 
-        if entity_id in switch_entities:
             # Entity exists - update its config and restart interval if needed
             entity = switch_entities[entity_id]
             await entity.set_config(
@@ -313,20 +441,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
                 graphs=config.get("graphs"),
                 override_behavior=config.get("override_behavior"),
                 override_duration=config.get("override_duration"),
+                check_target_state=config.get("check_target_state"),
+                day_exceptions=config.get("day_exceptions", []),
+                startup_priority=config.get("startup_priority", 0),
             )
 
             _LOGGER.debug(f"Updated existing switch entity for {entity_id}")
-        elif async_add_entities:
-            # Create new entity
-            new_entity = UniversalSchedulerSwitch(
-                hass, config.get("name", entity_id), entity_id, config
-            )
-            switch_entities[entity_id] = new_entity
-            async_add_entities([new_entity])
-            _LOGGER.info(f"Created new switch entity for {entity_id}")
 
-    # 5. Forward to switch platform
-    await hass.config_entries.async_forward_entry_setups(entry, ["switch"])
+        if new_entities:
+            async_add_entities(new_entities)
+            _LOGGER.info(f"Created {len(new_entities)} new switch entities")
+
+    # 5. Forward to switch and sensor platforms
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # 6. Register services
     async def handle_create_scheduler(call):
@@ -367,91 +494,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             ],
         }
 
-        await save_schedulers()
+        store.async_schedule_save(entity_id, graphs_changed=True)
+        notify_change(entity_id, "added")
         _LOGGER.info(f"Created new scheduler: {name} for {entity_id}")
 
     async def handle_set_config(call):
         """Handle set_schedule_config service call."""
         entity_id = call.data.get("entity_id")
 
-        # Create scheduler if it doesn't exist
-        if entity_id not in hass.data[DOMAIN]["schedulers"]:
-            # Check if using new multi-graph format or legacy format
-            if "graphs" in call.data:
-                hass.data[DOMAIN]["schedulers"][entity_id] = {
-                    "name": call.data.get("name", entity_id),
-                    "target_entity": call.data.get("target_entity", entity_id),
-                    "domain": call.data.get("domain", "light"),
-                    "enabled": call.data.get("enabled", True),
-                    "update_interval": call.data.get("update_interval", 300),
-                    "graphs_per_row": call.data.get("graphs_per_row", 1),
-                    "graphs": call.data.get("graphs"),
-                    "override_behavior": call.data.get("override_behavior", "none"),
-                    "override_duration": call.data.get("override_duration", 3600),
-                }
-            else:
-                # Legacy format - create with single graph
-                hass.data[DOMAIN]["schedulers"][entity_id] = {
-                    "name": call.data.get("name", entity_id),
-                    "target_entity": call.data.get("target_entity", entity_id),
-                    "domain": call.data.get("domain", "light"),
-                    "enabled": call.data.get("enabled", True),
-                    "update_interval": call.data.get("update_interval", 300),
-                    "graphs_per_row": call.data.get("graphs_per_row", 1),
-                    "override_behavior": call.data.get("override_behavior", "none"),
-                    "override_duration": call.data.get("override_duration", 3600),
-                    "graphs": [
-                        {
-                            "id": "graph_1",
-                            "label": call.data.get("graph_label", "Schedule 1"),
-                            "weekdays": call.data.get(
-                                "weekdays", [0, 1, 2, 3, 4, 5, 6]
-                            ),
-                            "attribute": call.data.get("attribute"),
-                            "mode": call.data.get("mode", "linear"),
-                            "min_y": call.data.get("min_y", 0),
-                            "max_y": call.data.get("max_y", 100),
-                            "x_snap": call.data.get("x_snap", 0),
-                            "y_snap": call.data.get("y_snap", 0),
-                            "step_to_zero": call.data.get("step_to_zero", False),
-                            "x_axis_type": "time",
-                            "x_axis_entity": None,
-                            "x_axis_min": None,
-                            "x_axis_max": None,
-                            "x_axis_unit": None,
-                            "points": call.data.get(
-                                "points", [{"x": 0, "y": 0}, {"x": 1440, "y": 0}]
-                            ),
-                        }
-                    ],
-                }
-        else:
-            # Update existing scheduler config
-            scheduler = hass.data[DOMAIN]["schedulers"][entity_id]
-
-            # Update top-level scheduler fields
-            if "name" in call.data:
-                scheduler["name"] = call.data["name"]
-            if "target_entity" in call.data:
-                scheduler["target_entity"] = call.data["target_entity"]
-            if "domain" in call.data:
-                scheduler["domain"] = call.data["domain"]
-            if "update_interval" in call.data:
-                scheduler["update_interval"] = call.data["update_interval"]
-            if "enabled" in call.data:
-                scheduler["enabled"] = call.data["enabled"]
-            if "graphs_per_row" in call.data:
-                scheduler["graphs_per_row"] = call.data["graphs_per_row"]
-            if "override_behavior" in call.data:
-                scheduler["override_behavior"] = call.data["override_behavior"]
-            if "override_duration" in call.data:
-                scheduler["override_duration"] = call.data["override_duration"]
-
-            # Update graphs array if provided
-            if "graphs" in call.data:
-                scheduler["graphs"] = call.data["graphs"]
-
-        await save_schedulers()
+        schedulers = hass.data[DOMAIN]["schedulers"]
+
+        # Create the scheduler if it doesn't exist, else update the given fields
+        current = schedulers.get(entity_id)
+        schedulers[entity_id] = merge_config(current, call.data)
+        action = "added" if current is None else "updated"
+        graphs_changed = current is None or "graphs" in call.data
+
+        # Coalesced with other changes; only a changed graphs file is rewritten
+        store.async_schedule_save(entity_id, graphs_changed=graphs_changed)
+        notify_change(entity_id, action)
 
         # Dynamically create or update the switch entity
         await _ensure_switch_entity(entity_id)
@@ -460,11 +521,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     async def handle_delete_scheduler(call):
         """Handle delete_scheduler service call."""
+        from .switch import async_remove_scheduler
+
         entity_id = call.data.get("entity_id")
 
         if entity_id in hass.data[DOMAIN]["schedulers"]:
             del hass.data[DOMAIN]["schedulers"][entity_id]
-            await save_schedulers()
+            store.async_schedule_save()
+            await store.async_remove(entity_id)
+            await async_remove_scheduler(hass, entity_id)
+            notify_change(entity_id, "removed")
             _LOGGER.info(f"Deleted scheduler: {entity_id}")
         else:
             _LOGGER.warning(f"Scheduler not found for deletion: {entity_id}")
@@ -483,6 +549,108 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         schema=SET_CONFIG_SCHEMA,
     )
 
+    async def async_apply_configs(items: list[dict], dry_run: bool) -> dict:
+        """Apply validated set_schedule_config payloads as one change.
+
+        All payloads are merged and compared first and the diff is returned.
+        Unless dry_run, only changed schedulers are then stored, pushed to
+        subscribers in one snapshot and created or updated, with new switch
+        entities added in a single batch. Saves are coalesced by the store.
+        """
+        schedulers = hass.data[DOMAIN]["schedulers"]
+        merged: dict[str, dict] = {}
+        for data in items:
+            entity_id = data["entity_id"]
+            merged[entity_id] = merge_config(
+                merged.get(entity_id, schedulers.get(entity_id)), data
+            )
+
+        diff = diff_schedulers(schedulers, merged)
+        if dry_run:
+            return diff
+
+        changed = [*diff["added"], *diff["updated"]]
+        for entity_id in changed:
+            current = schedulers.get(entity_id)
+            schedulers[entity_id] = merged[entity_id]
+            store.async_schedule_save(
+                entity_id,
+                graphs_changed=current is None
+                or current.get("graphs") != merged[entity_id].get("graphs"),
+            )
+        if changed:
+            notify_snapshot()
+            await _ensure_switch_entities(changed)
+
+        _LOGGER.info(
+            f"Applied {len(items)} scheduler configs: {len(diff['added'])} added, "
+            f"{len(diff['updated'])} updated, {len(diff['unchanged'])} unchanged"
+        )
+        return diff
+
+    async def handle_set_config_bulk(call):
+        """Handle set_schedule_config_bulk service call - configure many at once."""
+        return await async_apply_configs(call.data["schedulers"], call.data["dry_run"])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_CONFIG_BULK,
+        handle_set_config_bulk,
+        schema=SET_CONFIG_BULK_SCHEMA,
+        supports_response="optional",
+    )
+
+    async def handle_export_schedulers(call):
+        """Handle export_schedulers service call - return configs as JSON or CSV."""
+        schedulers = hass.data[DOMAIN]["schedulers"]
+        if entity_ids := call.data.get("entity_id"):
+            schedulers = {
+                entity_id: config
+                for entity_id, config in schedulers.items()
+                if entity_id in entity_ids
+            }
+        if call.data["format"] == "csv":
+            return {"csv": export_csv(schedulers)}
+        return {"schedulers": schedulers}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_SCHEDULERS,
+        handle_export_schedulers,
+        schema=EXPORT_SCHEDULERS_SCHEMA,
+        supports_response="only",
+    )
+
+    async def handle_import_schedulers(call):
+        """Handle import_schedulers service call - apply exported configs.
+
+        Every imported scheduler is validated before any of them is applied.
+        """
+        try:
+            items = parse_import(call.data["data"], call.data.get("format"))
+        except ValueError as err:
+            raise ServiceValidationError(f"Cannot read import data: {err}") from err
+
+        validated = []
+        for index, item in enumerate(items):
+            try:
+                validated.append(IMPORT_ITEM_SCHEMA(item))
+            except vol.Invalid as err:
+                raise ServiceValidationError(
+                    f"Invalid scheduler {item.get('entity_id', f'#{index + 1}')}: "
+                    f"{humanize_error(item, err)}"
+                ) from err
+
+        return await async_apply_configs(validated, call.data["dry_run"])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_SCHEDULERS,
+        handle_import_schedulers,
+        schema=IMPORT_SCHEDULERS_SCHEMA,
+        supports_response="optional",
+    )
+
     hass.services.async_register(
         DOMAIN,
         SERVICE_DELETE_SCHEDULER,
@@ -494,17 +662,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         """Handle apply_now service call - immediately apply the current scheduled value."""
         entity_id = call.data.get("entity_id")
 
-        # Find switch entities for this scheduler
-        switch_entity_id = f"switch.scheduler_{entity_id.replace('.', '_')}"
-
-        # Get the entity from the entity registry
-        entity_component = hass.data.get("entity_components", {}).get("switch")
-        if entity_component:
-            for entity in entity_component.entities:
-                if entity.entity_id == switch_entity_id:
-                    await entity._update_entity()
-                    _LOGGER.info(f"Applied current schedule value for: {entity_id}")
-                    return
+        if entity := hass.data[DOMAIN].get("switch_entities", {}).get(entity_id):
+            await entity._update_entity(force=True)
+            _LOGGER.info(f"Applied current schedule value for: {entity_id}")
+            return
 
         _LOGGER.warning(f"Could not find scheduler switch for: {entity_id}")
 
@@ -515,6 +676,75 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         schema=APPLY_NOW_SCHEMA,
     )
 
+    async def async_apply_schedulers(entities: list) -> None:
+        """Apply the current values of many schedulers in one batched sweep."""
+        entities = [entity for entity in entities if entity.is_on]
+        await hass.data[DOMAIN]["dispatcher"].async_apply(entities)
+        _LOGGER.info(f"Applied current schedule values of {len(entities)} schedulers")
+
+    async def handle_apply_all(call):
+        """Handle apply_all service call - apply every enabled scheduler."""
+        await async_apply_schedulers(
+            list(hass.data[DOMAIN].get("switch_entities", {}).values())
+        )
+
+    async def handle_apply_targeted(call):
+        """Handle apply_by_area/apply_by_label service calls.
+
+        Applies the schedulers whose target entity, or whose own switch, is
+        in one of the areas or has one of the labels (directly or through its
+        device).
+        """
+        selected = async_extract_referenced_entity_ids(hass, call)
+        entity_ids = selected.referenced | selected.indirectly_referenced
+        await async_apply_schedulers(
+            [
+                entity
+                for entity in hass.data[DOMAIN].get("switch_entities", {}).values()
+                if entity.target_entity in entity_ids or entity.entity_id in entity_ids
+            ]
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_ALL,
+        handle_apply_all,
+        schema=vol.Schema({}),
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_BY_AREA,
+        handle_apply_targeted,
+        schema=APPLY_BY_AREA_SCHEMA,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_APPLY_BY_LABEL,
+        handle_apply_targeted,
+        schema=APPLY_BY_LABEL_SCHEMA,
+    )
+
+    async def handle_set_rate_limit(call):
+        """Handle set_rate_limit service call - limit calls to one integration."""
+        integration = call.data["integration"]
+        limit = dict(hass.data[DOMAIN]["rate_limits"].get(integration, {}))
+        for key in ("max_concurrent", "rate", "burst"):
+            if key in call.data:
+                limit[key] = call.data[key]
+
+        hass.data[DOMAIN]["command_queue"].async_set_limit(integration, limit)
+        store.async_schedule_save()
+        _LOGGER.info(f"Updated rate limit for {integration}: {limit}")
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_RATE_LIMIT,
+        handle_set_rate_limit,
+        schema=SET_RATE_LIMIT_SCHEMA,
+    )
+
     # Service to get all schedulers (for frontend)
     async def handle_get_schedulers(call):
         """Handle get_schedulers service call - return all scheduler configs."""
@@ -534,4 +764,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload Universal Scheduler config entry."""
     async_remove_panel(hass, "universal-curve-scheduler")
-    return await hass.config_entries.async_unload_platforms(entry, ["switch"])
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok and (store := hass.data[DOMAIN].get("store")):
+        await store.async_flush()
+    if unload_ok and (tracker := hass.data[DOMAIN].pop("x_axis", None)):
+        tracker.async_shutdown()
+    if unload_ok and (dispatcher := hass.data[DOMAIN].pop("dispatcher", None)):
+        dispatcher.async_shutdown()
+    if unload_ok and (queue := hass.data[DOMAIN].pop("command_queue", None)):
+        queue.async_shutdown()
+    return unload_ok
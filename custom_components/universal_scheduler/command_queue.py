@@ -0,0 +1,197 @@
+"""Rate-limited service call queue for Universal Scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .commands import ServiceCommand, async_send_commands
+from .const import (
+    DEFAULT_RATE_LIMIT_BURST,
+    DEFAULT_RATE_LIMIT_CONCURRENCY,
+    DEFAULT_RATE_LIMIT_RATE,
+)
+
+if TYPE_CHECKING:
+    from .switch import UniversalSchedulerSwitch
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Lane:
+    """Pending service calls for the targets of one integration."""
+
+    def __init__(self, name: str, limit: dict[str, Any]) -> None:
+        """Initialize the lane."""
+        self.name = name
+        # Target entity -> latest (scheduler, commands) not sent yet
+        self.pending: dict[
+            str, tuple[UniversalSchedulerSwitch, tuple[ServiceCommand, ...]]
+        ] = {}
+        self.worker: asyncio.Task | None = None
+        self.sent = 0
+        self.dropped = 0
+        self.errors = 0
+        self.set_limit(limit)
+
+    def set_limit(self, limit: dict[str, Any]) -> None:
+        """Apply concurrency and token bucket settings."""
+        self.concurrency = int(
+            limit.get("max_concurrent", DEFAULT_RATE_LIMIT_CONCURRENCY)
+        )
+        self.rate = float(limit.get("rate", DEFAULT_RATE_LIMIT_RATE))
+        self.burst = max(1, int(limit.get("burst", DEFAULT_RATE_LIMIT_BURST)))
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    async def async_acquire_token(self) -> None:
+        """Wait until the token bucket allows another call (rate 0 = unlimited)."""
+        if not self.rate:
+            return
+        while True:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pop_group(
+        self,
+    ) -> tuple[tuple[ServiceCommand, ...], list[UniversalSchedulerSwitch]]:
+        """Take the oldest pending calls plus all pending identical calls."""
+        commands = next(iter(self.pending.values()))[1]
+        targets = [
+            target for target, item in self.pending.items() if item[1] == commands
+        ]
+        return commands, [self.pending.pop(target)[0] for target in targets]
+
+
+class CommandQueue:
+    """Queue service calls in one rate-limited lane per target integration.
+
+    Each lane has at most max_concurrent call sequences in flight (a slot is
+    freed once the services have finished) and,
+    when a rate is configured, no more than rate sequences per second (with
+    bursts of up to burst). Identical pending calls are merged into a single
+    call with a list of targets. A newer value for a target replaces a
+    pending older one (latest value wins), counting the older one as dropped.
+    """
+
+    def __init__(self, hass: HomeAssistant, limits: dict[str, dict]) -> None:
+        """Initialize the queue with the configured per-integration limits."""
+        self.hass = hass
+        self._limits = limits
+        self._lanes: dict[str, _Lane] = {}
+
+    @callback
+    def async_enqueue(
+        self,
+        batch: list[tuple[UniversalSchedulerSwitch, tuple[ServiceCommand, ...]]],
+    ) -> None:
+        """Queue the service calls of one or more schedulers."""
+        for entity, commands in batch:
+            lane = self._lane_for(entity.target_entity)
+            if entity.target_entity in lane.pending:
+                lane.dropped += 1
+                lane.pending[entity.target_entity][0].metrics.dropped += 1
+                _LOGGER.debug(
+                    "Replacing pending commands for %s with newer ones",
+                    entity.target_entity,
+                )
+            lane.pending[entity.target_entity] = (entity, commands)
+
+            if lane.worker is None:
+                lane.worker = self.hass.async_create_task(self._async_run_lane(lane))
+
+    @callback
+    def async_set_limit(self, integration: str, limit: dict[str, Any]) -> None:
+        """Update the limits of an integration's lane."""
+        self._limits[integration] = limit
+        if lane := self._lanes.get(integration):
+            lane.set_limit(limit)
+
+    @callback
+    def async_cancel(self, entity: UniversalSchedulerSwitch) -> None:
+        """Drop the pending service calls of a removed scheduler."""
+        lane = self._lane_for(entity.target_entity)
+        if (pending := lane.pending.get(entity.target_entity)) and pending[0] is entity:
+            del lane.pending[entity.target_entity]
+
+    @callback
+    def async_lane_stats(self) -> dict[str, dict[str, Any]]:
+        """Return the statistics and limits of every lane."""
+        return {
+            name: {
+                "depth": len(lane.pending),
+                "sent": lane.sent,
+                "dropped": lane.dropped,
+                "errors": lane.errors,
+                "max_concurrent": lane.concurrency,
+                "rate": lane.rate,
+                "burst": lane.burst,
+            }
+            for name, lane in self._lanes.items()
+        }
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop all pending calls and stop the lane workers."""
+        for lane in self._lanes.values():
+            lane.pending.clear()
+            if lane.worker:
+                lane.worker.cancel()
+                lane.worker = None
+
+    def _lane_for(self, target_entity: str) -> _Lane:
+        """Return the lane of the integration providing the target entity."""
+        entry = er.async_get(self.hass).async_get(target_entity)
+        integration = entry.platform if entry else target_entity.split(".")[0]
+        if (lane := self._lanes.get(integration)) is None:
+            lane = self._lanes[integration] = _Lane(
+                integration, self._limits.get(integration, {})
+            )
+        return lane
+
+    async def _async_run_lane(self, lane: _Lane) -> None:
+        """Send a lane's pending calls within its limits."""
+        try:
+            while lane.pending:
+                # Calls stay pending (and replaceable) until they may be sent
+                await lane.async_acquire_token()
+                semaphore = lane.semaphore
+                await semaphore.acquire()
+                if not lane.pending:
+                    semaphore.release()
+                    break
+                commands, entities = lane.pop_group()
+                self.hass.async_create_task(
+                    self._async_send(lane, semaphore, commands, entities)
+                )
+        finally:
+            lane.worker = None
+
+    async def _async_send(
+        self,
+        lane: _Lane,
+        semaphore: asyncio.Semaphore,
+        commands: tuple[ServiceCommand, ...],
+        entities: list[UniversalSchedulerSwitch],
+    ) -> None:
+        """Send one group of calls and free its concurrency slot."""
+        try:
+            if await async_send_commands(self.hass, commands, entities):
+                lane.sent += 1
+            else:
+                lane.errors += 1
+        finally:
+            semaphore.release()
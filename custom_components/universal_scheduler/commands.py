@@ -0,0 +1,120 @@
+"""Service commands sent by Universal Scheduler to target entities."""
+
+from __future__ import annotations
+
+import logging
+import math
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from homeassistant.core import HomeAssistant, State
+
+if TYPE_CHECKING:
+    from .switch import UniversalSchedulerSwitch
+
+_LOGGER = logging.getLogger(__name__)
+
+# Service data key -> state attribute reflecting it (None = the state itself)
+STATE_ATTRIBUTES: dict[str, str | None] = {
+    "brightness": "brightness",
+    "color_temp": "color_temp",
+    "color_temp_kelvin": "color_temp_kelvin",
+    "temperature": "temperature",
+    "value": None,
+    "percentage": "percentage",
+    "position": "current_position",
+    "humidity": "humidity",
+    "volume_level": "volume_level",
+}
+
+# Service data keys that do not describe the resulting state
+IGNORED_KEYS = ("transition",)
+
+
+class ServiceCommand(NamedTuple):
+    """A service call to the target entity, without the entity_id.
+
+    The data is stored as a tuple of (key, value) pairs so that commands are
+    hashable and equal whenever they would send the same payload.
+    """
+
+    domain: str
+    service: str
+    data: tuple[tuple[str, Any], ...] = ()
+
+    def service_data(self, entity_id: str | list[str]) -> dict[str, Any]:
+        """Return the service data for the given target entity or entities."""
+        return {"entity_id": entity_id, **dict(self.data)}
+
+
+def target_state_matches(
+    state: State | None, commands: tuple[ServiceCommand, ...]
+) -> bool:
+    """Return True if the target state already reflects the given commands.
+
+    Only the last command is checked, as it carries the final value (e.g.
+    set_percentage after turn_on). Returns False whenever the state cannot
+    be compared.
+    """
+    if state is None or not commands:
+        return False
+
+    command = commands[-1]
+    if command.service == "turn_off":
+        return state.state == "off"
+
+    compared = False
+    for key, value in command.data:
+        if key in IGNORED_KEYS:
+            continue
+        if key not in STATE_ATTRIBUTES:
+            return False
+        attribute = STATE_ATTRIBUTES[key]
+        current = state.state if attribute is None else state.attributes.get(attribute)
+        try:
+            if not math.isclose(float(current), float(value), abs_tol=1e-6):
+                return False
+        except (TypeError, ValueError):
+            return False
+        compared = True
+    return compared
+
+
+async def async_send_commands(
+    hass: HomeAssistant,
+    commands: tuple[ServiceCommand, ...],
+    entities: list[UniversalSchedulerSwitch],
+) -> bool:
+    """Send one sequence of service calls to the targets of many schedulers.
+
+    Schedulers sending identical calls are served by one call per service
+    with a list of target entities (e.g. 40 lights set to the same brightness
+    become one light.turn_on). Each call is awaited until the service has
+    finished, so a failure resets the schedulers and the next evaluation
+    sends again. Returns False if a call failed.
+    """
+    target_ids = list(dict.fromkeys(entity.target_entity for entity in entities))
+    entity_id = target_ids[0] if len(target_ids) == 1 else target_ids
+
+    if len(target_ids) > 1:
+        _LOGGER.debug(
+            "Dispatching %s to %s targets at once",
+            ", ".join(f"{c.domain}.{c.service}" for c in commands),
+            len(target_ids),
+        )
+
+    try:
+        # Calls within a sequence keep their order (e.g. turn_on first)
+        for command in commands:
+            await hass.services.async_call(
+                command.domain,
+                command.service,
+                command.service_data(entity_id),
+                blocking=True,
+            )
+        for entity in entities:
+            entity.metrics.service_calls += len(commands)
+    except Exception as err:  # pylint: disable=broad-except
+        for entity in entities:
+            entity.handle_dispatch_error(err)
+        return False
+    return True
@@ -0,0 +1,193 @@
+"""Scheduler config merging, diffing, import and export for Universal Scheduler."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Any
+
+from .models import DEFAULT_POINTS
+
+# Top-level settings set_schedule_config copies into an existing scheduler
+SCHEDULER_KEYS = (
+    "name",
+    "target_entity",
+    "domain",
+    "update_interval",
+    "enabled",
+    "graphs_per_row",
+    "override_behavior",
+    "override_duration",
+    "check_target_state",
+    "startup_priority",
+    "day_exceptions",
+    "graphs",
+)
+
+# CSV columns, one row per scheduler; list values are JSON encoded
+CSV_COLUMNS = ("entity_id", *SCHEDULER_KEYS)
+CSV_JSON_COLUMNS = ("graphs", "day_exceptions")
+
+
+def merge_config(
+    current: dict[str, Any] | None, data: dict[str, Any]
+) -> dict[str, Any]:
+    """Return the config of a scheduler after applying set_schedule_config data.
+
+    current is the stored config, or None for a new scheduler. It is never
+    modified; the returned config is a new dict.
+    """
+    entity_id = data["entity_id"]
+    if current is not None:
+        config = dict(current)
+        for key in SCHEDULER_KEYS:
+            if key in data:
+                config[key] = data[key]
+        return config
+
+    config = {
+        "name": data.get("name", entity_id),
+        "target_entity": data.get("target_entity", entity_id),
+        "domain": data.get("domain", "light"),
+        "enabled": data.get("enabled", True),
+        "update_interval": data.get("update_interval", 300),
+        "graphs_per_row": data.get("graphs_per_row", 1),
+        "override_behavior": data.get("override_behavior", "none"),
+        "override_duration": data.get("override_duration", 3600),
+        "check_target_state": data.get("check_target_state", False),
+        "day_exceptions": data.get("day_exceptions", []),
+    }
+    # Check if using new multi-graph format or legacy format
+    if "graphs" in data:
+        config["graphs"] = data["graphs"]
+    else:
+        # Legacy format - create with single graph
+        config["graphs"] = [
+            {
+                "id": "graph_1",
+                "label": data.get("graph_label", "Schedule 1"),
+                "weekdays": data.get("weekdays", [0, 1, 2, 3, 4, 5, 6]),
+                "attribute": data.get("attribute"),
+                "mode": data.get("mode", "linear"),
+                "min_y": data.get("min_y", 0),
+                "max_y": data.get("max_y", 100),
+                "x_snap": data.get("x_snap", 0),
+                "y_snap": data.get("y_snap", 0),
+                "step_to_zero": data.get("step_to_zero", False),
+                "x_axis_type": "time",
+                "x_axis_entity": None,
+                "x_axis_min": None,
+                "x_axis_max": None,
+                "x_axis_unit": None,
+                "points": data.get("points", [dict(point) for point in DEFAULT_POINTS]),
+            }
+        ]
+    return config
+
+
+def diff_config(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Return the changes between two configs of a scheduler.
+
+    Settings map to their old and new value; graphs are compared by id.
+    """
+    changes: dict[str, Any] = {}
+    for key in sorted(set(old) | set(new)):
+        if key == "graphs" or old.get(key) == new.get(key):
+            continue
+        changes[key] = {"old": old.get(key), "new": new.get(key)}
+
+    old_graphs = {graph.get("id"): graph for graph in old.get("graphs") or []}
+    new_graphs = {graph.get("id"): graph for graph in new.get("graphs") or []}
+    if old_graphs != new_graphs:
+        changes["graphs"] = {
+            "added": [id_ for id_ in new_graphs if id_ not in old_graphs],
+            "removed": [id_ for id_ in old_graphs if id_ not in new_graphs],
+            "changed": [
+                id_
+                for id_, graph in new_graphs.items()
+                if id_ in old_graphs and old_graphs[id_] != graph
+            ],
+        }
+    return changes
+
+
+def diff_schedulers(
+    current: dict[str, dict[str, Any]], merged: dict[str, dict[str, Any]]
+) -> dict[str, Any]:
+    """Return which of the merged schedulers would be added, updated or unchanged."""
+    diff: dict[str, Any] = {"added": [], "updated": {}, "unchanged": []}
+    for entity_id, config in merged.items():
+        if (old := current.get(entity_id)) is None:
+            diff["added"].append(entity_id)
+        elif changes := diff_config(old, config):
+            diff["updated"][entity_id] = changes
+        else:
+            diff["unchanged"].append(entity_id)
+    return diff
+
+
+def export_csv(schedulers: dict[str, dict[str, Any]]) -> str:
+    """Return scheduler configs as CSV text, one row per scheduler."""
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=CSV_COLUMNS, lineterminator="\n")
+    writer.writeheader()
+    for entity_id, config in schedulers.items():
+        row = {"entity_id": entity_id}
+        for key in SCHEDULER_KEYS:
+            value = config.get(key)
+            if key in CSV_JSON_COLUMNS:
+                value = json.dumps(value if value is not None else [])
+            row[key] = "" if value is None else value
+        writer.writerow(row)
+    return output.getvalue()
+
+
+def parse_import(data: Any, data_format: str | None = None) -> list[dict[str, Any]]:
+    """Return set_schedule_config payloads from exported JSON or CSV.
+
+    data is an export_schedulers response (or its schedulers mapping), a list
+    of payloads, or the text of either format. Raises ValueError on data that
+    cannot be parsed; the payloads themselves still need validating.
+    """
+    if isinstance(data, str):
+        if data_format is None:
+            data_format = "json" if data.lstrip()[:1] in ("{", "[") else "csv"
+        if data_format == "csv":
+            return _parse_csv(data)
+        try:
+            data = json.loads(data)
+        except json.JSONDecodeError as err:
+            raise ValueError(f"Invalid JSON: {err}") from err
+
+    if isinstance(data, dict):
+        if isinstance(data.get("csv"), str):
+            return _parse_csv(data["csv"])
+        data = data.get("schedulers", data)
+    if isinstance(data, dict):
+        return [
+            {**config, "entity_id": entity_id}
+            for entity_id, config in data.items()
+            if isinstance(config, dict)
+        ]
+    if isinstance(data, list) and all(isinstance(item, dict) for item in data):
+        return [dict(item) for item in data]
+    raise ValueError("Expected a mapping or list of scheduler configs")
+
+
+def _parse_csv(text: str) -> list[dict[str, Any]]:
+    """Return set_schedule_config payloads from CSV rows; empty cells are unset."""
+    items = []
+    for line, row in enumerate(csv.DictReader(io.StringIO(text)), start=2):
+        item: dict[str, Any] = {}
+        for key, value in row.items():
+            if key not in CSV_COLUMNS or value is None or value == "":
+                continue
+            if key in CSV_JSON_COLUMNS:
+                try:
+                    value = json.loads(value)
+                except json.JSONDecodeError as err:
+                    raise ValueError(f"Line {line}: invalid JSON in {key}") from err
+            item[key] = value
+        items.append(item)
+    return items
@@ -15,9 +15,16 @@ SERVICE_SET_CONFIG = "set_schedule_config"
 SERVICE_CREATE_SCHEDULER = "create_scheduler"
 SERVICE_DELETE_SCHEDULER = "delete_scheduler"
 SERVICE_APPLY_NOW = "apply_now"
+SERVICE_APPLY_ALL = "apply_all"
+SERVICE_APPLY_BY_AREA = "apply_by_area"
+SERVICE_APPLY_BY_LABEL = "apply_by_label"
 SERVICE_GET_SCHEDULERS = "get_schedulers"
+SERVICE_SET_RATE_LIMIT = "set_rate_limit"
+SERVICE_SET_CONFIG_BULK = "set_schedule_config_bulk"
+SERVICE_EXPORT_SCHEDULERS = "export_schedulers"
+SERVICE_IMPORT_SCHEDULERS = "import_schedulers"
 
-PLATFORMS = ["switch"]
+PLATFORMS = ["switch", "sensor"]
 
 # Interpolation modes
 MODE_LINEAR = "linear"
@@ -31,3 +38,23 @@ DEFAULT_MIN_Y = 0
 DEFAULT_MAX_Y = 100
 DEFAULT_SNAP_MINUTES = 30
 DEFAULT_UPDATE_INTERVAL = 300  # seconds (5 minutes)
+
+# Minimum delay between exact "next change" updates of a scheduler
+MIN_NEXT_CHANGE_DELAY = 1  # seconds
+# Safety ceiling on the wait for the next change, re-sending lost values
+MAX_NEXT_CHANGE_DELAY = 2 * 3600  # seconds
+
+# Per-integration command queue limits
+DEFAULT_RATE_LIMIT_CONCURRENCY = 8  # service call sequences in flight
+DEFAULT_RATE_LIMIT_RATE = 0  # sequences per second, 0 = unlimited
+DEFAULT_RATE_LIMIT_BURST = 1
+
+# First evaluations after Home Assistant started run in batches of this size
+STARTUP_BATCH_SIZE = 25
+STARTUP_BATCH_INTERVAL = 1  # seconds between batches
+
+# Delay before changed scheduler configs are written to storage
+SAVE_DELAY = 10  # seconds
+
+# Dispatcher signal carrying scheduler config deltas to WebSocket subscribers
+SIGNAL_SCHEDULERS_UPDATED = f"{DOMAIN}_schedulers_updated"
@@ -0,0 +1,200 @@
+"""Compiled curve evaluation for Universal Scheduler graphs."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable
+import math
+from typing import TYPE_CHECKING
+
+from .const import MODE_SMOOTH, MODE_STEP
+
+if TYPE_CHECKING:
+    from .models import Point
+
+# Segment kinds
+SEG_CONST = 0  # Hold y1 (vertical segments and step mode)
+SEG_LINEAR = 1
+SEG_SMOOTH = 2
+SEG_HOLD_THEN_MIN = 3  # step_to_zero: hold y1, drop to min at p2
+SEG_LINEAR_FROM_MIN = 4  # step_to_zero: stay at min briefly, then rise
+SEG_SMOOTH_FROM_MIN = 5
+
+# Fraction of a segment that a step_to_zero rise stays at min
+RISE_DELAY_RATIO = 0.01
+
+
+class CompiledCurve:
+    """A graph's points sorted and normalized once for fast evaluation.
+
+    Values are stored as ratios (0.0 to 1.0) of the graph's min/max range and
+    each segment carries its interpolation kind, so evaluating the curve is a
+    bisect on the x array plus a few arithmetic operations.
+    """
+
+    __slots__ = ("min_y", "max_y", "xs", "ys", "kinds", "inv_dx", "_tail")
+
+    def __init__(
+        self,
+        points: Iterable[Point],
+        mode: str,
+        min_y: float,
+        max_y: float,
+        step_to_min: bool = False,
+    ) -> None:
+        """Compile the given points for the given interpolation settings."""
+        self.min_y = float(min_y)
+        self.max_y = float(max_y)
+        span = self.max_y - self.min_y
+
+        pairs = sorted(
+            ((p.x, p.y) for p in points),
+            key=lambda p: p[0],
+        )
+        self.xs = [x for x, _ in pairs]
+        self.ys = [(y - self.min_y) / span if span else 0.0 for _, y in pairs]
+
+        # Segment i spans xs[i]..xs[i + 1]
+        self.kinds = []
+        self.inv_dx = []
+        for i in range(len(pairs) - 1):
+            (x1, y1), (x2, y2) = pairs[i], pairs[i + 1]
+            if x1 == x2:
+                self.kinds.append(SEG_CONST)
+                self.inv_dx.append(0.0)
+                continue
+
+            self.inv_dx.append(1.0 / (x2 - x1))
+            if mode == MODE_STEP:
+                kind = SEG_CONST
+            elif step_to_min and span and y2 <= self.min_y:
+                kind = SEG_HOLD_THEN_MIN
+            elif step_to_min and span and y1 <= self.min_y:
+                kind = (
+                    SEG_SMOOTH_FROM_MIN if mode == MODE_SMOOTH else SEG_LINEAR_FROM_MIN
+                )
+            else:
+                kind = SEG_SMOOTH if mode == MODE_SMOOTH else SEG_LINEAR
+            self.kinds.append(kind)
+
+        # Value held before the first and after the last point (wraps midnight)
+        self._tail = self.ys[-1] if len(pairs) >= 2 else 0.0
+
+    def __len__(self) -> int:
+        """Return the number of points in the curve."""
+        return len(self.xs)
+
+    def segment_index(self, x: float) -> int:
+        """Return the index of the segment containing x.
+
+        Returns -1 before the first point and the number of segments after the
+        last point. When x sits exactly on a point, the earlier segment wins.
+        """
+        xs = self.xs
+        i = bisect_left(xs, x)
+        if i == 0:
+            return 0 if xs and x == xs[0] else -1
+        return i - 1 if i < len(xs) else len(xs) - 1
+
+    def ratio_at(self, x: float) -> float:
+        """Return the Y ratio (0.0 to 1.0) of the curve at x."""
+        xs = self.xs
+        if len(xs) < 2:
+            return 0.0
+
+        i = self.segment_index(x)
+        if i < 0 or i >= len(xs) - 1:
+            return self._tail
+        return self._segment_ratio(i, x)
+
+    def value_at(self, x: float) -> float:
+        """Return the actual Y value of the curve at x."""
+        return self.min_y + self.ratio_at(x) * (self.max_y - self.min_y)
+
+    def _segment_ratio(self, i: int, x: float) -> float:
+        """Evaluate segment i at x (x must lie within the segment)."""
+        kind = self.kinds[i]
+        y1 = self.ys[i]
+        if kind == SEG_CONST:
+            # Step changes happen immediately when reaching p2
+            if x >= self.xs[i + 1] and self.inv_dx[i]:
+                return self.ys[i + 1]
+            return y1
+
+        if kind == SEG_HOLD_THEN_MIN:
+            return 0.0 if x >= self.xs[i + 1] else y1
+
+        t = (x - self.xs[i]) * self.inv_dx[i]
+        if kind >= SEG_LINEAR_FROM_MIN and t < RISE_DELAY_RATIO:
+            return 0.0
+
+        dy = self.ys[i + 1] - y1
+        if kind in (SEG_SMOOTH, SEG_SMOOTH_FROM_MIN):
+            # Cosine interpolation for smooth curves
+            return y1 + dy * (1 - math.cos(t * math.pi)) / 2
+        return y1 + dy * t
+
+    def next_change_x(
+        self, x: float, step: float | None = None, round_half: bool = False
+    ) -> float | None:
+        """Return the next x after x at which the quantized output changes.
+
+        step is the output quantum in Y units (e.g. 0.1 for a temperature that
+        is rounded to one decimal) and round_half selects rounding instead of
+        truncation. Without a step only the points themselves are change
+        points. Returns None if the curve stays constant after x.
+        """
+        xs = self.xs
+        if len(xs) < 2:
+            return None
+
+        start = self.segment_index(x)
+        if start < 0:
+            return xs[0]
+
+        for i in range(start, len(xs) - 1):
+            x2 = xs[i + 1]
+            if x2 <= x:
+                continue
+            if step:
+                crossing = self._next_crossing(i, x, step, round_half)
+                if crossing is not None:
+                    return crossing
+            return x2
+        return None
+
+    def _next_crossing(
+        self, i: int, x: float, step: float, round_half: bool
+    ) -> float | None:
+        """Return where segment i next crosses a quantization boundary after x.
+
+        Returns None if the segment is flat or ends before the next boundary.
+        """
+        kind = self.kinds[i]
+        if kind in (SEG_CONST, SEG_HOLD_THEN_MIN):
+            return None
+
+        x1 = self.xs[i]
+        inv_dx = self.inv_dx[i]
+        if kind >= SEG_LINEAR_FROM_MIN and (x - x1) * inv_dx < RISE_DELAY_RATIO:
+            return x1 + RISE_DELAY_RATIO / inv_dx
+
+        y1 = self.ys[i]
+        dy = self.ys[i + 1] - y1
+        if not dy:
+            return None
+
+        span = self.max_y - self.min_y
+        level = (self.min_y + self._segment_ratio(i, x) * span) / step
+        if round_half:
+            boundary = math.floor(level + 0.5) + (0.5 if dy > 0 else -0.5)
+        else:
+            boundary = math.floor(level) + (1 if dy > 0 else 0)
+
+        # Fraction of the segment's Y range at which the boundary is reached
+        u = ((boundary * step - self.min_y) / span - y1) / dy
+        if not 0.0 <= u <= 1.0:
+            return None
+        if kind in (SEG_SMOOTH, SEG_SMOOTH_FROM_MIN):
+            u = math.acos(1 - 2 * u) / math.pi
+        return x1 + u / inv_dx
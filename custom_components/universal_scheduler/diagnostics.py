@@ -0,0 +1,49 @@
+"""Diagnostics support for Universal Scheduler."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .metrics import async_aggregate_metrics
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for the config entry."""
+    domain_data = hass.data[DOMAIN]
+
+    schedulers = {}
+    for entity_id, entity in domain_data.get("switch_entities", {}).items():
+        config = domain_data["schedulers"].get(entity_id, {})
+        schedulers[entity_id] = {
+            "enabled": entity.is_on,
+            "domain": config.get("domain"),
+            "update_interval": config.get("update_interval"),
+            # Point counts instead of the points themselves keep this readable
+            "graphs": [
+                {
+                    "mode": graph.get("mode"),
+                    "weekdays": graph.get("weekdays"),
+                    "x_axis_type": graph.get("x_axis_type", "time"),
+                    "points": len(graph.get("points", [])),
+                }
+                for graph in config.get("graphs", [])
+            ],
+            "next_update_at": (
+                entity.next_update_at.isoformat() if entity.next_update_at else None
+            ),
+            "metrics": entity.metrics.as_dict(),
+        }
+
+    queue = domain_data.get("command_queue")
+    return {
+        "metrics": async_aggregate_metrics(hass),
+        "queue": queue.async_lane_stats() if queue else {},
+        "rate_limits": domain_data.get("rate_limits", {}),
+        "schedulers": schedulers,
+    }
@@ -0,0 +1,258 @@
+"""Integration-wide tick dispatcher for Universal Scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from functools import partial
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.start import async_at_started
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, STARTUP_BATCH_INTERVAL, STARTUP_BATCH_SIZE
+
+if TYPE_CHECKING:
+    from .switch import UniversalSchedulerSwitch
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def next_aligned_time(now: datetime, interval_seconds: int) -> datetime:
+    """Return the next time slot aligned to clock boundaries.
+
+    e.g., if interval is 30s and current time is 19:00:17, next slot is 19:00:30
+    """
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    seconds_since_midnight = (now - midnight).total_seconds()
+
+    current_slot = int(seconds_since_midnight / interval_seconds)
+    next_slot_seconds = (current_slot + 1) * interval_seconds
+
+    # Handle day rollover
+    if next_slot_seconds >= 86400:
+        next_slot_seconds = 0
+        midnight = midnight + timedelta(days=1)
+
+    return midnight + timedelta(seconds=next_slot_seconds)
+
+
+class TickDispatcher:
+    """Drive scheduler updates from shared timers.
+
+    Schedulers either subscribe with their update interval, landing in a
+    bucket per interval that fires at clock-aligned slots, or schedule a
+    one-off update at the exact time their output next changes, landing in a
+    bucket per instant. Each bucket has a single timer and is evaluated in a
+    single task instead of one timer and task per scheduler.
+
+    Schedulers added while Home Assistant is starting are held back and
+    started once it is running, in batches ordered by their priority.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher."""
+        self.hass = hass
+        self._buckets: dict[int, set[UniversalSchedulerSwitch]] = {}
+        self._timers: dict[int, CALLBACK_TYPE] = {}
+        self._instants: dict[datetime, set[UniversalSchedulerSwitch]] = {}
+        self._instant_timers: dict[datetime, CALLBACK_TYPE] = {}
+        self._deferred: list[UniversalSchedulerSwitch] = []
+        self._remove_started: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self, interval: int, entity: UniversalSchedulerSwitch
+    ) -> CALLBACK_TYPE:
+        """Add a scheduler to the bucket for its interval.
+
+        Returns a callback that removes the scheduler again.
+        """
+        bucket = self._buckets.setdefault(interval, set())
+        bucket.add(entity)
+        if interval not in self._timers:
+            self._schedule(interval)
+
+        @callback
+        def unsubscribe() -> None:
+            """Remove the scheduler and drop the timer of an empty bucket."""
+            bucket.discard(entity)
+            if not bucket and self._buckets.get(interval) is bucket:
+                del self._buckets[interval]
+                if remove_timer := self._timers.pop(interval, None):
+                    remove_timer()
+
+        return unsubscribe
+
+    @callback
+    def async_schedule(
+        self, when: datetime, entity: UniversalSchedulerSwitch
+    ) -> CALLBACK_TYPE:
+        """Update a scheduler once at the given time.
+
+        Schedulers due at the same instant share one timer. Returns a callback
+        that cancels the update.
+        """
+        bucket = self._instants.get(when)
+        if bucket is None:
+            bucket = self._instants[when] = set()
+            self._instant_timers[when] = async_track_point_in_time(
+                self.hass, partial(self._handle_instant, when), when
+            )
+        bucket.add(entity)
+
+        @callback
+        def cancel() -> None:
+            """Remove the scheduler and drop the timer of an empty bucket."""
+            bucket.discard(entity)
+            if not bucket and self._instants.get(when) is bucket:
+                del self._instants[when]
+                self._instant_timers.pop(when)()
+
+        return cancel
+
+    @callback
+    def async_defer_start(self, entity: UniversalSchedulerSwitch) -> None:
+        """Start a scheduler's updates once Home Assistant has started."""
+        if entity not in self._deferred:
+            self._deferred.append(entity)
+        if self._remove_started is None:
+            self._remove_started = async_at_started(
+                self.hass, self._async_startup_sweep
+            )
+
+    @callback
+    def async_cancel_start(self, entity: UniversalSchedulerSwitch) -> None:
+        """Forget a scheduler waiting for its deferred start."""
+        if entity in self._deferred:
+            self._deferred.remove(entity)
+
+    @callback
+    def async_evaluate_now(self, entities: list[UniversalSchedulerSwitch]) -> None:
+        """Evaluate the given schedulers right away in one pass."""
+        self.hass.async_create_task(
+            self._async_evaluate_bucket(entities, dt_util.now())
+        )
+
+    async def async_apply(self, entities: list[UniversalSchedulerSwitch]) -> None:
+        """Evaluate the given schedulers now and send their values even if unchanged."""
+        await self._async_evaluate_bucket(entities, dt_util.now(), force=True)
+
+    @callback
+    def async_stats(self) -> dict[str, int]:
+        """Return the number of armed timers and the schedulers waiting on them."""
+        return {
+            "interval_timers": len(self._timers),
+            "interval_schedulers": sum(len(b) for b in self._buckets.values()),
+            "instant_timers": len(self._instant_timers),
+            "instant_schedulers": sum(len(b) for b in self._instants.values()),
+            "deferred_schedulers": len(self._deferred),
+        }
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel all timers and forget all subscribed schedulers."""
+        if self._remove_started:
+            self._remove_started()
+            self._remove_started = None
+        self._deferred.clear()
+        for remove_timer in (*self._timers.values(), *self._instant_timers.values()):
+            remove_timer()
+        self._timers.clear()
+        self._buckets.clear()
+        self._instant_timers.clear()
+        self._instants.clear()
+
+    def _schedule(self, interval: int) -> None:
+        """Arm the timer for the next aligned slot of an interval."""
+        next_update_time = next_aligned_time(dt_util.now(), interval)
+
+        _LOGGER.debug(
+            "Scheduling next tick for %s scheduler(s) at %s (interval=%ss)",
+            len(self._buckets[interval]),
+            next_update_time.isoformat(),
+            interval,
+        )
+
+        self._timers[interval] = async_track_point_in_time(
+            self.hass, partial(self._handle_tick, interval), next_update_time
+        )
+
+    @callback
+    def _handle_tick(self, interval: int, now: datetime) -> None:
+        """Handle an aligned slot and schedule the next one."""
+        if not self._buckets.get(interval):
+            self._timers.pop(interval, None)
+            return
+
+        # Schedule the next tick first
+        self._schedule(interval)
+
+        # Then evaluate the whole bucket in one task
+        self.hass.async_create_task(
+            self._async_evaluate_bucket(list(self._buckets[interval]), now)
+        )
+
+    @callback
+    def _handle_instant(self, when: datetime, now: datetime) -> None:
+        """Handle a one-off update time."""
+        self._instant_timers.pop(when, None)
+        if entities := self._instants.pop(when, None):
+            self.hass.async_create_task(
+                self._async_evaluate_bucket(list(entities), now)
+            )
+
+    async def _async_startup_sweep(self, hass: HomeAssistant) -> None:
+        """Start the deferred schedulers, highest priority first, in batches.
+
+        Each batch's service calls are queued together. The pause between
+        batches leaves room for integrations still settling after startup.
+        """
+        self._remove_started = None
+        self._deferred.sort(key=lambda entity: -entity.startup_priority)
+        _LOGGER.debug("Starting %s deferred scheduler(s)", len(self._deferred))
+
+        while self._deferred:
+            entities = self._deferred[:STARTUP_BATCH_SIZE]
+            del self._deferred[:STARTUP_BATCH_SIZE]
+            batch: list = []
+            for entity in entities:
+                try:
+                    await entity._start_update_listener(batch=batch)
+                except Exception:  # pylint: disable=broad-except
+                    entity.metrics.errors += 1
+                    _LOGGER.exception("Error starting scheduler %s", entity.entity_id)
+            if batch:
+                self.hass.data[DOMAIN]["command_queue"].async_enqueue(batch)
+            if self._deferred:
+                await asyncio.sleep(STARTUP_BATCH_INTERVAL)
+
+    async def _async_evaluate_bucket(
+        self,
+        entities: list[UniversalSchedulerSwitch],
+        now: datetime,
+        force: bool = False,
+    ) -> None:
+        """Evaluate every scheduler of a bucket in one pass.
+
+        The resulting service calls are collected first and then queued
+        together, so identical calls are merged across schedulers. now is
+        the time the evaluation was due, so each scheduler records how late
+        its evaluation actually started. force sends unchanged values too.
+        """
+        batch: list = []
+        for entity in entities:
+            entity.metrics.record_lag(
+                max(0.0, (dt_util.utcnow() - now).total_seconds())
+            )
+            try:
+                await entity._update_entity(now, force=force, batch=batch)
+            except Exception:  # pylint: disable=broad-except
+                entity.metrics.errors += 1
+                _LOGGER.exception("Error evaluating scheduler %s", entity.entity_id)
+
+        if batch:
+            self.hass.data[DOMAIN]["command_queue"].async_enqueue(batch)
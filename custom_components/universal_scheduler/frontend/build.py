@@ -2,16 +2,62 @@
 """
 Universal Scheduler - Build/Bundle Script (Python version)
 
-This script concatenates all module files into a single panel.js and card.js
+This script concatenates the module files into ES module chunks: core.js with
+the code shared by the panel and the card, panel.js, card.js, and card-editor.js
+with the card's editing code. It then writes minified, precompressed copies
+with content-hashed names to dist/
 Run with: python build.py
 """
 
+import glob
+import gzip
+import hashlib
+import json
 import re
 import os
 
+try:
+    import brotli
+except ImportError:  # Brotli copies are optional, gzip is always written
+    brotli = None
+
 frontend_dir = os.path.dirname(os.path.abspath(__file__))
-output_file = os.path.join(frontend_dir, "panel.js")
-card_output_file = os.path.join(frontend_dir, "card.js")
+dist_dir = os.path.join(frontend_dir, "dist")
+
+# Chunks and the source modules bundled into each, in dependency order.
+# The panel and the card both import core.js, so a page showing both loads
+# and parses it once. card.js imports card-editor.js only when a card needs
+# editing, so read-only cards never load it.
+CHUNKS = {
+    "core.js": ("Shared Core", ["utils.js"]),
+    "card-editor.js": ("Lovelace Card Editing", ["lovelace-card-editor.js"]),
+    "card.js": ("Lovelace Card", ["lovelace-card.js"]),
+    "panel.js": (
+        "Panel",
+        [
+            "styles.js",
+            "templates.js",
+            "attribute-config.js",
+            "graph.js",
+            "services.js",
+            "panel-modular.js",
+        ],
+    ),
+}
+SECTION_NAMES = {
+    "styles.js": "STYLES",
+    "templates.js": "TEMPLATES",
+    "utils.js": "UTILITIES",
+    "attribute-config.js": "ATTRIBUTE CONFIG",
+    "graph.js": "GRAPH HANDLER",
+    "services.js": "SERVICES",
+    "panel-modular.js": "MAIN PANEL",
+    "lovelace-card.js": "LOVELACE CARD",
+    "lovelace-card-editor.js": "LOVELACE CARD EDITING",
+}
+CHUNK_OF = {
+    module: chunk for chunk, (_, modules) in CHUNKS.items() for module in modules
+}
 
 
 def read_file(filename):
@@ -19,16 +65,39 @@ def read_file(filename):
         return f.read()
 
 
-def strip_module_syntax(content, name):
-    """Strip ES module syntax from content."""
+def export_names(content):
+    """Return the names a module exports."""
+    names = re.findall(
+        r"^export\s+(?:async\s+)?(?:const|let|var|function|class)\s+(\w+)",
+        content,
+        flags=re.MULTILINE,
+    )
+    for match in re.finditer(r"^export\s*\{([^}]*)\}", content, re.MULTILINE):
+        names.extend(
+            part.split()[-1] for part in match.group(1).split(",") if part.strip()
+        )
+    return names
+
+
+def strip_module_syntax(content, name, chunk, imports):
+    """Strip ES module syntax from content.
+
+    Imports from modules bundled into other chunks are added to imports, a
+    mapping of chunk to imported names, and dynamic imports of modules are
+    pointed at their chunk.
+    """
     alias_declarations = []
 
     # Match imports like: import { foo as bar } from './module.js'
-    import_regex = r'^import\s*\{([^}]+)\}\s*from\s*[\'"][^\'"]+[\'"]\s*;?\s*$'
+    import_regex = r'^import\s*\{([^}]+)\}\s*from\s*[\'"]\./([^\'"]+)[\'"]\s*;?\s*$'
     for match in re.finditer(import_regex, content, re.MULTILINE):
-        imports = match.group(1)
-        for part in imports.split(","):
+        source_chunk = CHUNK_OF[match.group(2)]
+        for part in match.group(1).split(","):
             trimmed = part.strip()
+            if source_chunk != chunk:
+                if trimmed:
+                    imports.setdefault(source_chunk, set()).add(trimmed)
+                continue
             as_match = re.match(r"^(\w+)\s+as\s+(\w+)$", trimmed)
             if as_match:
                 original_name = as_match.group(1)
@@ -62,6 +131,12 @@ def strip_module_syntax(content, name):
         flags=re.MULTILINE,
     )
 
+    content = re.sub(
+        r"""import\((['"])\./([^'"]+)\1\)""",
+        lambda match: f"import({match.group(1)}./{CHUNK_OF[match.group(2)]}{match.group(1)})",
+        content,
+    )
+
     alias_code = ""
     if alias_declarations:
         alias_code = "// Import aliases\n" + "\n".join(alias_declarations) + "\n\n"
@@ -69,86 +144,263 @@ def strip_module_syntax(content, name):
     return f"// === {name} ===\n{alias_code}{content}\n"
 
 
-# Read all module files
-style_content = read_file("styles.js")
-template_content = read_file("templates.js")
-utils_content = read_file("utils.js")
-attribute_config_content = read_file("attribute-config.js")
-graph_content = read_file("graph.js")
-services_content = read_file("services.js")
-panel_content = read_file("panel-modular.js")
-
-# Build the bundled file
-bundled = f"""/**
- * Universal Scheduler Panel (Bundled)
- * Multi-entity scheduler with curve interpolation
+WORD_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$"
+)
+# Tokens after which a / starts a regular expression instead of a division
+REGEX_KEYWORDS = frozenset(
+    (
+        "return",
+        "typeof",
+        "instanceof",
+        "in",
+        "of",
+        "new",
+        "delete",
+        "void",
+        "throw",
+        "case",
+        "do",
+        "else",
+        "yield",
+        "await",
+    )
+)
+# A line break next to these characters never ends a statement
+JOINS_AFTER = frozenset("{([,;:=<>!&|?*%^~")
+JOINS_BEFORE = frozenset(")]},;.?:=")
+
+
+def skip_string(content, i):
+    """Return the index after the quoted string starting at i."""
+    quote = content[i]
+    i += 1
+    while content[i] != quote:
+        i += 2 if content[i] == "\\" else 1
+    return i + 1
+
+
+def skip_template(content, i):
+    """Return the index after the template literal starting at i."""
+    i += 1
+    while content[i] != "`":
+        if content[i] == "\\":
+            i += 2
+        elif content.startswith("${", i):
+            i = skip_expression(content, i + 2)
+        else:
+            i += 1
+    return i + 1
+
+
+def skip_expression(content, i):
+    """Return the index after the } closing a template expression at i."""
+    depth = 0
+    while True:
+        char = content[i]
+        if char in "'\"":
+            i = skip_string(content, i)
+            continue
+        if char == "`":
+            i = skip_template(content, i)
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            if not depth:
+                return i + 1
+            depth -= 1
+        i += 1
+
+
+def skip_regex(content, i):
+    """Return the index after the regular expression literal starting at i."""
+    i += 1
+    in_class = False
+    while in_class or content[i] != "/":
+        if content[i] == "\\":
+            i += 1
+        elif content[i] == "[":
+            in_class = True
+        elif content[i] == "]":
+            in_class = False
+        i += 1
+    i += 1
+    while i < len(content) and content[i] in WORD_CHARS:
+        i += 1
+    return i
+
+
+def needs_space(prev, next_):
+    """Return whether two tokens would merge into one without a space."""
+    a, b = prev[-1], next_[0]
+    if a in WORD_CHARS and b in WORD_CHARS:
+        return True
+    if a.isdigit() and b == ".":
+        return True
+    return (a + b) in ("++", "--", "//", "/*", "<!", "->")
+
+
+def minify_js(content):
+    """Remove comments and redundant whitespace from JavaScript.
+
+    Strings, template literals and regular expressions are copied unchanged.
+    A line break is kept wherever it could end a statement, so automatic
+    semicolon insertion behaves the same as in the source.
+    """
+    out = []
+    last = ""  # Last token written
+    gap = ""  # Whitespace seen since, "\n" if it spanned lines
+    i = 0
+    length = len(content)
+    while i < length:
+        char = content[i]
+        if char in " \t\r\n":
+            if char == "\n":
+                gap = "\n"
+            elif not gap:
+                gap = " "
+            i += 1
+            continue
+        if content.startswith("//", i):
+            end = content.find("\n", i)
+            i = length if end == -1 else end
+            continue
+        if content.startswith("/*", i):
+            end = content.index("*/", i + 2) + 2
+            if "\n" in content[i:end]:
+                gap = "\n"
+            elif not gap:
+                gap = " "
+            i = end
+            continue
+
+        if char in "'\"":
+            end = skip_string(content, i)
+        elif char == "`":
+            end = skip_template(content, i)
+        elif char == "/" and (
+            not last or last in REGEX_KEYWORDS or last[-1] in "(,=:[!&|?{};+-*%<>~^"
+        ):
+            end = skip_regex(content, i)
+        elif char in WORD_CHARS:
+            end = i + 1
+            while end < length and content[end] in WORD_CHARS:
+                end += 1
+        else:
+            end = i + 1
+        token = content[i:end]
+
+        if last and gap:
+            if gap == "\n" and not (
+                last[-1] in JOINS_AFTER or token[0] in JOINS_BEFORE
+            ):
+                out.append("\n")
+            elif needs_space(last, token):
+                out.append(" ")
+        out.append(token)
+        last = token
+        gap = ""
+        i = end
+    return "".join(out) + "\n"
+
+
+def write_dist(name, content):
+    """Write a minified bundle to dist/ under a content-hashed name.
+
+    A gzip (and, if brotli is installed, brotli) copy is written next to it,
+    for the web server to send to clients accepting those encodings.
+    Returns the file name.
+    """
+    data = minify_js(content).encode("utf-8")
+    stem, ext = os.path.splitext(name)
+    filename = f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+    path = os.path.join(dist_dir, filename)
+
+    # Bundles of earlier builds are never requested again
+    for old in glob.glob(os.path.join(dist_dir, f"{stem}.*{ext}*")):
+        os.remove(old)
+
+    with open(path, "wb") as f:
+        f.write(data)
+    with open(path + ".gz", "wb") as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(path + ".br", "wb") as f:
+            f.write(brotli.compress(data))
+    return filename
+
+
+def bundle_chunk(chunk):
+    """Return the bundled ES module of a chunk."""
+    title, modules = CHUNKS[chunk]
+    imports = {}
+    exports = []
+    sections = []
+    for module in modules:
+        content = read_file(module)
+        exports.extend(export_names(content))
+        sections.append(
+            strip_module_syntax(content, SECTION_NAMES[module], chunk, imports)
+        )
+
+    import_code = "".join(
+        f"import {{ {', '.join(sorted(names))} }} from './{source}';\n"
+        for source, names in imports.items()
+    )
+    export_code = f"export {{ {', '.join(exports)} }};\n" if exports else ""
+    source_list = "\n".join(f" * - {module}" for module in modules)
+    body = "\n".join(sections)
+    return f"""/**
+ * Universal Scheduler {title} (Bundled)
  *
  * Auto-generated from modular source files
  * Do not edit directly - edit the source modules instead:
- * - styles.js
- * - templates.js
- * - utils.js
- * - attribute-config.js
- * - graph.js
- * - services.js
- * - panel-modular.js
+{source_list}
  *
  * Then run: python build.py
  */
 
-(function() {{
-'use strict';
-
-{strip_module_syntax(style_content, "STYLES")}
-
-{strip_module_syntax(template_content, "TEMPLATES")}
-
-{strip_module_syntax(utils_content, "UTILITIES")}
-
-{strip_module_syntax(attribute_config_content, "ATTRIBUTE CONFIG")}
-
-{strip_module_syntax(graph_content, "GRAPH HANDLER")}
-
-{strip_module_syntax(services_content, "SERVICES")}
+{import_code}
+{body}
+{export_code}"""
 
-{strip_module_syntax(panel_content, "MAIN PANEL")}
 
-}})();
-"""
-
-with open(output_file, "w") as f:
-    f.write(bundled)
-
-size_kb = os.path.getsize(output_file) / 1024
-print(f"Bundled panel.js created ({size_kb:.1f} KB)")
-
-# Build Lovelace card separately
-card_content = read_file("lovelace-card.js")
-
-card_bundled = f"""/**
- * Universal Scheduler Lovelace Card (Bundled)
- * A card to display and edit scheduler graphs
- *
- * Auto-generated from modular source files
- * Do not edit directly - edit lovelace-card.js instead
- *
- * Then run: python build.py
- */
-
-(function() {{
-'use strict';
-
-{strip_module_syntax(style_content, "STYLES")}
-
-{strip_module_syntax(utils_content, "UTILITIES")}
-
-{strip_module_syntax(card_content, "LOVELACE CARD")}
-
-}})();
-"""
+def link(content, filenames):
+    """Point the imports of a bundle at the hashed names of other chunks."""
+    return re.sub(
+        r"""(from\s*|import\()(['"])\./([^'"]+)\2""",
+        lambda match: (
+            f"{match.group(1)}{match.group(2)}./"
+            f"{filenames.get(match.group(3), match.group(3))}{match.group(2)}"
+        ),
+        content,
+    )
 
-with open(card_output_file, "w") as f:
-    f.write(card_bundled)
 
-card_size_kb = os.path.getsize(card_output_file) / 1024
-print(f"Bundled card.js created ({card_size_kb:.1f} KB)")
+# Build the minified, content-hashed bundles served in production
+os.makedirs(dist_dir, exist_ok=True)
+manifest = {}
+for chunk in CHUNKS:
+    bundled = bundle_chunk(chunk)
+    with open(os.path.join(frontend_dir, chunk), "w") as f:
+        f.write(bundled)
+    size_kb = os.path.getsize(os.path.join(frontend_dir, chunk)) / 1024
+    print(f"Bundled {chunk} created ({size_kb:.1f} KB)")
+
+    # Chunks come after the chunks they import, whose hashed names are known
+    manifest[chunk] = write_dist(chunk, link(bundled, manifest))
+
+with open(os.path.join(dist_dir, "manifest.json"), "w") as f:
+    json.dump(manifest, f, indent=2)
+    f.write("\n")
+
+for name, filename in manifest.items():
+    path = os.path.join(dist_dir, filename)
+    raw_kb = os.path.getsize(path) / 1024
+    gz_kb = os.path.getsize(path + ".gz") / 1024
+    print(
+        f"Minified {name} created as dist/{filename} ({raw_kb:.1f} KB, {gz_kb:.1f} KB gzip)"
+    )
+if brotli is None:
+    print("brotli is not installed, skipped the .br copies")
@@ -0,0 +1,523 @@
+import{currentMinute,getNumericAttributes,minuteTicker,sharedSchedulers,timeGraphKey}from'./core.eaac800f1a8d.js';const CARD_STYLES=`
+    :host {
+        --card-padding: 16px;
+    }
+
+    .scheduler-card-container {
+        padding: var(--card-padding);
+    }
+
+    .scheduler-card-header {
+        display: flex;
+        align-items: center;
+        gap: 10px;
+        margin-bottom: 12px;
+    }
+
+    .scheduler-card-header .entity-icon {
+        color: var(--primary-color);
+    }
+
+    .scheduler-card-header .title {
+        flex: 1;
+        font-size: 1.1rem;
+        font-weight: 500;
+    }
+
+    .scheduler-card-header .state {
+        font-size: 0.85rem;
+        padding: 4px 10px;
+        border-radius: 12px;
+        background: rgba(var(--rgb-disabled-color, 158, 158, 158), 0.2);
+        color: var(--disabled-text-color, #9e9e9e);
+    }
+
+    .scheduler-card-header .state.active {
+        background: rgba(var(--rgb-success-color, 76, 175, 80), 0.2);
+        color: var(--success-color, #4caf50);
+    }
+
+    .scheduler-card-header .header-toggle {
+        flex-shrink: 0;
+    }
+
+    .graph-selector {
+        display: flex;
+        gap: 8px;
+        margin-bottom: 12px;
+        flex-wrap: wrap;
+    }
+
+    .graph-selector-btn {
+        padding: 6px 12px;
+        border-radius: 16px;
+        border: 1px solid var(--divider-color);
+        background: var(--secondary-background-color);
+        color: var(--primary-text-color);
+        font-size: 0.85rem;
+        cursor: pointer;
+        transition: all 0.2s;
+    }
+
+    .graph-selector-btn:hover {
+        border-color: var(--primary-color);
+    }
+
+    .graph-selector-btn.active {
+        background: var(--primary-color, #03a9f4);
+        color: white;
+        border-color: var(--primary-color, #03a9f4);
+    }
+
+    .card-graph-wrapper {
+        position: relative;
+        display: flex;
+        height: var(--graph-height, 200px);
+        margin-bottom: 10px;
+        padding-top: 20px; /* Space for NOW label */
+    }
+
+    .card-graph-y-axis {
+        width: 45px;
+        display: flex;
+        flex-direction: column;
+        justify-content: space-between;
+        padding: 5px 5px 20px 0;
+        font-size: 0.7rem;
+        text-align: right;
+        opacity: 0.7;
+        flex-shrink: 0;
+    }
+
+    .card-graph-container {
+        flex: 1;
+        position: relative;
+        background: var(--secondary-background-color, var(--card-background-color, #fafafa));
+        border-radius: 8px;
+        overflow: visible;
+    }
+
+    .card-graph-x-axis {
+        height: 20px;
+        display: flex;
+        justify-content: space-between;
+        padding: 4px 0 0 45px;
+        font-size: 0.7rem;
+        opacity: 0.7;
+    }
+
+    /* Reuse graph styles from panel */
+    .grid-lines {
+        position: absolute;
+        top: 0;
+        left: 0;
+        right: 0;
+        bottom: 0;
+        pointer-events: none;
+    }
+
+    .grid-lines::before {
+        content: '';
+        position: absolute;
+        top: 0;
+        left: 0;
+        right: 0;
+        bottom: 0;
+        background-image:
+            linear-gradient(to right, var(--divider-color, rgba(0,0,0,0.12)) 1px, transparent 1px),
+            linear-gradient(to bottom, var(--divider-color, rgba(0,0,0,0.12)) 1px, transparent 1px);
+        background-size: 25% 25%;
+        opacity: 0.3;
+    }
+
+    .curve-svg {
+        position: absolute;
+        top: 0;
+        left: 0;
+        width: 100%;
+        height: 100%;
+        pointer-events: none;
+    }
+
+    .curve-line {
+        fill: none;
+        stroke: var(--primary-color, #03a9f4);
+        stroke-width: 2;
+    }
+
+    .fill-area {
+        fill: rgba(var(--rgb-primary-color, 3, 169, 244), 0.15);
+        stroke: none;
+    }
+
+    .point {
+        position: absolute;
+        width: 14px;
+        height: 14px;
+        background: var(--primary-color, #03a9f4);
+        border: 2px solid var(--card-background-color, #fff);
+        border-radius: 50%;
+        cursor: grab;
+        transform: translate(-50%, -50%);
+        z-index: 10;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.2);
+        transition: transform 0.1s;
+    }
+
+    .point:hover {
+        transform: translate(-50%, -50%) scale(1.2);
+    }
+
+    .point.dragging {
+        cursor: grabbing;
+        transform: translate(-50%, -50%) scale(1.3);
+        z-index: 11;
+    }
+
+    /* Current time marker - matches panel styles */
+    .current-time-marker {
+        position: absolute;
+        top: 0;
+        bottom: 0;
+        width: 2px;
+        background: var(--error-color, #db4437);
+        z-index: 5;
+        pointer-events: none;
+    }
+
+    .current-time-marker::before {
+        content: 'NOW';
+        position: absolute;
+        top: -18px;
+        left: 50%;
+        transform: translateX(-50%);
+        font-size: 0.6rem;
+        font-weight: 600;
+        color: var(--error-color, #db4437);
+        white-space: nowrap;
+    }
+
+    .current-value-row {
+        display: flex;
+        align-items: center;
+        gap: 10px;
+        padding: 8px 12px;
+        background: rgba(var(--rgb-primary-color), 0.1);
+        border-radius: 6px;
+        font-size: 0.85rem;
+        margin-bottom: 10px;
+    }
+
+    .current-value-row .label {
+        opacity: 0.7;
+    }
+
+    .current-value-row .value {
+        font-weight: 600;
+        color: var(--primary-color, #03a9f4);
+    }
+
+    .current-value-row button {
+        margin-left: auto;
+        padding: 4px 10px;
+        border-radius: 4px;
+        border: 1px solid var(--divider-color, rgba(0,0,0,0.12));
+        background: var(--secondary-background-color, var(--card-background-color, #fafafa));
+        color: var(--primary-text-color, #212121);
+        font-size: 0.8rem;
+        cursor: pointer;
+        display: flex;
+        align-items: center;
+        gap: 4px;
+    }
+
+    .current-value-row button:hover {
+        background: var(--primary-color, #03a9f4);
+        color: white;
+    }
+
+    .toggle-switch {
+        position: relative;
+        width: 44px;
+        height: 24px;
+        background: var(--disabled-color, #bdbdbd);
+        border-radius: 12px;
+        cursor: pointer;
+        transition: background 0.2s;
+    }
+
+    .toggle-switch.active {
+        background: var(--primary-color);
+    }
+
+    .toggle-switch::after {
+        content: '';
+        position: absolute;
+        top: 2px;
+        left: 2px;
+        width: 20px;
+        height: 20px;
+        background: white;
+        border-radius: 50%;
+        transition: transform 0.2s;
+    }
+
+    .toggle-switch.active::after {
+        transform: translateX(20px);
+    }
+
+    .toggle-switch.small {
+        width: 36px;
+        height: 20px;
+    }
+
+    .toggle-switch.small::after {
+        width: 16px;
+        height: 16px;
+    }
+
+    .toggle-switch.small.active::after {
+        transform: translateX(16px);
+    }
+
+    /* Weekday selector */
+    .card-weekday-selector {
+        display: flex;
+        gap: 4px;
+        margin-bottom: 10px;
+    }
+
+    .card-weekday-btn {
+        padding: 4px 8px;
+        border-radius: 4px;
+        border: 1px solid var(--divider-color);
+        background: var(--secondary-background-color);
+        color: var(--primary-text-color);
+        font-size: 0.75rem;
+        cursor: pointer;
+        transition: all 0.2s;
+    }
+
+    .card-weekday-btn:hover {
+        border-color: var(--primary-color);
+    }
+
+    .card-weekday-btn.active {
+        background: var(--primary-color);
+        color: white;
+        border-color: var(--primary-color);
+    }
+
+    /* No scheduler message */
+    .no-scheduler {
+        text-align: center;
+        padding: 30px 20px;
+    }
+
+    .no-scheduler ha-icon {
+        font-size: 48px;
+        margin-bottom: 10px;
+        opacity: 0.6;
+    }
+
+    .no-scheduler p {
+        opacity: 0.6;
+    }
+
+    /* Tooltip */
+    .curve-tooltip {
+        position: absolute;
+        background: var(--card-background-color);
+        border: 1px solid var(--primary-color);
+        border-radius: 6px;
+        padding: 6px 10px;
+        font-size: 0.8rem;
+        white-space: nowrap;
+        pointer-events: none;
+        z-index: 100;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.3);
+    }
+
+    .curve-tooltip .time {
+        font-weight: 600;
+        color: var(--primary-color);
+    }
+
+    .curve-tooltip .value {
+        margin-left: 8px;
+        opacity: 0.9;
+    }
+`;let cardEditing=null;let cardEditingLoaded=false;function loadCardEditing(){if(!cardEditing){cardEditing=import('./card-editor.57d45e13e4a1.js').then((module)=>{module.installCardEditing(UniversalSchedulerCard);cardEditingLoaded=true;});cardEditing.catch((e)=>console.error('Failed to load card editing:',e));}
+return cardEditing;}
+class UniversalSchedulerCard extends HTMLElement{constructor(){super();this.attachShadow({mode:'open'});this._config={};this._hass=null;this._scheduler=null;this._selectedGraphIndex=0;this._isEditing=false;this._editRequested=false;this._dragState=null;this._pendingChanges=null;this._undoStack=[];this._redoStack=[];this._originalState=null;this._unsubscribeSchedulers=null;this._schedulerJson=null;this._targetKey=null;}
+static async getConfigElement(){await loadCardEditing();return document.createElement('universal-scheduler-card-editor');}
+static getStubConfig(){return{entity:'',show_header:true,show_graph_settings:false,show_points_editor:false,show_weekdays:true,show_current_value:true,allow_edit:true,graph_height:200};}
+set hass(hass){const oldHass=this._hass;this._hass=hass;if(this._config.entity){if(!oldHass){this._subscribeSchedulers();this._loadSchedulerData();}else{this._handleStateChanges(oldHass,hass);}}
+this._checkEditMode();}
+setConfig(config){if(!config){throw new Error('Invalid configuration');}
+this._config={show_header:true,show_graph_settings:false,show_points_editor:false,show_weekdays:true,show_current_value:true,allow_edit:true,graph_height:200,...config};this._subscribeSchedulers();this._loadSchedulerData();}
+_subscribeSchedulers(){if(this._unsubscribeSchedulers||!this._hass||!this._config.entity)return;this._unsubscribeSchedulers=sharedSchedulers.subscribe(this._hass,(schedulers,entityId)=>{if(entityId!==null&&entityId!==this._targetEntity)return;if(schedulers&&JSON.stringify(schedulers[this._targetEntity]??null)===this._schedulerJson)return;this._loadSchedulerData();});}
+_handleStateChanges(oldHass,hass){const target=this._targetEntity;if(target&&oldHass.states[target]!==hass.states[target]
+&&this._getTargetKey()!==this._targetKey){this._loadSchedulerData();return;}
+const graph=this._getDisplayGraph();if(graph?.xAxisType==='entity'
+&&oldHass.states[graph.xAxisEntity]!==hass.states[graph.xAxisEntity]){this._updateCurrentValue();this._tickKey=this._clockKey(currentMinute());}}
+_getTargetKey(){const state=this._hass?.states?.[this._targetEntity];if(!state)return null;return JSON.stringify([state.attributes?.friendly_name,this._getEntityInfo(this._targetEntity),getNumericAttributes(this._hass,this._targetEntity)]);}
+_checkEditMode(){const root=this.getRootNode();if(root&&root.host){const parent=root.host.closest('hui-card-preview')||root.host.closest('.edit-mode');this._isEditing=!!parent;}else{this._isEditing=false;}}
+async _loadSchedulerData(){if(!this._hass||!this._config.entity){this._scheduler=null;this._targetEntity=null;this._render();return;}
+let targetEntity=this._config.entity;if(targetEntity.startsWith('switch.universal_scheduler_')){targetEntity=targetEntity.replace('switch.universal_scheduler_','').replace(/_/g,'.');}
+this._targetEntity=targetEntity;try{if(!sharedSchedulers.schedulers&&this._unsubscribeSchedulers&&sharedSchedulers.connected){return;}
+const schedulers=await sharedSchedulers.fetch(this._hass,targetEntity);const data=schedulers[targetEntity];this._schedulerJson=JSON.stringify(data??null);this._targetKey=this._getTargetKey();this._scheduler=data?this._transformSchedulerData(targetEntity,data):null;this._render();}catch(e){console.error('Failed to load scheduler data:',e);this._scheduler=null;this._render();}}
+_transformSchedulerData(entityId,data){const info=this._getEntityInfo(entityId);const graphs=(data.graphs||[]).map((graph,index)=>{const xAxisType=graph.x_axis_type||'time';const isEntityBased=xAxisType==='entity';const xMin=isEntityBased?(graph.x_axis_min??0):0;const xMax=isEntityBased?(graph.x_axis_max??100):1440;return{id:graph.id||`graph_${index + 1}`,label:graph.label||`Schedule ${index + 1}`,weekdays:graph.weekdays||[0,1,2,3,4,5,6],attribute:graph.attribute||null,mode:graph.mode||'linear',minY:graph.min_y??info.minY,maxY:graph.max_y??info.maxY,xSnap:graph.x_snap,ySnap:graph.y_snap||0,stepToZero:graph.step_to_zero??false,xAxisType:xAxisType,xAxisEntity:graph.x_axis_entity||null,xAxisMin:graph.x_axis_min??null,xAxisMax:graph.x_axis_max??null,xAxisUnit:graph.x_axis_unit||'',xAxisDebounce:graph.x_axis_debounce??null,xAxisDeadband:graph.x_axis_deadband??null,points:graph.points||[{x:xMin,y:info.minY},{x:xMax,y:info.minY}],unit:info.unit||'',zoomLevel:1,zoomOffset:0};});if(graphs.length===0){graphs.push({id:'graph_1',label:'Schedule 1',weekdays:[0,1,2,3,4,5,6],attribute:null,mode:'linear',minY:info.minY,maxY:info.maxY,xSnap:undefined,ySnap:0,stepToZero:false,xAxisType:'time',xAxisEntity:null,points:[{x:0,y:info.minY},{x:1440,y:info.minY}],unit:info.unit||'',zoomLevel:1,zoomOffset:0});}
+const availableAttributes=getNumericAttributes(this._hass,entityId);return{entityId:entityId,name:data.name||entityId,domain:data.domain||info.domain,unit:info.unit,enabled:data.enabled!==false,updateInterval:data.update_interval??300,graphsPerRow:data.graphs_per_row||1,overrideBehavior:data.override_behavior||'none',overrideDuration:data.override_duration||3600,graphs:graphs,availableAttributes:availableAttributes};}
+_getEntityInfo(entityId){if(!this._hass?.states?.[entityId]){return{domain:'unknown',minY:0,maxY:100,unit:''};}
+const state=this._hass.states[entityId];const domain=entityId.split('.')[0];const attrs=state.attributes||{};let minY=0;let maxY=100;let unit='';switch(domain){case'light':minY=0;maxY=attrs.max_mireds||255;unit=attrs.brightness!==undefined?'%':'';break;case'climate':minY=attrs.min_temp??10;maxY=attrs.max_temp??35;unit='°C';break;case'number':case'input_number':minY=attrs.min??0;maxY=attrs.max??100;unit=attrs.unit_of_measurement||'';break;case'fan':minY=0;maxY=100;unit='%';break;case'cover':minY=0;maxY=100;unit='%';break;default:minY=attrs.min??0;maxY=attrs.max??100;unit=attrs.unit_of_measurement||'';}
+return{domain,minY,maxY,unit};}
+_canEdit(){if(this._isEditing||this._config.allow_schedule_editing)return true;return this._config.allow_edit!==false&&(this._editRequested||cardEditingLoaded);}
+_requestEditing(){if(this._editRequested||cardEditingLoaded)return;this._editRequested=true;this._render();}
+_render(){const showGraphSettings=this._isEditing||this._config.show_graph_settings;let editing=false;if(this._canEdit()){editing=cardEditingLoaded;if(!editing){loadCardEditing().then(()=>this._render(),()=>{});}}
+this.shadowRoot.innerHTML=`
+            <style>${CARD_STYLES}${editing ? UniversalSchedulerCard.editingStyles : ''}</style>
+            <ha-card>
+                <div class="scheduler-card-container">
+                    ${this._renderContent(showGraphSettings, editing)}
+                </div>
+            </ha-card>
+        `;this._setupEventListeners(editing);this._renderGraph();this._updateTimeMarker();this._updateCurrentValue();this._tickKey=this._clockKey(currentMinute());}
+_renderContent(showGraphSettings,editing){if(!this._scheduler){if(editing&&this._targetEntity&&this._config.allow_schedule_editing&&this._hass?.states[this._targetEntity]){const state=this._hass.states[this._targetEntity];const friendlyName=state?.attributes?.friendly_name||this._targetEntity;const domain=this._targetEntity.split('.')[0];return`
+                    <div class="no-scheduler">
+                        <ha-icon icon="${this._getDomainIcon(domain)}"></ha-icon>
+                        <p>No schedule for ${friendlyName}</p>
+                        <button class="add-schedule-btn" data-action="createScheduler">
+                            <ha-icon icon="mdi:plus"></ha-icon> Create Schedule
+                        </button>
+                    </div>
+                `;}
+return`
+                <div class="no-scheduler">
+                    <ha-icon icon="mdi:calendar-clock"></ha-icon>
+                    <p>No scheduler selected</p>
+                    <p style="font-size: 0.85rem;">Configure this card to select an entity</p>
+                </div>
+            `;}
+const graphs=this._scheduler.graphs||[];const graphIndex=this._config.graph_index!==undefined?Math.min(this._config.graph_index,graphs.length-1):this._selectedGraphIndex;const graph=this._getDisplayGraph(graphIndex);if(!graph){return`<div class="no-scheduler"><p>No graphs available</p></div>`;}
+const isEntityBased=graph.xAxisType==='entity';const graphHeight=this._config.graph_height||200;const allowEdit=editing&&this._config.allow_edit!==false;return`
+            ${allowEdit ? this._renderEditActions() : ''}
+
+            ${this._config.show_header !== false ? `
+                <div class="scheduler-card-header">
+                    <ha-icon class="entity-icon" icon="${this._getDomainIcon(this._scheduler.domain)}"></ha-icon>
+                    <span class="title">${this._scheduler.name}</span>
+                    ${editing && this._config.allow_schedule_editing ? `
+                        <button class="delete-btn" data-action="deleteScheduler" title="Delete schedule">
+                            <ha-icon icon="mdi:delete"></ha-icon>
+                        </button>
+                    ` : ''}
+                    ${this._config.allow_toggle ? `
+                        <div class="toggle-switch header-toggle ${this._scheduler.enabled ? 'active' : ''}" data-action="toggleScheduler" title="${this._scheduler.enabled ? 'Click to disable' : 'Click to enable'}"></div>
+                    ` : `
+                        <span class="state ${this._scheduler.enabled ? 'active' : 'inactive'}">${this._scheduler.enabled ? 'Active' : 'Disabled'}</span>
+                    `}
+                </div>
+            ` : ''}
+
+            ${graphs.length > 1 || (allowEdit && this._config.allow_schedule_editing && this._config.graph_index === undefined) ? `
+                <div class="graph-selector">
+                    ${graphs.map((g, i) => `
+                        <button class="graph-selector-btn ${i === graphIndex ? 'active' : ''}" data-index="${i}">
+                            ${g.label}
+                        </button>
+                    `).join('')}
+                    ${allowEdit && this._config.allow_schedule_editing && this._config.graph_index === undefined ? `
+                        <button class="add-graph-btn" data-action="addGraph">
+                            <ha-icon icon="mdi:plus"></ha-icon> Add
+                        </button>
+                    ` : ''}
+                </div>
+            ` : ''}
+
+            ${this._config.show_weekdays !== false ? `
+                <div class="card-weekday-selector">
+                    <button class="card-weekday-btn ${(graph.weekdays || []).includes(1) ? 'active' : ''}" data-weekday="1">Mo</button>
+                    <button class="card-weekday-btn ${(graph.weekdays || []).includes(2) ? 'active' : ''}" data-weekday="2">Tu</button>
+                    <button class="card-weekday-btn ${(graph.weekdays || []).includes(3) ? 'active' : ''}" data-weekday="3">We</button>
+                    <button class="card-weekday-btn ${(graph.weekdays || []).includes(4) ? 'active' : ''}" data-weekday="4">Th</button>
+                    <button class="card-weekday-btn ${(graph.weekdays || []).includes(5) ? 'active' : ''}" data-weekday="5">Fr</button>
+                    <button class="card-weekday-btn ${(graph.weekdays || []).includes(6) ? 'active' : ''}" data-weekday="6">Sa</button>
+                    <button class="card-weekday-btn ${(graph.weekdays || []).includes(0) ? 'active' : ''}" data-weekday="0">Su</button>
+                </div>
+            ` : ''}
+
+            ${editing && showGraphSettings ? this._renderGraphSettings(graph) : ''}
+
+            <div class="card-graph-wrapper" style="--graph-height: ${graphHeight}px;">
+                <div class="card-graph-y-axis">
+                    ${this._renderYAxis(graph)}
+                </div>
+                <div class="card-graph-container" data-graph>
+                    <div class="grid-lines"></div>
+                    <svg class="curve-svg" viewBox="0 0 100 100" preserveAspectRatio="none">
+                        <path class="fill-area"></path>
+                        <path class="curve-line"></path>
+                    </svg>
+                    <div class="current-time-marker" data-time-marker></div>
+                </div>
+            </div>
+            <div class="card-graph-x-axis">
+                ${this._renderXAxis(graph)}
+            </div>
+
+            ${this._config.show_current_value !== false ? `
+                <div class="current-value-row">
+                    <span class="label">Current:</span>
+                    <span class="value" data-current-value>--</span>
+                    <span class="label">Next:</span>
+                    <span class="value" data-next-value>--</span>
+                    <button data-action="apply">
+                        <ha-icon icon="mdi:play"></ha-icon> Apply
+                    </button>
+                </div>
+            ` : ''}
+
+            ${editing && this._config.show_points_editor ? this._renderPointsEditor(graph, isEntityBased) : ''}
+        `;}
+_renderYAxis(graph){const range=graph.maxY-graph.minY;const step=range/4;const labels=[];for(let i=4;i>=0;i--){const value=graph.minY+(step*i);labels.push(`<span>${value.toFixed(range < 10 ? 1 : 0)}</span>`);}
+return labels.join('');}
+_renderXAxis(graph){const isEntityBased=graph.xAxisType==='entity';if(isEntityBased){const xMin=graph.xAxisMin??0;const xMax=graph.xAxisMax??100;const range=xMax-xMin;const step=range/4;const labels=[];for(let i=0;i<=4;i++){const value=xMin+(step*i);labels.push(`<span>${value.toFixed(range < 10 ? 1 : 0)}${graph.xAxisUnit || ''}</span>`);}
+return labels.join('');}else{return`
+                <span>00:00</span>
+                <span>06:00</span>
+                <span>12:00</span>
+                <span>18:00</span>
+                <span>24:00</span>
+            `;}}
+_getDomainIcon(domain){const icons={'light':'mdi:lightbulb','climate':'mdi:thermostat','number':'mdi:numeric','input_number':'mdi:ray-vertex','fan':'mdi:fan','cover':'mdi:window-shutter','humidifier':'mdi:air-humidifier','media_player':'mdi:speaker'};return icons[domain]||'mdi:help-circle';}
+_minutesToTime(minutes){const h=Math.floor(minutes/60)%24;const m=Math.floor(minutes%60);return`${h.toString().padStart(2, '0')}:${m.toString().padStart(2, '0')}`;}
+_setupEventListeners(editing){const container=this.shadowRoot.querySelector('.scheduler-card-container');if(!container)return;container.querySelector('[data-action="toggleScheduler"]')?.addEventListener('click',()=>{this._toggleSchedulerEnabled();});container.querySelectorAll('.graph-selector-btn').forEach(btn=>{btn.addEventListener('click',()=>{this._selectedGraphIndex=parseInt(btn.dataset.index);this._render();});});container.querySelector('[data-action="apply"]')?.addEventListener('click',()=>{this._applyNow();});if(editing){this._setupEditingListeners(container);}else if(this._scheduler&&this._config.allow_edit!==false){const request=()=>this._requestEditing();container.querySelectorAll('[data-graph], .card-weekday-selector').forEach((el)=>{el.addEventListener('pointerover',request,{once:true});el.addEventListener('focusin',request,{once:true});});}}
+_getDisplayGraph(graphIndexOverride=null){const graphIndex=graphIndexOverride!==null?graphIndexOverride:this._getGraphIndex();const graphs=this._scheduler?.graphs||[];const originalGraph=graphs[graphIndex];if(!originalGraph)return null;if(this._pendingChanges&&this._pendingChanges.graphIndex===graphIndex){return{...originalGraph,...this._pendingChanges.changes};}
+return originalGraph;}
+_getGraphIndex(){if(this._config.graph_index!==undefined){return Math.min(this._config.graph_index,(this._scheduler?.graphs?.length||1)-1);}
+return this._selectedGraphIndex;}
+async _toggleSchedulerEnabled(){if(!this._scheduler||!this._hass)return;try{const switchEntity=this._config.entity;await this._hass.callService('switch',this._scheduler.enabled?'turn_off':'turn_on',{entity_id:switchEntity});setTimeout(()=>this._loadSchedulerData(),500);}catch(e){console.error('Failed to toggle scheduler:',e);}}
+async _applyNow(){if(!this._scheduler)return;try{await this._hass.callService('universal_scheduler','apply_now',{entity_id:this._scheduler.entityId});}catch(e){console.error('Failed to apply now:',e);}}
+_renderGraph(){const graphContainer=this.shadowRoot.querySelector('[data-graph]');if(!graphContainer)return;const graph=this._getDisplayGraph();if(!graph)return;this._renderGraphWithPoints(graph,graph.points);}
+_renderGraphWithPoints(graph,points){const graphContainer=this.shadowRoot.querySelector('[data-graph]');if(!graphContainer||!graph)return;const svg=graphContainer.querySelector('.curve-svg');const curvePath=svg.querySelector('.curve-line');const fillPath=svg.querySelector('.fill-area');graphContainer.querySelectorAll('.point').forEach(el=>el.remove());const isEntityBased=graph.xAxisType==='entity';const xMin=isEntityBased?(graph.xAxisMin??0):0;const xMax=isEntityBased?(graph.xAxisMax??100):1440;const yRange=graph.maxY-graph.minY;const xRange=xMax-xMin;const tempGraph={...graph,points:points};const pathPoints=this._generateInterpolatedPath(tempGraph,xMin,xMax);if(pathPoints.length===0){curvePath.setAttribute('d','');fillPath.setAttribute('d','');return;}
+let d='';pathPoints.forEach((p,i)=>{const x=((p.x-xMin)/xRange)*100;const y=100-((p.y-graph.minY)/yRange)*100;d+=i===0?`M ${x} ${y}`:` L ${x} ${y}`;});curvePath.setAttribute('d',d);const firstX=((pathPoints[0].x-xMin)/xRange)*100;const lastX=((pathPoints[pathPoints.length-1].x-xMin)/xRange)*100;fillPath.setAttribute('d',d+` L ${lastX} 100 L ${firstX} 100 Z`);if(this._config.allow_edit!==false){(points||[]).forEach((point,index)=>{const xPercent=((point.x-xMin)/xRange)*100;const yPercent=100-((point.y-graph.minY)/yRange)*100;const pointEl=document.createElement('div');pointEl.className='point';pointEl.dataset.index=index;pointEl.style.left=`${xPercent}%`;pointEl.style.top=`${yPercent}%`;pointEl.title=isEntityBased?`${point.x}: ${point.y}`:`${this._minutesToTime(point.x)}: ${point.y}`;graphContainer.appendChild(pointEl);});}}
+_generateInterpolatedPath(graph,startX,endX){const points=graph.points||[];if(points.length===0)return[];const mode=graph.mode||'linear';const stepToZero=graph.stepToZero||false;const result=[];const step=(endX-startX)/200;const sortedPoints=[...points].sort((a,b)=>a.x-b.x);for(let x=startX;x<=endX;x+=step){const y=this._interpolateValue(sortedPoints,x,mode,stepToZero,graph.minY);result.push({x,y});}
+return result;}
+_interpolateValue(points,x,mode,stepToZero,minY){if(points.length===0)return 0;if(points.length===1)return points[0].y;let p1=points[0];let p2=points[points.length-1];for(let i=0;i<points.length-1;i++){if(x>=points[i].x&&x<=points[i+1].x){p1=points[i];p2=points[i+1];break;}}
+if(x<=points[0].x)return points[0].y;if(x>=points[points.length-1].x)return points[points.length-1].y;const range=p2.x-p1.x;if(range===0)return p1.y;const t=(x-p1.x)/range;switch(mode){case'step':if(stepToZero&&p2.y===minY){return x>=p2.x?minY:p1.y;}
+return x>=p2.x?p2.y:p1.y;case'smooth':const smoothT=(1-Math.cos(t*Math.PI))/2;return p1.y+(p2.y-p1.y)*smoothT;case'linear':default:return p1.y+(p2.y-p1.y)*t;}}
+_updateTimeMarker(){const marker=this.shadowRoot.querySelector('[data-time-marker]');if(!marker)return;const graph=this._getDisplayGraph();if(!graph||graph.xAxisType==='entity'){marker.style.display='none';return;}
+const now=new Date();const currentMinute=now.getHours()*60+now.getMinutes();const percent=(currentMinute/1440)*100;marker.style.display='block';marker.style.left=`${percent}%`;}
+_updateCurrentValue(){const currentEl=this.shadowRoot.querySelector('[data-current-value]');const nextEl=this.shadowRoot.querySelector('[data-next-value]');if(!currentEl||!nextEl)return;const graph=this._getDisplayGraph();if(!graph){currentEl.textContent='--';nextEl.textContent='--';return;}
+const isEntityBased=graph.xAxisType==='entity';let currentX;if(isEntityBased){const xEntityState=this._hass?.states?.[graph.xAxisEntity];currentX=parseFloat(xEntityState?.state)||0;}else{const now=new Date();currentX=now.getHours()*60+now.getMinutes();}
+const currentValue=this._interpolateValue(graph.points,currentX,graph.mode,graph.stepToZero,graph.minY);currentEl.textContent=`${currentValue.toFixed(1)} ${graph.unit || ''}`;const sortedPoints=[...graph.points].sort((a,b)=>a.x-b.x);let nextPoint=null;for(const p of sortedPoints){if(p.x>currentX){nextPoint=p;break;}}
+if(nextPoint){if(isEntityBased){nextEl.textContent=`${nextPoint.y.toFixed(1)} @ ${nextPoint.x}${graph.xAxisUnit || ''}`;}else{nextEl.textContent=`${nextPoint.y.toFixed(1)} @ ${this._minutesToTime(nextPoint.x)}`;}}else if(sortedPoints.length>0){const firstPoint=sortedPoints[0];if(isEntityBased){nextEl.textContent=`${firstPoint.y.toFixed(1)} @ ${firstPoint.x}${graph.xAxisUnit || ''}`;}else{nextEl.textContent=`${firstPoint.y.toFixed(1)} @ ${this._minutesToTime(firstPoint.x)} (tomorrow)`;}}else{nextEl.textContent='--';}}
+_clockKey(minute){const graph=this._getDisplayGraph();if(!graph)return null;if(graph.xAxisType==='entity'){return this._hass?.states?.[graph.xAxisEntity]?.state;}
+return timeGraphKey(graph,minute);}
+_onMinuteTick(minute){const key=this._clockKey(minute);if(key===null||key===this._tickKey)return;this._tickKey=key;this._updateTimeMarker();this._updateCurrentValue();}
+connectedCallback(){this._subscribeSchedulers();if(!this._unsubscribeTicker){this._unsubscribeTicker=minuteTicker.subscribe((minute)=>this._onMinuteTick(minute));}}
+disconnectedCallback(){if(this._unsubscribeTicker){this._unsubscribeTicker();this._unsubscribeTicker=null;}
+if(this._unsubscribeSchedulers){this._unsubscribeSchedulers();this._unsubscribeSchedulers=null;}}
+getCardSize(){return 4;}}
+customElements.define('universal-scheduler-card',UniversalSchedulerCard);window.customCards=window.customCards||[];window.customCards.push({type:'universal-scheduler-card',name:'Universal Scheduler Card',description:'Display and edit scheduler graphs',preview:true,documentationURL:'https://github.com/your-repo/universal-scheduler'});console.log('%c UNIVERSAL-SCHEDULER-CARD %c loaded ','background: #4caf50; color: white; font-weight: bold;','background: #ddd; color: #333;');
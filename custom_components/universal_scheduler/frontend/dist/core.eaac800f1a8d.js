@@ -0,0 +1,57 @@
+const CONTROLLABLE_DOMAINS=['light','climate','number','input_number','fan','cover','humidifier','media_player'];function getEntityInfo(hass,entityId){if(!entityId||!hass?.states[entityId]){return{domain:'number',minY:0,maxY:100,unit:''};}
+const state=hass.states[entityId];const domain=entityId.split('.')[0];const attrs=state.attributes||{};let minY=0,maxY=100,unit='';switch(domain){case'light':minY=0;maxY=100;unit='%';break;case'climate':minY=attrs.min_temp??10;maxY=attrs.max_temp??30;unit=attrs.temperature_unit||'°C';break;case'number':case'input_number':minY=attrs.min??0;maxY=attrs.max??100;unit=attrs.unit_of_measurement||'';break;case'fan':minY=0;maxY=100;unit='%';break;case'cover':minY=0;maxY=100;unit='%';break;case'humidifier':minY=attrs.min_humidity??0;maxY=attrs.max_humidity??100;unit='%';break;default:minY=attrs.min??0;maxY=attrs.max??100;unit=attrs.unit_of_measurement||'';}
+return{domain,minY,maxY,unit};}
+function getControllableEntities(hass){if(!hass?.states)return[];return Object.keys(hass.states).filter(entityId=>{const domain=entityId.split('.')[0];return CONTROLLABLE_DOMAINS.includes(domain);}).sort();}
+function getNumericAttributes(hass,entityId){const state=hass?.states?.[entityId];if(!state||!state.attributes)return[];return Object.entries(state.attributes).filter(([,value])=>typeof value==='number').map(([key])=>key).sort();}
+function minutesToTime(minutes){const h=Math.floor(minutes/60)%24;const m=Math.floor(minutes%60);return`${h.toString().padStart(2, '0')}:${m.toString().padStart(2, '0')}`;}
+function timeToMinutes(timeStr){if(!timeStr)return null;const match=timeStr.match(/^(\d{1,2}):(\d{2})$/);if(!match)return null;const hours=parseInt(match[1],10);const mins=parseInt(match[2],10);if(hours<0||hours>23||mins<0||mins>59)return null;return hours*60+mins;}
+function getDomainIcon(domain){const icons={'light':'mdi:lightbulb','climate':'mdi:thermostat','number':'mdi:numeric','input_number':'mdi:ray-vertex','fan':'mdi:fan','cover':'mdi:window-shutter','humidifier':'mdi:air-humidifier','media_player':'mdi:speaker'};return icons[domain]||'mdi:help-circle';}
+const SMOOTH_PATH_SAMPLES=200;function generateInterpolatedPath(scheduler,startMinute,endMinute){const mode=scheduler.mode;const stepToZero=scheduler.stepToZero||false;const minY=scheduler.minY;if(mode==='step'&&!stepToZero){return generateStepPath(scheduler.points,startMinute,endMinute,minY,scheduler.maxY);}
+const points=sortedByX(scheduler.points||[]);if(points.length===0){return[{x:startMinute,y:minY},{x:endMinute,y:minY},];}
+const result=[];const add=(x,y)=>{const last=result[result.length-1];if(!last||last.x!==x||last.y!==y)result.push({x,y});};const first=points[0];const last=points[points.length-1];const samples=SMOOTH_PATH_SAMPLES/Math.max(endMinute-startMinute,1);if(startMinute<first.x){add(startMinute,first.y);add(Math.min(first.x,endMinute),first.y);}
+for(let i=0;i<points.length-1;i++){const p1=points[i];const p2=points[i+1];if(p2.x<=startMinute||p1.x===p2.x)continue;if(p1.x>=endMinute)break;const from=Math.max(p1.x,startMinute);const to=Math.min(p2.x,endMinute);if(stepToZero&&p2.y<=minY){add(from,p1.y);add(to,p1.y);if(to===p2.x)add(to,minY);}else if(stepToZero&&p1.y<=minY){const rise=p1.x+(p2.x-p1.x)*0.01;if(from<rise){add(from,minY);add(Math.min(rise,to),minY);}
+if(to>rise)addSegment(add,p1,p2,Math.max(from,rise),to,mode,samples);}else{addSegment(add,p1,p2,from,to,mode,samples);}}
+if(endMinute>last.x){add(Math.max(last.x,startMinute),last.y);add(endMinute,last.y);}
+return result;}
+function addSegment(add,p1,p2,from,to,mode,samples){if(mode==='step'){add(from,p1.y);add(to,p1.y);return;}
+const width=p2.x-p1.x;const dy=p2.y-p1.y;if(mode!=='smooth'){add(from,from===p1.x?p1.y:p1.y+(dy*(from-p1.x))/width);add(to,to===p2.x?p2.y:p1.y+(dy*(to-p1.x))/width);return;}
+const count=dy===0?1:Math.ceil((to-from)*samples);for(let k=0;k<=count;k++){const x=k===count?to:from+((to-from)*k)/count;add(x,p1.y+(dy*(1-Math.cos(((x-p1.x)/width)*Math.PI)))/2);}}
+function sortedByX(points){return isSortedByX(points)?points:[...points].sort((a,b)=>a.x-b.x);}
+function isSortedByX(points){for(let i=1;i<points.length;i++){if(points[i].x<points[i-1].x)return false;}
+return true;}
+function generateStepPath(points,startMinute,endMinute,minY,maxY){if(!points?.length){return[{x:startMinute,y:minY},{x:endMinute,y:minY},];}
+const sorted=sortedByX(points);const valueAt=(x)=>interpolateValue(x,sorted,'step',minY,maxY);const path=[];let lastY=valueAt(startMinute);path.push({x:startMinute,y:lastY});for(const p of sorted){if(p.x<=startMinute){lastY=p.y;continue;}
+if(p.x>endMinute){break;}
+path.push({x:p.x,y:lastY});path.push({x:p.x,y:p.y});lastY=p.y;}
+path.push({x:endMinute,y:lastY});return path;}
+function interpolateValue(x,points,mode,minY,maxY){if(points.length===0)return minY;if(points.length===1)return points[0].y;let p1=points[0];let p2=points[points.length-1];for(let i=0;i<points.length-1;i++){if(x>=points[i].x&&x<=points[i+1].x){p1=points[i];p2=points[i+1];break;}}
+if(x<=points[0].x)return points[0].y;if(x>=points[points.length-1].x)return points[points.length-1].y;const t=(x-p1.x)/(p2.x-p1.x);switch(mode){case'step':return p1.y;case'smooth':const t2=(1-Math.cos(t*Math.PI))/2;return p1.y+(p2.y-p1.y)*t2;case'linear':default:return p1.y+(p2.y-p1.y)*t;}}
+function interpolateValueWithStepToMin(x,points,mode,minY,maxY){if(points.length===0)return minY;if(points.length===1)return points[0].y;let p1=points[0];let p2=points[points.length-1];let p1Index=0;for(let i=0;i<points.length-1;i++){if(x>=points[i].x&&x<=points[i+1].x){p1=points[i];p2=points[i+1];p1Index=i;break;}}
+if(x<=points[0].x)return points[0].y;if(x>=points[points.length-1].x)return points[points.length-1].y;if(p2.y<=minY){if(x>=p2.x){return minY;}
+return p1.y;}
+if(p1.y<=minY){const t=(x-p1.x)/(p2.x-p1.x);if(t<0.01)return minY;}
+return interpolateValue(x,points,mode,minY,maxY);}
+function parsePoints(pointsData){if(Array.isArray(pointsData)){return pointsData.map(p=>({x:p.x??p.time??0,y:p.y??p.value??0}));}
+return[{x:0,y:0},{x:1440,y:0}];}
+function clamp(value,min,max){return Math.max(min,Math.min(max,value));}
+class SchedulerSubscription{constructor(){this.schedulers=null;this.revision=0;this._listeners=new Set();this._unsubscribe=null;this._cache=null;this._stale=new Set();this._request=null;}
+get connected(){return this._unsubscribe!==null;}
+subscribe(hass,listener){this._listeners.add(listener);if(!this._unsubscribe){this._unsubscribe=hass.connection.subscribeMessage((msg)=>this._handleMessage(msg),{type:'universal_scheduler/subscribe'});this._unsubscribe.catch((err)=>{console.error('Failed to subscribe to schedulers:',err);this._unsubscribe=null;this._listeners.forEach((listener)=>listener(null,null));});}else if(this.schedulers){listener(this.schedulers,null);}
+return()=>{this._listeners.delete(listener);if(this._listeners.size===0&&this._unsubscribe){this._unsubscribe.then((unsub)=>unsub()).catch(()=>{});this._unsubscribe=null;this.schedulers=null;this.revision=0;}};}
+async fetch(hass,entityId=null){if(this.schedulers)return this.schedulers;const stale=entityId?this._stale.has(entityId):this._stale.size>0;if(this._cache&&!stale)return this._cache;if(!this._request){const request=hass.callWS({type:'universal_scheduler/get_schedulers'}).then((result)=>{if(request===this._request){this._cache=result.schedulers||{};this._stale.clear();}
+return result.schedulers||{};}).finally(()=>{if(request===this._request)this._request=null;});this._request=request;}
+return this._request;}
+invalidate(entityId=null){if(entityId){this._stale.add(entityId);}else{this._cache=null;}
+this._request=null;}
+_handleMessage(msg){if(msg.action==='snapshot'){this.schedulers={...msg.schedulers};this._cache=null;}else if(!this.schedulers||msg.revision<=this.revision){return;}else if(msg.action==='removed'){delete this.schedulers[msg.entity_id];}else{this.schedulers[msg.entity_id]=msg.config;}
+this.revision=msg.revision;const entityId=msg.action==='snapshot'?null:msg.entity_id;this._listeners.forEach((listener)=>listener(this.schedulers,entityId));}}
+function currentMinute(){const now=new Date();return now.getHours()*60+now.getMinutes();}
+function timeGraphKey(graph,minute,startMinute=0,endMinute=1440){let prev=null;let next=null;for(const p of graph.points||[]){if(p.x<=minute){if(!prev||p.x>=prev.x)prev=p;}else if(!next||p.x<next.x){next=p;}}
+const flat=graph.mode==='step'||!prev||!next||prev.y===next.y;const marker=minute>=startMinute&&minute<=endMinute?minute:'';return`${startMinute}-${endMinute}@${marker}|${prev?.x}-${next?.x}|${flat ? '' : minute}`;}
+class MinuteTicker{constructor(){this._listeners=new Set();this._timer=null;this._minute=null;this._onVisibilityChange=()=>this._tick();}
+subscribe(listener){this._listeners.add(listener);if(this._listeners.size===1){document.addEventListener('visibilitychange',this._onVisibilityChange);this._minute=currentMinute();this._schedule();}
+return()=>{this._listeners.delete(listener);if(this._listeners.size===0){document.removeEventListener('visibilitychange',this._onVisibilityChange);clearTimeout(this._timer);this._timer=null;}};}
+_schedule(){clearTimeout(this._timer);this._timer=null;if(document.hidden||this._listeners.size===0)return;const now=new Date();const delay=60000-(now.getSeconds()*1000+now.getMilliseconds());this._timer=setTimeout(()=>this._tick(),delay);}
+_tick(){const minute=currentMinute();if(!document.hidden&&minute!==this._minute){this._minute=minute;this._listeners.forEach((listener)=>listener(minute));}
+this._schedule();}}
+const sharedSchedulers=new SchedulerSubscription();const minuteTicker=new MinuteTicker();export{CONTROLLABLE_DOMAINS,getEntityInfo,getControllableEntities,getNumericAttributes,minutesToTime,timeToMinutes,getDomainIcon,generateInterpolatedPath,isSortedByX,interpolateValue,interpolateValueWithStepToMin,parsePoints,clamp,SchedulerSubscription,currentMinute,timeGraphKey,MinuteTicker,sharedSchedulers,minuteTicker};
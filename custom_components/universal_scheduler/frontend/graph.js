@@ -3,7 +3,51 @@
  * Graph rendering, mouse/touch interactions, and visual updates
  */
 
-import { interpolateValue, interpolateValueWithStepToMin, generateInterpolatedPath, minutesToTime, clamp } from './utils.js';
+import { interpolateValue, interpolateValueWithStepToMin, generateInterpolatedPath, isSortedByX, minutesToTime, clamp } from './utils.js';
+
+// Visible windows (zoom level and offset) of which a graph's paths are kept
+const CURVE_PATH_WINDOWS = 8;
+
+// Copy the coordinates of points, to notice when they are edited in place
+function snapshotPoints(points) {
+    const snapshot = new Float64Array(points.length * 2);
+    points.forEach((p, i) => {
+        snapshot[2 * i] = p.x;
+        snapshot[2 * i + 1] = p.y;
+    });
+    return snapshot;
+}
+
+function samePoints(snapshot, points) {
+    if (snapshot.length !== points.length * 2) return false;
+    for (let i = 0; i < points.length; i++) {
+        if (snapshot[2 * i] !== points[i].x || snapshot[2 * i + 1] !== points[i].y) return false;
+    }
+    return true;
+}
+
+// Call fn at most once per animation frame, with the latest argument given
+function frameThrottle(fn) {
+    let frame = null;
+    let latest;
+    const run = () => {
+        frame = null;
+        fn(latest);
+    };
+    return {
+        schedule(arg) {
+            latest = arg;
+            if (frame === null) frame = requestAnimationFrame(run);
+        },
+        // Run a scheduled call right away, e.g. when the drag ends
+        flush() {
+            if (frame !== null) {
+                cancelAnimationFrame(frame);
+                run();
+            }
+        },
+    };
+}
 
 /**
  * Graph rendering and interaction handler
@@ -11,6 +55,8 @@ import { interpolateValue, interpolateValueWithStepToMin, generateInterpolatedPa
 export class GraphHandler {
     constructor(panel) {
         this.panel = panel;
+        // Curve paths per graph, reused until its points or settings change
+        this._curvePaths = new WeakMap();
     }
 
     get schedulers() {
@@ -37,8 +83,10 @@ export class GraphHandler {
         // Clear existing points
         card.querySelectorAll('.point, .point-tooltip').forEach(el => el.remove());
 
-        // Sort points by x
-        scheduler.points.sort((a, b) => a.x - b.x);
+        // Sort points by x (point elements are indexed in this order)
+        if (!isSortedByX(scheduler.points)) {
+            scheduler.points.sort((a, b) => a.x - b.x);
+        }
 
         // Calculate visible range
         const visibleMinutes = 1440 / scheduler.zoomLevel;
@@ -46,20 +94,70 @@ export class GraphHandler {
         const endMinute = startMinute + visibleMinutes;
         const yRange = scheduler.maxY - scheduler.minY;
 
-        // Generate interpolated path
-        const pathPoints = generateInterpolatedPath(scheduler, startMinute, endMinute);
-
         // Use viewBox coordinates (0-100 for both axes) to make it resolution-independent
         svg.setAttribute('viewBox', '0 0 100 100');
         svg.setAttribute('preserveAspectRatio', 'none');
 
+        this.setCurvePaths(curvePath, fillPath, scheduler, startMinute, endMinute);
+
+        // Render draggable points
+        scheduler.points.forEach((point, index) => {
+            if (point.x < startMinute || point.x > endMinute) return;
+
+            const px = ((point.x - startMinute) / visibleMinutes) * 100;
+            const py = (1 - (point.y - scheduler.minY) / yRange) * 100;
+
+            const el = document.createElement('div');
+            el.className = 'point';
+            el.style.left = `${px}%`;
+            el.style.top = `${py}%`;
+            el.dataset.index = index;
+
+            // Add tooltip on hover
+            el.addEventListener('mouseenter', (e) => this.showPointTooltip(e, entityId, index));
+            el.addEventListener('mouseleave', () => this.hidePointTooltip(entityId));
+
+            graph.appendChild(el);
+        });
+    }
+
+    /**
+     * Get the SVG curve and fill paths of a graph between startX and endX in
+     * viewBox coordinates (0-100). They are kept for the last few visible
+     * windows of each graph until its points or curve settings change.
+     */
+    getCurvePaths(graph, startX, endX) {
+        const settings = `${graph.mode}|${!!graph.stepToZero}|${graph.minY}|${graph.maxY}`;
+        let cache = this._curvePaths.get(graph);
+        if (!cache || cache.settings !== settings || !samePoints(cache.points, graph.points)) {
+            cache = { settings, points: snapshotPoints(graph.points), windows: new Map() };
+            this._curvePaths.set(graph, cache);
+        }
+
+        const windowKey = `${startX}|${endX}`;
+        let paths = cache.windows.get(windowKey);
+        if (!paths) {
+            paths = this.buildCurvePaths(graph, startX, endX);
+            if (cache.windows.size >= CURVE_PATH_WINDOWS) {
+                cache.windows.delete(cache.windows.keys().next().value);
+            }
+            cache.windows.set(windowKey, paths);
+        }
+        return paths;
+    }
+
+    buildCurvePaths(graph, startX, endX) {
+        const pathPoints = generateInterpolatedPath(graph, startX, endX);
+        const visibleRange = endX - startX;
+        const yRange = graph.maxY - graph.minY;
+
         let pathD = '';
         let fillD = '';
 
         pathPoints.forEach((p, i) => {
             // Use percentage coordinates (0-100)
-            const px = ((p.x - startMinute) / visibleMinutes) * 100;
-            const py = (1 - (p.y - scheduler.minY) / yRange) * 100;
+            const px = ((p.x - startX) / visibleRange) * 100;
+            const py = (1 - (p.y - graph.minY) / yRange) * 100;
 
             if (i === 0) {
                 pathD += `M ${px} ${py}`;
@@ -72,32 +170,20 @@ export class GraphHandler {
 
         // Close fill area
         if (pathPoints.length > 0) {
-            const lastPx = ((pathPoints[pathPoints.length - 1].x - startMinute) / visibleMinutes) * 100;
+            const lastPx = ((pathPoints[pathPoints.length - 1].x - startX) / visibleRange) * 100;
             fillD += ` L ${lastPx} 100 Z`;
         }
 
-        curvePath.setAttribute('d', pathD);
-        fillPath.setAttribute('d', fillD);
-
-        // Render draggable points
-        scheduler.points.forEach((point, index) => {
-            if (point.x < startMinute || point.x > endMinute) return;
-
-            const px = ((point.x - startMinute) / visibleMinutes) * 100;
-            const py = (1 - (point.y - scheduler.minY) / yRange) * 100;
-
-            const el = document.createElement('div');
-            el.className = 'point';
-            el.style.left = `${px}%`;
-            el.style.top = `${py}%`;
-            el.dataset.index = index;
-
-            // Add tooltip on hover
-            el.addEventListener('mouseenter', (e) => this.showPointTooltip(e, entityId, index));
-            el.addEventListener('mouseleave', () => this.hidePointTooltip(entityId));
+        return { pathD, fillD };
+    }
 
-            graph.appendChild(el);
-        });
+    /**
+     * Set the curve and fill paths of a graph, leaving unchanged paths alone
+     */
+    setCurvePaths(curvePath, fillPath, graph, startX, endX) {
+        const { pathD, fillD } = this.getCurvePaths(graph, startX, endX);
+        if (curvePath.getAttribute('d') !== pathD) curvePath.setAttribute('d', pathD);
+        if (fillPath.getAttribute('d') !== fillD) fillPath.setAttribute('d', fillD);
     }
 
     /**
@@ -816,8 +902,10 @@ export class GraphHandler {
         // Clear existing points
         graphContainer.querySelectorAll('.point, .point-tooltip').forEach(el => el.remove());
 
-        // Sort points by x
-        graph.points.sort((a, b) => a.x - b.x);
+        // Sort points by x (point elements are indexed in this order)
+        if (!isSortedByX(graph.points)) {
+            graph.points.sort((a, b) => a.x - b.x);
+        }
 
         // Calculate visible range based on X-axis type
         const isEntityBased = graph.xAxisType === 'entity';
@@ -842,43 +930,11 @@ export class GraphHandler {
 
         const yRange = graph.maxY - graph.minY;
 
-        // Generate interpolated path using graph's points
-        const pathPoints = generateInterpolatedPath({
-            points: graph.points,
-            mode: graph.mode,
-            minY: graph.minY,
-            maxY: graph.maxY,
-            stepToZero: graph.stepToZero
-        }, startX, endX);
-
         // Use viewBox coordinates (0-100 for both axes)
         svg.setAttribute('viewBox', '0 0 100 100');
         svg.setAttribute('preserveAspectRatio', 'none');
 
-        let pathD = '';
-        let fillD = '';
-
-        pathPoints.forEach((p, i) => {
-            const px = ((p.x - startX) / visibleRange) * 100;
-            const py = (1 - (p.y - graph.minY) / yRange) * 100;
-
-            if (i === 0) {
-                pathD += `M ${px} ${py}`;
-                fillD += `M ${px} 100 L ${px} ${py}`;
-            } else {
-                pathD += ` L ${px} ${py}`;
-                fillD += ` L ${px} ${py}`;
-            }
-        });
-
-        // Close fill area
-        if (pathPoints.length > 0) {
-            const lastPx = ((pathPoints[pathPoints.length - 1].x - startX) / visibleRange) * 100;
-            fillD += ` L ${lastPx} 100 Z`;
-        }
-
-        curvePath.setAttribute('d', pathD);
-        fillPath.setAttribute('d', fillD);
+        this.setCurvePaths(curvePath, fillPath, graph, startX, endX);
 
         // Render draggable points
         graph.points.forEach((point, index) => {
@@ -1359,6 +1415,58 @@ export class GraphHandler {
         }
     }
 
+    /**
+     * Show a point being dragged: move its element and tooltip, redraw the
+     * curve and update the current value, leaving axes, grid and the other
+     * points alone. Points are sorted again when the drag ends.
+     */
+    updateDraggedPointMulti(entityId, graphIndex, section, pointEl, index) {
+        const graph = this.schedulers[entityId]?.graphs?.[graphIndex];
+        const point = graph?.points?.[index];
+        if (!point) return;
+
+        const isEntityBased = graph.xAxisType === 'entity';
+        const zoomLevel = graph.zoomLevel || 1;
+        let visibleRange, startX;
+        if (isEntityBased) {
+            const xMin = graph.xAxisMin ?? 0;
+            const xRange = (graph.xAxisMax ?? 100) - xMin;
+            visibleRange = xRange / zoomLevel;
+            startX = xMin + (graph.zoomOffset || 0) * xRange;
+        } else {
+            visibleRange = 1440 / zoomLevel;
+            startX = graph.zoomOffset || 0;
+        }
+
+        const xPercent = clamp((point.x - startX) / visibleRange, 0, 1) * 100;
+        const yPercent = clamp(1 - (point.y - graph.minY) / (graph.maxY - graph.minY), 0, 1) * 100;
+        pointEl.style.left = `${xPercent}%`;
+        pointEl.style.top = `${yPercent}%`;
+
+        const svg = section.querySelector('.curve-svg');
+        if (svg) {
+            this.setCurvePaths(svg.querySelector('.curve-line'), svg.querySelector('.fill-area'), graph, startX, startX + visibleRange);
+        }
+        this.updateCurrentValueMulti(entityId, graphIndex, section);
+
+        // Reuse the tooltip while dragging
+        let tooltip = section.querySelector('.point-tooltip');
+        if (!tooltip) {
+            tooltip = document.createElement('div');
+            tooltip.className = 'point-tooltip';
+            tooltip.innerHTML = '<span class="time"></span><span class="value"></span>';
+            pointEl.parentElement.appendChild(tooltip);
+        }
+        tooltip.querySelector('.time').textContent = isEntityBased
+            ? `${point.x.toFixed(1)}${graph.xAxisUnit || ''}`
+            : minutesToTime(Math.round(point.x));
+        tooltip.querySelector('.value').textContent = `${point.y.toFixed(1)}${graph.unit || ''}`;
+        tooltip.style.left = `${xPercent}%`;
+        tooltip.style.top = `${yPercent}%`;
+        tooltip.classList.toggle('below', yPercent < 20);
+        tooltip.classList.toggle('above', yPercent >= 20);
+    }
+
     /**
      * Render points list for multi-graph mode
      * Supports both time-based and entity-based X-axis
@@ -1496,6 +1604,7 @@ export class GraphHandler {
             const entityInfo = this.panel.getEntityInfo(scheduler.entityId);
             const entityMinY = entityInfo.minY;
             const entityMaxY = entityInfo.maxY;
+            const render = frameThrottle(() => this.panel.updateGraphSection(entityId, graphIndex, section));
 
             const onMove = (ev) => {
                 const deltaX = lastX - ev.clientX;
@@ -1517,10 +1626,10 @@ export class GraphHandler {
 
                 lastX = ev.clientX;
                 lastY = ev.clientY;
-                this.panel.updateGraphSection(entityId, graphIndex, section);
+                render.schedule();
             };
-
             const onUp = () => {
+                render.flush();
                 window.removeEventListener('mousemove', onMove);
                 window.removeEventListener('mouseup', onUp);
             };
@@ -1534,28 +1643,31 @@ export class GraphHandler {
 
         if (e.target.classList.contains('point')) {
             // Drag existing point
-            const index = parseInt(e.target.dataset.index);
-            e.target.classList.add('dragging');
+            const pointEl = e.target;
+            const index = parseInt(pointEl.dataset.index);
+            pointEl.classList.add('dragging');
             this.panel.saveUndoState(entityId);
 
             section.querySelectorAll('.curve-tooltip, .hover-line, .hover-dot').forEach(el => el.remove());
 
-            const onMove = (ev) => {
+            const drag = frameThrottle((ev) => {
                 const coords = getCoords(ev);
                 const hasConflict = graph.points.some((p, i) => i !== index && Math.abs(p.x - coords.x) < (isEntityBased ? 0.01 : 1));
                 if (!hasConflict) {
                     graph.points[index] = coords;
-                    this.renderGraphSection(entityId, graphIndex, section);
-                    this.updateCurrentValueMulti(entityId, graphIndex, section);
-                    this.showPointTooltipMulti({ target: graphContainer.querySelector(`[data-index="${index}"]`) }, entityId, graphIndex, index);
+                    this.updateDraggedPointMulti(entityId, graphIndex, section, pointEl, index);
                 }
-            };
+            });
+            const onMove = (ev) => drag.schedule(ev);
 
             const onUp = () => {
-                e.target.classList.remove('dragging');
+                drag.flush();
+                pointEl.classList.remove('dragging');
                 window.removeEventListener('mousemove', onMove);
                 window.removeEventListener('mouseup', onUp);
                 this.hidePointTooltipMulti(section);
+                // Sort and index the points again, they may have passed each other
+                this.renderGraphSection(entityId, graphIndex, section);
             };
 
             window.addEventListener('mousemove', onMove);
@@ -1568,6 +1680,7 @@ export class GraphHandler {
             let hasMoved = false;
             let lastX = e.clientX;
             let lastY = e.clientY;
+            const render = frameThrottle(() => this.panel.updateGraphSection(entityId, graphIndex, section));
 
             const onMove = (ev) => {
                 const dx = ev.clientX - startX;
@@ -1592,11 +1705,11 @@ export class GraphHandler {
 
                     lastX = ev.clientX;
                     lastY = ev.clientY;
-                    this.panel.updateGraphSection(entityId, graphIndex, section);
+                    render.schedule();
                 }
             };
-
             const onUp = (ev) => {
+                render.flush();
                 window.removeEventListener('mousemove', onMove);
                 window.removeEventListener('mouseup', onUp);
 
@@ -1737,6 +1850,8 @@ export class GraphHandler {
         let touchedPoint = null;
         let hasMoved = false;
         let ignoreTouch = false;
+        // Measured once per touch, not on every move
+        let rect = null;
 
         const findNearestPoint = (touch) => {
             const points = Array.from(section.querySelectorAll('.point'));
@@ -1757,48 +1872,6 @@ export class GraphHandler {
             return bestDist <= 18 ? best : null;
         };
 
-        const showDragTooltip = (coords) => {
-            if (!coords) return;
-            const scheduler = this.schedulers[entityId];
-            const graph = scheduler?.graphs?.[graphIndex];
-            if (!graph) return;
-            const unit = graph.unit || '';
-            this.hidePointTooltipMulti(section);
-            const tooltip = document.createElement('div');
-            tooltip.className = 'point-tooltip';
-
-            // Format X value based on axis type
-            const isEntityBased = graph.xAxisType === 'entity';
-            const xDisplay = isEntityBased
-                ? `${coords.x.toFixed(1)}${graph.xAxisUnit || ''}`
-                : minutesToTime(Math.round(coords.x));
-
-            tooltip.innerHTML = `
-                <span class="time">${xDisplay}</span>
-                <span class="value">${coords.y.toFixed(1)}${unit}</span>
-            `;
-
-            // Calculate position based on axis type
-            const yRange = graph.maxY - graph.minY;
-            let xRatio;
-            if (isEntityBased) {
-                const xMin = graph.xAxisMin ?? 0;
-                const xMax = graph.xAxisMax ?? 100;
-                const xRange = xMax - xMin;
-                const zoomLevel = graph.zoomLevel || 1;
-                const visibleRange = xRange / zoomLevel;
-                const startX = xMin + (graph.zoomOffset || 0) * xRange;
-                xRatio = (coords.x - startX) / visibleRange;
-            } else {
-                xRatio = (coords.x - (graph.zoomOffset || 0)) / (1440 / (graph.zoomLevel || 1));
-            }
-            const yRatio = 1 - (coords.y - graph.minY) / yRange;
-            tooltip.style.left = `${Math.max(0, Math.min(1, xRatio)) * 100}%`;
-            tooltip.style.top = `${Math.max(0, Math.min(1, yRatio)) * 100}%`;
-            tooltip.classList.add(yRatio * 100 < 20 ? 'below' : 'above');
-            graphContainer.appendChild(tooltip);
-        };
-
         // Helper to get coordinates from touch event
         const getTouchCoords = (touch) => {
             const scheduler = this.schedulers[entityId];
@@ -1806,7 +1879,7 @@ export class GraphHandler {
             const graph = scheduler.graphs[graphIndex];
             if (!graph) return null;
 
-            const rect = graphContainer.getBoundingClientRect();
+            rect = rect || graphContainer.getBoundingClientRect();
             const isEntityBased = graph.xAxisType === 'entity';
             const zoomLevel = graph.zoomLevel || 1;
             const zoomOffset = graph.zoomOffset || 0;
@@ -1852,6 +1925,7 @@ export class GraphHandler {
             touchStartTime = Date.now();
             hasMoved = false;
             ignoreTouch = false;
+            rect = graphContainer.getBoundingClientRect();
 
             // Ignore touches that originate on the controls menu
             const path = e.composedPath ? e.composedPath() : [];
@@ -1895,6 +1969,25 @@ export class GraphHandler {
             }
         }, { passive: false });
 
+        // Move the dragged point and redraw panned graphs once per frame
+        const drag = frameThrottle((touch) => {
+            const graph = this.schedulers[entityId]?.graphs?.[graphIndex];
+            const coords = graph && dragPointIndex >= 0 ? getTouchCoords(touch) : null;
+            if (!coords) return;
+
+            // Calculate tolerance based on X-axis type
+            const isEntityBased = graph.xAxisType === 'entity';
+            const xTolerance = isEntityBased
+                ? ((graph.xAxisMax ?? 100) - (graph.xAxisMin ?? 0)) * 0.005
+                : 1;
+            const hasConflict = graph.points.some((p, i) => i !== dragPointIndex && Math.abs(p.x - coords.x) < xTolerance);
+            if (!hasConflict) {
+                graph.points[dragPointIndex] = coords;
+                this.updateDraggedPointMulti(entityId, graphIndex, section, touchedPoint, dragPointIndex);
+            }
+        });
+        const render = frameThrottle(() => this.panel.updateGraphSection(entityId, graphIndex, section));
+
         graphContainer.addEventListener('touchmove', (e) => {
             const scheduler = this.schedulers[entityId];
             if (!scheduler || !Array.isArray(scheduler.graphs)) return;
@@ -1919,49 +2012,14 @@ export class GraphHandler {
                             touchedPoint.classList.add('dragging');
                             this.panel.saveUndoState(entityId);
                         }
-                        const coords = getTouchCoords(touch);
-                        if (coords) {
-                            // Calculate tolerance based on X-axis type
-                            const isEntityBased = graph.xAxisType === 'entity';
-                            const xTolerance = isEntityBased
-                                ? ((graph.xAxisMax ?? 100) - (graph.xAxisMin ?? 0)) * 0.005
-                                : 1;
-                            const hasConflict = graph.points.some((p, i) => i !== dragPointIndex && Math.abs(p.x - coords.x) < xTolerance);
-                            if (!hasConflict) {
-                                graph.points[dragPointIndex] = coords;
-
-                                // Move the point visually without full rerender to keep touch contact
-                                const rect = graphContainer.getBoundingClientRect();
-                                const zoomLevel = graph.zoomLevel || 1;
-
-                                let visibleRange, startX;
-                                if (isEntityBased) {
-                                    const xMin = graph.xAxisMin ?? 0;
-                                    const xMax = graph.xAxisMax ?? 100;
-                                    const xRange = xMax - xMin;
-                                    visibleRange = xRange / zoomLevel;
-                                    startX = xMin + (graph.zoomOffset || 0) * xRange;
-                                } else {
-                                    visibleRange = 1440 / zoomLevel;
-                                    startX = graph.zoomOffset || 0;
-                                }
-
-                                const yRange = graph.maxY - graph.minY;
-                                const xRatio = (coords.x - startX) / visibleRange;
-                                const yRatio = 1 - (coords.y - graph.minY) / yRange;
-                                touchedPoint.style.left = `${Math.max(0, Math.min(1, xRatio)) * 100}%`;
-                                touchedPoint.style.top = `${Math.max(0, Math.min(1, yRatio)) * 100}%`;
-                                this.updateCurrentValueMulti(entityId, graphIndex, section);
-                                showDragTooltip(coords);
-                            }
-                        }
+                        drag.schedule(touch);
                     } else {
                         // Started on empty area - pan (if zoomed)
                         const zoomLevel = graph.zoomLevel || 1;
                         if (zoomLevel > 1) {
                             e.preventDefault();
                             isPanning = true;
-                            const rect = graphContainer.getBoundingClientRect();
+                            rect = rect || graphContainer.getBoundingClientRect();
                             const deltaX = lastTouchX - touch.clientX;
 
                             // Calculate pan based on X-axis type
@@ -1979,7 +2037,7 @@ export class GraphHandler {
                                 const minutesPerPixel = (1440 / zoomLevel) / rect.width;
                                 graph.zoomOffset = Math.max(0, Math.min(1440 - 1440 / zoomLevel, (graph.zoomOffset || 0) + deltaX * minutesPerPixel));
                             }
-                            this.panel.updateGraphSection(entityId, graphIndex, section);
+                            render.schedule();
                         }
                     }
                     lastTouchX = touch.clientX;
@@ -2015,6 +2073,8 @@ export class GraphHandler {
         }, { passive: false });
 
         graphContainer.addEventListener('touchend', (e) => {
+            drag.flush();
+            render.flush();
             const touchDuration = Date.now() - touchStartTime;
             const now = Date.now();
 
@@ -0,0 +1,1769 @@
+/**
+ * Universal Scheduler - Lovelace Card Editing
+ * Imported by lovelace-card.js the first time a card is edited: the GUI
+ * config editor, and the methods and styles for editing schedules in the card
+ */
+
+import { CONTROLLABLE_DOMAINS, sharedSchedulers } from './utils.js';
+
+// Styles of the editing controls, added to the card styles
+const CARD_EDITING_STYLES = `
+    .scheduler-card-header .delete-btn {
+        background: none;
+        border: none;
+        padding: 4px;
+        margin: 0;
+        cursor: pointer;
+        color: var(--secondary-text-color);
+        opacity: 0.7;
+        transition: opacity 0.2s, color 0.2s;
+        display: flex;
+        align-items: center;
+    }
+
+    .scheduler-card-header .delete-btn:hover {
+        opacity: 1;
+        color: var(--error-color, #db4437);
+    }
+
+    .add-graph-btn {
+        padding: 6px 12px;
+        border-radius: 16px;
+        border: 1px dashed var(--primary-color, #03a9f4);
+        background: transparent;
+        color: var(--primary-color, #03a9f4);
+        font-size: 0.85rem;
+        cursor: pointer;
+        transition: all 0.2s;
+        display: flex;
+        align-items: center;
+        gap: 4px;
+    }
+
+    .add-graph-btn:hover {
+        background: rgba(var(--rgb-primary-color, 3, 169, 244), 0.1);
+    }
+
+    .add-graph-btn ha-icon {
+        --mdc-icon-size: 16px;
+    }
+
+    /* Graph settings collapsible */
+    .card-graph-settings-wrapper {
+        background: var(--secondary-background-color);
+        border-radius: 6px;
+        margin-bottom: 10px;
+        overflow: hidden;
+    }
+
+    .card-graph-settings-header {
+        display: flex;
+        align-items: center;
+        gap: 6px;
+        padding: 8px 10px;
+        cursor: pointer;
+        font-size: 0.85rem;
+        font-weight: 500;
+    }
+
+    .card-graph-settings-header:hover {
+        background: rgba(var(--rgb-primary-color), 0.08);
+    }
+
+    .card-graph-settings-header .collapse-indicator {
+        transition: transform 0.2s;
+        opacity: 0.6;
+        --mdc-icon-size: 16px;
+    }
+
+    .card-graph-settings-wrapper.collapsed .collapse-indicator {
+        transform: rotate(-90deg);
+    }
+
+    .card-graph-settings-body {
+        border-top: 1px solid var(--divider-color);
+        padding: 10px;
+    }
+
+    .card-graph-settings-wrapper.collapsed .card-graph-settings-body {
+        display: none;
+    }
+
+    .card-graph-settings {
+        display: flex;
+        gap: 10px;
+        flex-wrap: wrap;
+        align-items: center;
+    }
+
+    .card-graph-settings .input-group {
+        display: flex;
+        align-items: center;
+        gap: 6px;
+    }
+
+    .card-graph-settings label {
+        font-size: 0.8rem;
+        opacity: 0.8;
+    }
+
+    .card-graph-settings select,
+    .card-graph-settings input {
+        padding: 4px 8px;
+        border-radius: 4px;
+        border: 1px solid var(--divider-color);
+        background: var(--card-background-color);
+        color: var(--primary-text-color);
+        font-size: 0.8rem;
+    }
+
+    .card-graph-settings .danger {
+        padding: 4px 8px;
+        border-radius: 4px;
+        border: 1px solid var(--error-color, #db4437);
+        background: transparent;
+        color: var(--error-color, #db4437);
+        font-size: 0.75rem;
+        cursor: pointer;
+        display: flex;
+        align-items: center;
+        gap: 4px;
+    }
+
+    .card-graph-settings .danger:hover {
+        background: var(--error-color, #db4437);
+        color: white;
+    }
+
+    .card-graph-settings .danger ha-icon {
+        --mdc-icon-size: 14px;
+    }
+
+    /* Points editor */
+    .card-points-editor {
+        border: 1px solid var(--divider-color);
+        border-radius: 6px;
+        overflow: hidden;
+    }
+
+    .card-points-editor-header {
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        padding: 8px 12px;
+        background: var(--secondary-background-color);
+        cursor: pointer;
+        font-size: 0.85rem;
+        font-weight: 500;
+    }
+
+    .card-points-editor-header:hover {
+        background: rgba(var(--rgb-primary-color), 0.08);
+    }
+
+    .card-points-editor-header ha-icon {
+        --mdc-icon-size: 18px;
+        opacity: 0.7;
+        transition: transform 0.2s;
+    }
+
+    .card-points-editor.collapsed .card-points-editor-header ha-icon {
+        transform: rotate(-90deg);
+    }
+
+    .card-points-editor-content {
+        max-height: 200px;
+        overflow-y: auto;
+        border-top: 1px solid var(--divider-color);
+    }
+
+    .card-points-editor.collapsed .card-points-editor-content {
+        display: none;
+    }
+
+    .point-row {
+        display: flex;
+        align-items: center;
+        gap: 8px;
+        padding: 6px 12px;
+        border-bottom: 1px solid var(--divider-color);
+        font-size: 0.85rem;
+    }
+
+    .point-row:last-child {
+        border-bottom: none;
+    }
+
+    .point-row:hover {
+        background: rgba(var(--rgb-primary-color), 0.05);
+    }
+
+    .point-row .point-index {
+        width: 24px;
+        text-align: center;
+        opacity: 0.5;
+        font-size: 0.75rem;
+    }
+
+    .point-row input {
+        width: 70px;
+        padding: 4px 6px;
+        border-radius: 4px;
+        border: 1px solid var(--divider-color);
+        background: var(--card-background-color);
+        color: var(--primary-text-color);
+        font-size: 0.8rem;
+    }
+
+    .point-row .delete-point {
+        padding: 2px 6px;
+        background: none;
+        border: none;
+        color: var(--error-color, #f44336);
+        cursor: pointer;
+        opacity: 0.7;
+    }
+
+    .point-row .delete-point:hover {
+        opacity: 1;
+    }
+
+    .add-point-row {
+        display: flex;
+        align-items: center;
+        gap: 8px;
+        padding: 8px 12px;
+        border-top: 1px solid var(--divider-color);
+        background: rgba(var(--rgb-primary-color), 0.03);
+    }
+
+    .add-point-row input {
+        width: 70px;
+        padding: 4px 6px;
+        border-radius: 4px;
+        border: 1px solid var(--divider-color);
+        background: var(--card-background-color);
+        color: var(--primary-text-color);
+        font-size: 0.8rem;
+    }
+
+    .add-point-row button {
+        padding: 4px 10px;
+        border-radius: 4px;
+        border: 1px solid var(--divider-color);
+        background: var(--secondary-background-color);
+        color: var(--primary-text-color);
+        font-size: 0.8rem;
+        cursor: pointer;
+        display: flex;
+        align-items: center;
+        gap: 4px;
+    }
+
+    .add-point-row button:hover {
+        background: var(--primary-color);
+        color: white;
+    }
+
+    .no-scheduler .add-schedule-btn {
+        margin-top: 16px;
+        padding: 10px 20px;
+        border-radius: 8px;
+        border: 2px dashed var(--primary-color, #03a9f4);
+        background: transparent;
+        color: var(--primary-color, #03a9f4);
+        font-size: 0.95rem;
+        cursor: pointer;
+        transition: all 0.2s;
+        display: inline-flex;
+        align-items: center;
+        gap: 8px;
+        opacity: 1;
+    }
+
+    .no-scheduler .add-schedule-btn:hover {
+        background: rgba(var(--rgb-primary-color, 3, 169, 244), 0.1);
+        border-style: solid;
+    }
+
+    .no-scheduler .add-schedule-btn ha-icon {
+        font-size: 20px;
+        --mdc-icon-size: 20px;
+        opacity: 1;
+    }
+
+    /* Delete scheduler button */
+    .delete-scheduler-btn {
+        padding: 4px 10px;
+        border-radius: 4px;
+        border: 1px solid var(--error-color, #db4437);
+        background: transparent;
+        color: var(--error-color, #db4437);
+        font-size: 0.75rem;
+        cursor: pointer;
+        display: flex;
+        align-items: center;
+        gap: 4px;
+        margin-left: auto;
+    }
+
+    .delete-scheduler-btn:hover {
+        background: var(--error-color, #db4437);
+        color: white;
+    }
+
+    .delete-scheduler-btn ha-icon {
+        --mdc-icon-size: 14px;
+    }
+
+    /* Edit action buttons */
+    .edit-actions {
+        display: flex;
+        gap: 8px;
+        margin-bottom: 10px;
+        padding: 8px;
+        background: rgba(var(--rgb-primary-color), 0.08);
+        border-radius: 6px;
+        align-items: center;
+    }
+
+    .edit-actions .action-btn {
+        padding: 6px 12px;
+        border-radius: 4px;
+        border: 1px solid var(--divider-color);
+        background: var(--card-background-color);
+        color: var(--primary-text-color);
+        font-size: 0.8rem;
+        cursor: pointer;
+        display: flex;
+        align-items: center;
+        gap: 4px;
+        transition: all 0.2s;
+    }
+
+    .edit-actions .action-btn:hover:not(:disabled) {
+        border-color: var(--primary-color);
+        background: rgba(var(--rgb-primary-color), 0.1);
+    }
+
+    .edit-actions .action-btn:disabled {
+        opacity: 0.4;
+        cursor: not-allowed;
+    }
+
+    .edit-actions .action-btn.save {
+        background: var(--primary-color);
+        color: white;
+        border-color: var(--primary-color);
+    }
+
+    .edit-actions .action-btn.save:hover:not(:disabled) {
+        background: var(--primary-color);
+        filter: brightness(1.1);
+    }
+
+    .edit-actions .action-btn.reset {
+        color: var(--error-color, #f44336);
+        border-color: var(--error-color, #f44336);
+    }
+
+    .edit-actions .action-btn.reset:hover:not(:disabled) {
+        background: rgba(244, 67, 54, 0.1);
+    }
+
+    .edit-actions .spacer {
+        flex: 1;
+    }
+
+    .edit-actions .changes-indicator {
+        font-size: 0.75rem;
+        color: var(--warning-color, #ff9800);
+        display: flex;
+        align-items: center;
+        gap: 4px;
+    }
+`;
+
+// Card Editor for GUI configuration
+class UniversalSchedulerCardEditor extends HTMLElement {
+    constructor() {
+        super();
+        this._config = {};
+        this._hass = null;
+        this._schedulers = [];
+        this._filteredSchedulers = [];
+        this._showAutocomplete = false;
+        this._initialLoadDone = false;
+    }
+
+    set hass(hass) {
+        this._hass = hass;
+        // Only load schedulers on initial load, not on every hass update
+        if (!this._initialLoadDone) {
+            this._loadSchedulers();
+        }
+    }
+
+    setConfig(config) {
+        this._config = config;
+        this._render();
+    }
+
+    async _loadSchedulers() {
+        if (!this._hass) return;
+
+        // Build a set of entities that already have schedulers
+        let schedulerEntityIds = new Set();
+
+        try {
+            // Load schedulers from WebSocket API
+            const schedulers = await sharedSchedulers.fetch(this._hass);
+            schedulerEntityIds = new Set(Object.keys(schedulers));
+        } catch (e) {
+            console.error('Failed to load schedulers:', e);
+            // Fallback: try to find from switch entities
+            Object.keys(this._hass.states)
+                .filter(id => id.startsWith('switch.universal_scheduler_'))
+                .forEach(id => {
+                    schedulerEntityIds.add(id.replace('switch.universal_scheduler_', '').replace(/_/g, '.'));
+                });
+        }
+
+        // Get all controllable entities from HA
+        const controllableEntities = Object.keys(this._hass.states)
+            .filter(entityId => {
+                const domain = entityId.split('.')[0];
+                return CONTROLLABLE_DOMAINS.includes(domain);
+            })
+            .sort();
+
+        // Create list of all entities, marking those with schedulers
+        this._schedulers = controllableEntities.map(entityId => {
+            const state = this._hass.states[entityId];
+            const domain = entityId.split('.')[0];
+            const hasScheduler = schedulerEntityIds.has(entityId);
+            return {
+                entityId: entityId,
+                switchEntity: hasScheduler ? `switch.universal_scheduler_${entityId.replace(/\./g, '_')}` : null,
+                name: state?.attributes?.friendly_name || entityId,
+                domain: domain,
+                hasScheduler: hasScheduler
+            };
+        });
+
+        this._filteredSchedulers = [...this._schedulers];
+        this._initialLoadDone = true;
+        this._render();
+    }
+
+    _render() {
+        if (!this._hass) return;
+
+        // Find current selected scheduler name
+        const currentScheduler = this._schedulers.find(s =>
+            s.switchEntity === this._config.entity || s.entityId === this._config.entity
+        );
+        const currentValue = currentScheduler ? currentScheduler.name : (this._config.entity || '');
+
+        this.innerHTML = `
+            <style>
+                .editor-row {
+                    display: flex;
+                    flex-direction: column;
+                    gap: 8px;
+                    margin-bottom: 16px;
+                }
+                .editor-row label {
+                    font-weight: 500;
+                    font-size: 0.9rem;
+                }
+                .editor-row select,
+                .editor-row input {
+                    padding: 8px;
+                    border-radius: 4px;
+                    border: 1px solid var(--divider-color);
+                    background: var(--secondary-background-color);
+                    color: var(--primary-text-color);
+                    font-size: 0.9rem;
+                }
+                .editor-row .hint {
+                    font-size: 0.8rem;
+                    opacity: 0.7;
+                }
+                .editor-checkbox {
+                    display: flex;
+                    align-items: center;
+                    gap: 8px;
+                    margin-bottom: 12px;
+                }
+                .editor-checkbox input[type="checkbox"] {
+                    width: 18px;
+                    height: 18px;
+                }
+                .autocomplete-wrapper {
+                    position: relative;
+                }
+                .autocomplete-list {
+                    position: absolute;
+                    top: 100%;
+                    left: 0;
+                    right: 0;
+                    background: var(--card-background-color, #fff);
+                    border: 1px solid var(--divider-color);
+                    border-radius: 4px;
+                    max-height: 200px;
+                    overflow-y: auto;
+                    z-index: 100;
+                    box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+                    display: none;
+                }
+                .autocomplete-list.show {
+                    display: block;
+                }
+                .autocomplete-item {
+                    padding: 10px 12px;
+                    cursor: pointer;
+                    display: flex;
+                    align-items: center;
+                    gap: 10px;
+                    border-bottom: 1px solid var(--divider-color);
+                }
+                .autocomplete-item:last-child {
+                    border-bottom: none;
+                }
+                .autocomplete-item:hover {
+                    background: rgba(var(--rgb-primary-color), 0.1);
+                }
+                .autocomplete-item .item-name {
+                    flex: 1;
+                    font-weight: 500;
+                }
+                .autocomplete-item .item-entity {
+                    font-size: 0.8rem;
+                    opacity: 0.6;
+                }
+                .autocomplete-item ha-icon {
+                    --mdc-icon-size: 20px;
+                    color: var(--primary-color);
+                }
+                .autocomplete-item.has-scheduler {
+                    background: rgba(var(--rgb-success-color, 76, 175, 80), 0.1);
+                }
+                .autocomplete-item .scheduler-badge {
+                    font-size: 0.7rem;
+                    padding: 2px 6px;
+                    border-radius: 8px;
+                    background: var(--success-color, #4caf50);
+                    color: white;
+                    white-space: nowrap;
+                }
+                .no-results {
+                    padding: 12px;
+                    text-align: center;
+                    opacity: 0.6;
+                    font-size: 0.9rem;
+                }
+            </style>
+
+            <div class="editor-row">
+                <label>Target Entity</label>
+                <div class="autocomplete-wrapper">
+                    <input type="text" id="entity-search" value="${currentValue}" placeholder="Search entities..." autocomplete="off">
+                    <div class="autocomplete-list" id="autocomplete-list">
+                        ${this._renderAutocompleteItems()}
+                    </div>
+                </div>
+                <span class="hint">Search and select an entity to schedule (entities with existing schedules are highlighted)</span>
+            </div>
+
+            <div class="editor-row">
+                <label>Graph Index (optional)</label>
+                <input type="number" id="graph_index" min="0" value="${this._config.graph_index ?? ''}" placeholder="All graphs">
+                <span class="hint">Leave empty to show all graphs, or enter index (0, 1, 2...) for specific graph</span>
+            </div>
+
+            <div class="editor-row">
+                <label>Graph Height</label>
+                <input type="number" id="graph_height" min="100" max="600" value="${this._config.graph_height || 200}" placeholder="200">
+                <span class="hint">Height of the graph in pixels</span>
+            </div>
+
+            <div class="editor-checkbox">
+                <input type="checkbox" id="show_header" ${this._config.show_header !== false ? 'checked' : ''}>
+                <label for="show_header">Show card header</label>
+            </div>
+
+            <div class="editor-checkbox">
+                <input type="checkbox" id="allow_edit" ${this._config.allow_edit !== false ? 'checked' : ''}>
+                <label for="allow_edit">Allow editing points</label>
+            </div>
+
+            <div class="editor-checkbox" style="margin-left: 24px; ${this._config.allow_edit === false ? 'opacity: 0.5; pointer-events: none;' : ''}">
+                <input type="checkbox" id="show_graph_settings" ${this._config.show_graph_settings && this._config.allow_edit !== false ? 'checked' : ''} ${this._config.allow_edit === false ? 'disabled' : ''}>
+                <label for="show_graph_settings">Show graph settings</label>
+            </div>
+
+            <div class="editor-checkbox" style="margin-left: 48px; ${this._config.allow_edit === false || !this._config.show_graph_settings ? 'opacity: 0.5; pointer-events: none;' : ''}">
+                <input type="checkbox" id="allow_schedule_editing" ${this._config.allow_schedule_editing && this._config.allow_edit !== false && this._config.show_graph_settings ? 'checked' : ''} ${this._config.allow_edit === false || !this._config.show_graph_settings ? 'disabled' : ''}>
+                <label for="allow_schedule_editing">Allow editing of schedules</label>
+            </div>
+
+            <div class="editor-checkbox" style="margin-left: 48px; ${this._config.allow_edit === false || !this._config.show_graph_settings ? 'opacity: 0.5; pointer-events: none;' : ''}">
+                <input type="checkbox" id="allow_advanced_settings" ${this._config.allow_advanced_settings && this._config.allow_edit !== false && this._config.show_graph_settings ? 'checked' : ''} ${this._config.allow_edit === false || !this._config.show_graph_settings ? 'disabled' : ''}>
+                <label for="allow_advanced_settings">Allow advanced settings (update interval, override behavior)</label>
+            </div>
+
+            <div class="editor-checkbox" style="margin-left: 24px; ${this._config.allow_edit === false ? 'opacity: 0.5; pointer-events: none;' : ''}">
+                <input type="checkbox" id="show_points_editor" ${this._config.show_points_editor && this._config.allow_edit !== false ? 'checked' : ''} ${this._config.allow_edit === false ? 'disabled' : ''}>
+                <label for="show_points_editor">Show points editor</label>
+            </div>
+
+            <div class="editor-checkbox" style="margin-left: 24px; ${this._config.allow_edit === false ? 'opacity: 0.5; pointer-events: none;' : ''}">
+                <input type="checkbox" id="show_weekdays" ${this._config.show_weekdays && this._config.allow_edit !== false ? 'checked' : ''} ${this._config.allow_edit === false ? 'disabled' : ''}>
+                <label for="show_weekdays">Show weekday selector</label>
+            </div>
+
+            <div class="editor-checkbox">
+                <input type="checkbox" id="show_current_value" ${this._config.show_current_value !== false ? 'checked' : ''}>
+                <label for="show_current_value">Show current value display</label>
+            </div>
+
+            <div class="editor-checkbox">
+                <input type="checkbox" id="allow_toggle" ${this._config.allow_toggle ? 'checked' : ''}>
+                <label for="allow_toggle">Allow toggling scheduler on/off from header</label>
+            </div>
+        `;
+
+        // Setup event listeners
+        this._setupEventListeners();
+    }
+
+    _renderAutocompleteItems() {
+        if (this._filteredSchedulers.length === 0) {
+            return '<div class="no-results">No entities found</div>';
+        }
+
+        return this._filteredSchedulers.map(scheduler => `
+            <div class="autocomplete-item ${scheduler.hasScheduler ? 'has-scheduler' : ''}" data-entity="${scheduler.entityId}" data-has-scheduler="${scheduler.hasScheduler}">
+                <ha-icon icon="${this._getDomainIcon(scheduler.domain)}"></ha-icon>
+                <span class="item-name">${scheduler.name}</span>
+                <span class="item-entity">${scheduler.entityId}</span>
+                ${scheduler.hasScheduler ? '<span class="scheduler-badge">Has Schedule</span>' : ''}
+            </div>
+        `).join('');
+    }
+
+    _getDomainIcon(domain) {
+        const icons = {
+            'light': 'mdi:lightbulb',
+            'climate': 'mdi:thermostat',
+            'number': 'mdi:numeric',
+            'input_number': 'mdi:ray-vertex',
+            'fan': 'mdi:fan',
+            'cover': 'mdi:window-shutter',
+            'humidifier': 'mdi:air-humidifier',
+            'media_player': 'mdi:speaker'
+        };
+        return icons[domain] || 'mdi:calendar-clock';
+    }
+
+    _setupEventListeners() {
+        const searchInput = this.querySelector('#entity-search');
+        const autocompleteList = this.querySelector('#autocomplete-list');
+
+        // Search input events
+        searchInput.addEventListener('focus', () => {
+            this._filteredSchedulers = [...this._schedulers];
+            this._updateAutocompleteList();
+            autocompleteList.classList.add('show');
+        });
+
+        searchInput.addEventListener('input', (e) => {
+            const query = e.target.value.toLowerCase();
+            this._filteredSchedulers = this._schedulers.filter(s =>
+                s.name.toLowerCase().includes(query) ||
+                s.entityId.toLowerCase().includes(query)
+            );
+            this._updateAutocompleteList();
+            autocompleteList.classList.add('show');
+        });
+
+        searchInput.addEventListener('blur', () => {
+            // Delay to allow click on autocomplete item
+            setTimeout(() => {
+                autocompleteList.classList.remove('show');
+            }, 200);
+        });
+
+        // Autocomplete item clicks
+        autocompleteList.addEventListener('click', (e) => {
+            const item = e.target.closest('.autocomplete-item');
+            if (item) {
+                const entityId = item.dataset.entity;
+                const scheduler = this._schedulers.find(s => s.entityId === entityId);
+                if (scheduler) {
+                    searchInput.value = scheduler.name;
+                    // Store entityId directly - the card will handle creating/loading scheduler
+                    this._valueChanged('entity', entityId);
+                }
+                autocompleteList.classList.remove('show');
+            }
+        });
+
+        // Other field listeners
+        this.querySelector('#graph_index').addEventListener('change', (e) => {
+            const val = e.target.value === '' ? undefined : parseInt(e.target.value);
+            this._valueChanged('graph_index', val);
+        });
+        this.querySelector('#graph_height').addEventListener('change', (e) => this._valueChanged('graph_height', parseInt(e.target.value)));
+        this.querySelector('#show_header').addEventListener('change', (e) => this._valueChanged('show_header', e.target.checked));
+        this.querySelector('#allow_edit').addEventListener('change', (e) => {
+            this._valueChanged('allow_edit', e.target.checked);
+            // If disabling edit, also disable dependent options
+            if (!e.target.checked) {
+                this._valueChanged('show_graph_settings', false);
+                this._valueChanged('show_points_editor', false);
+                this._valueChanged('allow_schedule_editing', false);
+                this._valueChanged('allow_advanced_settings', false);
+            }
+            this._render();
+        });
+        this.querySelector('#show_graph_settings').addEventListener('change', (e) => {
+            this._valueChanged('show_graph_settings', e.target.checked);
+            // If disabling graph settings, also disable allow_schedule_editing and allow_advanced_settings
+            if (!e.target.checked) {
+                this._valueChanged('allow_schedule_editing', false);
+                this._valueChanged('allow_advanced_settings', false);
+            }
+            this._render();
+        });
+        this.querySelector('#allow_schedule_editing').addEventListener('change', (e) => this._valueChanged('allow_schedule_editing', e.target.checked));
+        this.querySelector('#allow_advanced_settings').addEventListener('change', (e) => this._valueChanged('allow_advanced_settings', e.target.checked));
+        this.querySelector('#show_points_editor').addEventListener('change', (e) => this._valueChanged('show_points_editor', e.target.checked));
+        this.querySelector('#show_weekdays').addEventListener('change', (e) => this._valueChanged('show_weekdays', e.target.checked));
+        this.querySelector('#show_current_value').addEventListener('change', (e) => this._valueChanged('show_current_value', e.target.checked));
+        this.querySelector('#allow_toggle').addEventListener('change', (e) => this._valueChanged('allow_toggle', e.target.checked));
+    }
+
+    _updateAutocompleteList() {
+        const list = this.querySelector('#autocomplete-list');
+        if (list) {
+            list.innerHTML = this._renderAutocompleteItems();
+        }
+    }
+
+    _valueChanged(key, value) {
+        if (value === undefined || value === '') {
+            const newConfig = { ...this._config };
+            delete newConfig[key];
+            this._config = newConfig;
+        } else {
+            this._config = { ...this._config, [key]: value };
+        }
+
+        const event = new CustomEvent('config-changed', {
+            detail: { config: this._config },
+            bubbles: true,
+            composed: true
+        });
+        this.dispatchEvent(event);
+    }
+}
+
+// Editing methods, added to UniversalSchedulerCard by installCardEditing
+class CardEditing {
+    _renderEditActions() {
+        const hasChanges = this._pendingChanges !== null;
+        const canUndo = this._undoStack.length > 0;
+        const canRedo = this._redoStack.length > 0;
+        if (!hasChanges && !canUndo && !canRedo) return '';
+
+        return `
+            <div class="edit-actions">
+                <button class="action-btn" data-action="undo" ${!canUndo ? 'disabled' : ''}>
+                    <ha-icon icon="mdi:undo"></ha-icon> Undo
+                </button>
+                <button class="action-btn" data-action="redo" ${!canRedo ? 'disabled' : ''}>
+                    <ha-icon icon="mdi:redo"></ha-icon> Redo
+                </button>
+                <div class="spacer"></div>
+                ${hasChanges ? `
+                    <span class="changes-indicator">
+                        <ha-icon icon="mdi:circle-medium"></ha-icon> Unsaved changes
+                    </span>
+                ` : ''}
+                <button class="action-btn reset" data-action="reset" ${!hasChanges ? 'disabled' : ''}>
+                    <ha-icon icon="mdi:close"></ha-icon> Reset
+                </button>
+                <button class="action-btn save" data-action="save" ${!hasChanges ? 'disabled' : ''}>
+                    <ha-icon icon="mdi:content-save"></ha-icon> Save
+                </button>
+            </div>
+        `;
+    }
+
+    _setupEditingListeners(container) {
+        // Edit action buttons (undo, redo, save, reset)
+        container.querySelector('[data-action="undo"]')?.addEventListener('click', () => {
+            this._undo();
+        });
+
+        container.querySelector('[data-action="redo"]')?.addEventListener('click', () => {
+            this._redo();
+        });
+
+        container.querySelector('[data-action="save"]')?.addEventListener('click', () => {
+            this._saveChanges();
+        });
+
+        container.querySelector('[data-action="reset"]')?.addEventListener('click', () => {
+            this._resetChanges();
+        });
+
+        // Add graph button
+        container.querySelector('[data-action="addGraph"]')?.addEventListener('click', () => {
+            this._addGraph();
+        });
+
+        // Delete graph button
+        container.querySelector('[data-action="deleteGraph"]')?.addEventListener('click', () => {
+            this._deleteGraph();
+        });
+
+        // Create scheduler button (when no scheduler exists)
+        container.querySelector('[data-action="createScheduler"]')?.addEventListener('click', () => {
+            this._createScheduler();
+        });
+
+        // Delete scheduler button
+        container.querySelector('[data-action="deleteScheduler"]')?.addEventListener('click', () => {
+            this._deleteScheduler();
+        });
+
+        // Weekday buttons
+        container.querySelectorAll('.card-weekday-btn').forEach(btn => {
+            btn.addEventListener('click', () => {
+                if (this._config.allow_edit === false) return;
+                const weekday = parseInt(btn.dataset.weekday);
+                this._toggleWeekday(weekday);
+            });
+        });
+
+        // Settings toggle
+        container.querySelector('[data-action="toggleSettings"]')?.addEventListener('click', () => {
+            const wrapper = container.querySelector('.card-graph-settings-wrapper');
+            wrapper?.classList.toggle('collapsed');
+        });
+
+        // Points editor toggle
+        container.querySelector('[data-action="togglePointsEditor"]')?.addEventListener('click', () => {
+            const editor = container.querySelector('.card-points-editor');
+            editor?.classList.toggle('collapsed');
+        });
+
+        // Graph settings changes
+        container.querySelectorAll('[data-setting]').forEach(el => {
+            const setting = el.dataset.setting;
+
+            if (el.classList.contains('toggle-switch')) {
+                el.addEventListener('click', () => {
+                    if (this._config.allow_edit === false) return;
+                    el.classList.toggle('active');
+                    this._updateGraphSetting(setting, el.classList.contains('active'));
+                });
+            } else {
+                el.addEventListener('change', (e) => {
+                    if (this._config.allow_edit === false) return;
+                    let value = e.target.value;
+                    // Parse numeric settings
+                    const numericSettings = ['ySnap', 'xSnap', 'minY', 'maxY', 'xAxisMin', 'xAxisMax'];
+                    if (el.type === 'number' || numericSettings.includes(setting)) {
+                        value = parseFloat(value);
+                    }
+                    this._updateGraphSetting(setting, value);
+                });
+            }
+        });
+
+        // Points editor inputs
+        container.querySelectorAll('.point-row').forEach(row => {
+            const index = parseInt(row.dataset.pointIndex);
+
+            row.querySelector('[data-field="time"]')?.addEventListener('change', (e) => {
+                if (this._config.allow_edit === false) return;
+                const minutes = this._timeToMinutes(e.target.value);
+                if (minutes !== null) {
+                    this._updatePoint(index, 'x', minutes);
+                }
+            });
+
+            row.querySelector('[data-field="x"]')?.addEventListener('change', (e) => {
+                if (this._config.allow_edit === false) return;
+                this._updatePoint(index, 'x', parseFloat(e.target.value));
+            });
+
+            row.querySelector('[data-field="y"]')?.addEventListener('change', (e) => {
+                if (this._config.allow_edit === false) return;
+                this._updatePoint(index, 'y', parseFloat(e.target.value));
+            });
+
+            row.querySelector('[data-action="deletePoint"]')?.addEventListener('click', () => {
+                if (this._config.allow_edit === false) return;
+                this._deletePoint(index);
+            });
+        });
+
+        // Add point button
+        container.querySelector('[data-action="addPoint"]')?.addEventListener('click', () => {
+            if (this._config.allow_edit === false) return;
+            this._addPoint();
+        });
+
+        // Setup graph interaction
+        this._setupGraphInteraction();
+    }
+
+    _renderGraphSettings(graph) {
+        const ySnapValue = graph.ySnap ?? 0;
+        const xSnapValue = graph.xSnap ?? 0;
+        const isEntityBased = graph.xAxisType === 'entity';
+        const collapsed = !this._isEditing ? 'collapsed' : '';
+
+        // Get available attributes for the entity
+        const attributes = this._scheduler?.availableAttributes || [];
+        const attributeOptions = [`<option value="" ${!graph.attribute ? 'selected' : ''}>State</option>`]
+            .concat(
+                attributes.map(attr => `<option value="${attr}" ${graph.attribute === attr ? 'selected' : ''}>${attr}</option>`)
+            ).join('');
+
+        const graphs = this._scheduler?.graphs || [];
+        const canDelete = graphs.length > 1;
+
+        return `
+            <div class="card-graph-settings-wrapper ${collapsed}">
+                <div class="card-graph-settings-header" data-action="toggleSettings">
+                    <ha-icon class="collapse-indicator" icon="mdi:chevron-down"></ha-icon>
+                    <span>Graph Settings</span>
+                </div>
+                <div class="card-graph-settings-body">
+                    ${this._config.allow_schedule_editing ? `
+                        <div class="card-graph-settings" style="margin-bottom: 8px; padding-bottom: 8px; border-bottom: 1px solid var(--divider-color, rgba(0,0,0,0.12));">
+                            <div class="input-group" style="flex: 1;">
+                                <label>Label</label>
+                                <input type="text" data-setting="label" value="${graph.label || ''}" placeholder="Schedule name">
+                            </div>
+                        </div>
+                    ` : ''}
+                    ${this._config.allow_advanced_settings ? `
+                        <div class="card-graph-settings" style="margin-bottom: 8px; padding-bottom: 8px; border-bottom: 1px solid var(--divider-color, rgba(0,0,0,0.12));">
+                            <div class="input-group">
+                                <label>Update interval</label>
+                                <select data-setting="updateInterval">
+                                    <option value="1" ${(this._scheduler?.updateInterval || 60) === 1 ? 'selected' : ''}>1 sec</option>
+                                    <option value="5" ${(this._scheduler?.updateInterval || 60) === 5 ? 'selected' : ''}>5 sec</option>
+                                    <option value="10" ${(this._scheduler?.updateInterval || 60) === 10 ? 'selected' : ''}>10 sec</option>
+                                    <option value="30" ${(this._scheduler?.updateInterval || 60) === 30 ? 'selected' : ''}>30 sec</option>
+                                    <option value="60" ${(this._scheduler?.updateInterval || 60) === 60 ? 'selected' : ''}>1 min</option>
+                                    <option value="300" ${(this._scheduler?.updateInterval || 60) === 300 ? 'selected' : ''}>5 min</option>
+                                    <option value="600" ${(this._scheduler?.updateInterval || 60) === 600 ? 'selected' : ''}>10 min</option>
+                                </select>
+                            </div>
+                            <div class="input-group">
+                                <label>Override behavior</label>
+                                <select data-setting="overrideBehavior">
+                                    <option value="none" ${(this._scheduler?.overrideBehavior || 'none') === 'none' ? 'selected' : ''}>Ignore</option>
+                                    <option value="until_next" ${(this._scheduler?.overrideBehavior || 'none') === 'until_next' ? 'selected' : ''}>Until next change</option>
+                                    <option value="until_day_end" ${(this._scheduler?.overrideBehavior || 'none') === 'until_day_end' ? 'selected' : ''}>Until end of day</option>
+                                    <option value="for_duration" ${(this._scheduler?.overrideBehavior || 'none') === 'for_duration' ? 'selected' : ''}>For duration</option>
+                                    <option value="until_reenabled" ${(this._scheduler?.overrideBehavior || 'none') === 'until_reenabled' ? 'selected' : ''}>Until re-enabled</option>
+                                </select>
+                            </div>
+                            <div class="input-group override-duration-group" style="display: ${(this._scheduler?.overrideBehavior || 'none') === 'for_duration' ? 'flex' : 'none'};">
+                                <label>Duration</label>
+                                <input type="text" data-setting="overrideDuration" value="${this._formatSecondsToDuration(this._scheduler?.overrideDuration || 3600)}" placeholder="DD:HH:MM:SS" style="width: 100px;">
+                            </div>
+                        </div>
+                    ` : ''}
+                    <div class="card-graph-settings">
+                        <div class="input-group">
+                            <label>Mode</label>
+                            <select data-setting="mode">
+                                <option value="linear" ${graph.mode === 'linear' ? 'selected' : ''}>Linear</option>
+                                <option value="smooth" ${graph.mode === 'smooth' ? 'selected' : ''}>Smooth</option>
+                                <option value="step" ${graph.mode === 'step' ? 'selected' : ''}>Step</option>
+                            </select>
+                        </div>
+                        <div class="input-group">
+                            <label>Step to min</label>
+                            <div class="toggle-switch small ${graph.stepToZero ? 'active' : ''}" data-setting="stepToZero"></div>
+                        </div>
+                        <div class="input-group">
+                            <label>Attribute</label>
+                            <select data-setting="attribute">
+                                ${attributeOptions}
+                            </select>
+                        </div>
+                        <div class="input-group">
+                            <label>Y-Min</label>
+                            <input type="number" data-setting="minY" value="${graph.minY}" style="width: 60px;">
+                        </div>
+                        <div class="input-group">
+                            <label>Y-Max</label>
+                            <input type="number" data-setting="maxY" value="${graph.maxY}" style="width: 60px;">
+                        </div>
+                        <div class="input-group">
+                            <label>Y-Snap</label>
+                            <select data-setting="ySnap">
+                                <option value="0" ${ySnapValue === 0 ? 'selected' : ''}>Off</option>
+                                <option value="0.1" ${ySnapValue === 0.1 ? 'selected' : ''}>0.1</option>
+                                <option value="0.5" ${ySnapValue === 0.5 ? 'selected' : ''}>0.5</option>
+                                <option value="1" ${ySnapValue === 1 ? 'selected' : ''}>1</option>
+                                <option value="5" ${ySnapValue === 5 ? 'selected' : ''}>5</option>
+                                <option value="10" ${ySnapValue === 10 ? 'selected' : ''}>10</option>
+                            </select>
+                        </div>
+                    </div>
+                    <div class="card-graph-settings" style="margin-top: 8px; padding-top: 8px; border-top: 1px solid var(--divider-color, rgba(0,0,0,0.12));">
+                        <div class="input-group">
+                            <label>X-Axis</label>
+                            <select data-setting="xAxisType">
+                                <option value="time" ${!isEntityBased ? 'selected' : ''}>Time (24h)</option>
+                                <option value="entity" ${isEntityBased ? 'selected' : ''}>Entity</option>
+                            </select>
+                        </div>
+                        ${isEntityBased ? `
+                            <div class="input-group">
+                                <label>X-Entity</label>
+                                <input type="text" data-setting="xAxisEntity" value="${graph.xAxisEntity || ''}" placeholder="sensor.xxx" style="width: 120px;">
+                            </div>
+                            <div class="input-group">
+                                <label>X-Min</label>
+                                <input type="number" data-setting="xAxisMin" value="${graph.xAxisMin ?? 0}" style="width: 60px;">
+                            </div>
+                            <div class="input-group">
+                                <label>X-Max</label>
+                                <input type="number" data-setting="xAxisMax" value="${graph.xAxisMax ?? 100}" style="width: 60px;">
+                            </div>
+                            <div class="input-group">
+                                <label>X-Unit</label>
+                                <input type="text" data-setting="xAxisUnit" value="${graph.xAxisUnit || ''}" placeholder="°C" style="width: 50px;">
+                            </div>
+                        ` : ''}
+                        <div class="input-group">
+                            <label>X-Snap</label>
+                            <select data-setting="xSnap">
+                                <option value="0" ${xSnapValue === 0 ? 'selected' : ''}>Off</option>
+                                ${isEntityBased ? `
+                                    <option value="0.1" ${xSnapValue === 0.1 ? 'selected' : ''}>0.1</option>
+                                    <option value="0.5" ${xSnapValue === 0.5 ? 'selected' : ''}>0.5</option>
+                                    <option value="1" ${xSnapValue === 1 ? 'selected' : ''}>1</option>
+                                    <option value="5" ${xSnapValue === 5 ? 'selected' : ''}>5</option>
+                                    <option value="10" ${xSnapValue === 10 ? 'selected' : ''}>10</option>
+                                ` : `
+                                    <option value="1" ${xSnapValue === 1 ? 'selected' : ''}>1 min</option>
+                                    <option value="5" ${xSnapValue === 5 ? 'selected' : ''}>5 min</option>
+                                    <option value="10" ${xSnapValue === 10 ? 'selected' : ''}>10 min</option>
+                                    <option value="15" ${xSnapValue === 15 ? 'selected' : ''}>15 min</option>
+                                    <option value="30" ${xSnapValue === 30 ? 'selected' : ''}>30 min</option>
+                                    <option value="60" ${xSnapValue === 60 ? 'selected' : ''}>1 hour</option>
+                                `}
+                            </select>
+                        </div>
+                        ${canDelete ? `
+                            <button class="danger" data-action="deleteGraph" title="Delete this graph">
+                                <ha-icon icon="mdi:delete"></ha-icon> Delete Graph
+                            </button>
+                        ` : ''}
+                    </div>
+                </div>
+            </div>
+        `;
+    }
+
+    _renderPointsEditor(graph, isEntityBased) {
+        const points = graph.points || [];
+
+        return `
+            <div class="card-points-editor collapsed">
+                <div class="card-points-editor-header" data-action="togglePointsEditor">
+                    <span>Edit Points (${points.length})</span>
+                    <ha-icon icon="mdi:chevron-down"></ha-icon>
+                </div>
+                <div class="card-points-editor-content">
+                    ${points.map((p, i) => `
+                        <div class="point-row" data-point-index="${i}">
+                            <span class="point-index">${i + 1}</span>
+                            ${isEntityBased ? `
+                                <input type="number" data-field="x" value="${p.x}" placeholder="X">
+                            ` : `
+                                <input type="text" data-field="time" value="${this._minutesToTime(p.x)}" placeholder="HH:MM">
+                            `}
+                            <input type="number" data-field="y" value="${p.y}" placeholder="Value">
+                            <button class="delete-point" data-action="deletePoint">×</button>
+                        </div>
+                    `).join('')}
+                    <div class="add-point-row">
+                        ${isEntityBased ? `
+                            <input type="number" data-new-x placeholder="X Value">
+                        ` : `
+                            <input type="text" data-new-time placeholder="HH:MM">
+                        `}
+                        <input type="number" data-new-y placeholder="Value">
+                        <button data-action="addPoint">
+                            <ha-icon icon="mdi:plus"></ha-icon> Add
+                        </button>
+                    </div>
+                </div>
+            </div>
+        `;
+    }
+
+    _timeToMinutes(timeStr) {
+        if (!timeStr) return null;
+        const match = timeStr.match(/^(\d{1,2}):(\d{2})$/);
+        if (!match) return null;
+        const hours = parseInt(match[1], 10);
+        const mins = parseInt(match[2], 10);
+        if (hours < 0 || hours > 23 || mins < 0 || mins > 59) return null;
+        return hours * 60 + mins;
+    }
+
+    _parseDurationToSeconds(durationStr) {
+        // Parse duration string in DD:HH:MM:SS format to total seconds.
+        // Also accepts partial formats like HH:MM:SS, MM:SS, or just SS.
+        if (!durationStr || typeof durationStr !== 'string') return 3600; // Default 1 hour
+
+        const parts = durationStr.split(':').map(p => parseInt(p.trim()) || 0);
+
+        // Pad to 4 parts (DD:HH:MM:SS)
+        while (parts.length < 4) {
+            parts.unshift(0);
+        }
+
+        const [days, hours, minutes, seconds] = parts;
+        return (days * 86400) + (hours * 3600) + (minutes * 60) + seconds;
+    }
+
+    _formatSecondsToDuration(totalSeconds) {
+        if (!totalSeconds || totalSeconds <= 0) return '00:01:00:00'; // Default 1 hour
+        const days = Math.floor(totalSeconds / 86400);
+        const hours = Math.floor((totalSeconds % 86400) / 3600);
+        const mins = Math.floor((totalSeconds % 3600) / 60);
+        const secs = totalSeconds % 60;
+        return `${days.toString().padStart(2, '0')}:${hours.toString().padStart(2, '0')}:${mins.toString().padStart(2, '0')}:${secs.toString().padStart(2, '0')}`;
+    }
+
+    _setupGraphInteraction() {
+        const graphContainer = this.shadowRoot.querySelector('[data-graph]');
+        if (!graphContainer || this._config.allow_edit === false) return;
+
+        const graph = this._getCurrentGraph();
+        if (!graph) return;
+
+        // Mouse events for dragging points
+        graphContainer.addEventListener('mousedown', (e) => this._handleMouseDown(e));
+        graphContainer.addEventListener('dblclick', (e) => this._handleDoubleClick(e));
+    }
+
+    _handleMouseDown(e) {
+        if (this._config.allow_edit === false) return;
+
+        const point = e.target.closest('.point');
+        if (point) {
+            e.preventDefault();
+            const index = parseInt(point.dataset.index);
+            this._startDrag(index, e);
+        }
+    }
+
+    _handleDoubleClick(e) {
+        if (this._config.allow_edit === false) return;
+
+        const graphContainer = this.shadowRoot.querySelector('[data-graph]');
+        const rect = graphContainer.getBoundingClientRect();
+        const graph = this._getDisplayGraph();
+        if (!graph) return;
+
+        const isEntityBased = graph.xAxisType === 'entity';
+        const xMin = isEntityBased ? (graph.xAxisMin ?? 0) : 0;
+        const xMax = isEntityBased ? (graph.xAxisMax ?? 100) : 1440;
+
+        const xRatio = (e.clientX - rect.left) / rect.width;
+        const yRatio = 1 - (e.clientY - rect.top) / rect.height;
+
+        let x = xMin + xRatio * (xMax - xMin);
+        let y = graph.minY + yRatio * (graph.maxY - graph.minY);
+
+        // Snap
+        const xSnap = graph.xSnap || 0;
+        const ySnap = graph.ySnap || 0;
+        if (xSnap > 0) x = Math.round(x / xSnap) * xSnap;
+        if (ySnap > 0) y = Math.round(y / ySnap) * ySnap;
+
+        x = Math.max(xMin, Math.min(xMax, x));
+        y = Math.max(graph.minY, Math.min(graph.maxY, y));
+
+        // Add the point
+        const graphIndex = this._getGraphIndex();
+        const newPoints = [...(graph.points || []), { x, y }].sort((a, b) => a.x - b.x);
+
+        this._stageChange(graphIndex, 'points', newPoints);
+    }
+
+    _startDrag(pointIndex, startEvent) {
+        const graphContainer = this.shadowRoot.querySelector('[data-graph]');
+        const rect = graphContainer.getBoundingClientRect();
+        const graph = this._getDisplayGraph();
+        if (!graph) return;
+
+        const point = this.shadowRoot.querySelector(`.point[data-index="${pointIndex}"]`);
+        if (point) point.classList.add('dragging');
+
+        const isEntityBased = graph.xAxisType === 'entity';
+        const xMin = isEntityBased ? (graph.xAxisMin ?? 0) : 0;
+        const xMax = isEntityBased ? (graph.xAxisMax ?? 100) : 1440;
+        const xSnap = graph.xSnap || 0;
+        const ySnap = graph.ySnap || 0;
+
+        // Create a working copy of points for visual updates during drag
+        let workingPoints = [...(graph.points || [])];
+
+        const onMove = (e) => {
+            const xRatio = (e.clientX - rect.left) / rect.width;
+            const yRatio = 1 - (e.clientY - rect.top) / rect.height;
+
+            let x = xMin + xRatio * (xMax - xMin);
+            let y = graph.minY + yRatio * (graph.maxY - graph.minY);
+
+            if (xSnap > 0) x = Math.round(x / xSnap) * xSnap;
+            if (ySnap > 0) y = Math.round(y / ySnap) * ySnap;
+
+            x = Math.max(xMin, Math.min(xMax, x));
+            y = Math.max(graph.minY, Math.min(graph.maxY, y));
+
+            // Update working copy visually
+            workingPoints[pointIndex] = { x, y };
+            this._renderGraphWithPoints(graph, workingPoints);
+        };
+
+        const onUp = () => {
+            document.removeEventListener('mousemove', onMove);
+            document.removeEventListener('mouseup', onUp);
+
+            if (point) point.classList.remove('dragging');
+
+            // Stage the changes
+            const graphIndex = this._getGraphIndex();
+            const newPoints = [...workingPoints].sort((a, b) => a.x - b.x);
+            this._stageChange(graphIndex, 'points', newPoints);
+        };
+
+        document.addEventListener('mousemove', onMove);
+        document.addEventListener('mouseup', onUp);
+    }
+
+    _getCurrentGraph() {
+        if (!this._scheduler?.graphs) return null;
+        const graphIndex = this._getGraphIndex();
+        return this._scheduler.graphs[graphIndex];
+    }
+
+    async _toggleWeekday(weekday) {
+        const graph = this._getDisplayGraph();
+        if (!graph) return;
+
+        const graphIndex = this._getGraphIndex();
+        let weekdays = [...(graph.weekdays || [0, 1, 2, 3, 4, 5, 6])];
+
+        const index = weekdays.indexOf(weekday);
+        if (index > -1) {
+            if (weekdays.length > 1) {
+                weekdays.splice(index, 1);
+            }
+        } else {
+            weekdays.push(weekday);
+            weekdays.sort((a, b) => a - b);
+        }
+
+        this._stageChange(graphIndex, 'weekdays', weekdays);
+    }
+
+    async _updateGraphSetting(setting, value) {
+        // Handle scheduler-level settings (not graph-level)
+        const schedulerSettings = ['updateInterval', 'overrideBehavior', 'overrideDuration'];
+        if (schedulerSettings.includes(setting)) {
+            if (!this._scheduler) return;
+
+            // Handle override duration conversion
+            if (setting === 'overrideDuration') {
+                value = this._parseDurationToSeconds(value);
+            } else if (setting === 'updateInterval') {
+                value = parseInt(value, 10);
+            }
+
+            // Update scheduler property
+            this._scheduler[setting] = value;
+
+            // Show/hide duration input based on behavior
+            if (setting === 'overrideBehavior') {
+                const container = this.shadowRoot.querySelector('.scheduler-card-container');
+                const durationGroup = container?.querySelector('.override-duration-group');
+                if (durationGroup) {
+                    durationGroup.style.display = value === 'for_duration' ? 'flex' : 'none';
+                }
+            }
+
+            // Save immediately for scheduler settings
+            await this._saveSchedulerConfig();
+            return;
+        }
+
+        const graphIndex = this._getGraphIndex();
+
+        // Map frontend setting names to internal names
+        const settingMap = {
+            'mode': 'mode',
+            'attribute': 'attribute',
+            'stepToZero': 'stepToZero',
+            'minY': 'minY',
+            'maxY': 'maxY',
+            'ySnap': 'ySnap',
+            'xSnap': 'xSnap',
+            'xAxisType': 'xAxisType',
+            'xAxisEntity': 'xAxisEntity',
+            'xAxisMin': 'xAxisMin',
+            'xAxisMax': 'xAxisMax',
+            'xAxisUnit': 'xAxisUnit'
+        };
+
+        // Handle attribute special - empty string means null
+        if (setting === 'attribute' && value === '') {
+            value = null;
+        }
+
+        const internalSetting = settingMap[setting] || setting;
+        this._stageChange(graphIndex, internalSetting, value);
+
+        // If X-axis type changed, re-render to show/hide entity options
+        if (setting === 'xAxisType') {
+            this._render();
+        }
+    }
+
+    _stageChange(graphIndex, property, value) {
+        // Store original state on first change
+        if (!this._originalState) {
+            const graph = this._getCurrentGraph();
+            if (graph) {
+                this._originalState = JSON.parse(JSON.stringify(graph));
+            }
+        }
+
+        // Initialize pending changes if needed
+        if (!this._pendingChanges || this._pendingChanges.graphIndex !== graphIndex) {
+            this._pendingChanges = {
+                graphIndex: graphIndex,
+                changes: {}
+            };
+        }
+
+        // Store previous state for undo
+        const graph = this._getDisplayGraph(graphIndex);
+        const previousValue = graph ? graph[property] : undefined;
+
+        // Push to undo stack
+        this._undoStack.push({
+            graphIndex,
+            property,
+            previousValue: JSON.parse(JSON.stringify(previousValue)),
+            newValue: JSON.parse(JSON.stringify(value))
+        });
+
+        // Clear redo stack on new change
+        this._redoStack = [];
+
+        // Apply the change to pending
+        this._pendingChanges.changes[property] = value;
+
+        // Re-render to show changes
+        this._render();
+    }
+
+    _undo() {
+        if (this._undoStack.length === 0) return;
+
+        const action = this._undoStack.pop();
+        this._redoStack.push(action);
+
+        // Revert the change
+        if (this._pendingChanges && this._pendingChanges.graphIndex === action.graphIndex) {
+            if (action.previousValue === undefined) {
+                delete this._pendingChanges.changes[action.property];
+            } else {
+                this._pendingChanges.changes[action.property] = action.previousValue;
+            }
+
+            // Check if all changes reverted
+            if (Object.keys(this._pendingChanges.changes).length === 0) {
+                this._pendingChanges = null;
+                this._originalState = null;
+            }
+        }
+
+        this._render();
+    }
+
+    _redo() {
+        if (this._redoStack.length === 0) return;
+
+        const action = this._redoStack.pop();
+        this._undoStack.push(action);
+
+        // Re-apply the change
+        if (!this._pendingChanges || this._pendingChanges.graphIndex !== action.graphIndex) {
+            this._pendingChanges = {
+                graphIndex: action.graphIndex,
+                changes: {}
+            };
+        }
+
+        this._pendingChanges.changes[action.property] = action.newValue;
+
+        this._render();
+    }
+
+    _resetChanges() {
+        this._pendingChanges = null;
+        this._undoStack = [];
+        this._redoStack = [];
+        this._originalState = null;
+        this._render();
+    }
+
+    async _addGraph() {
+        if (!this._scheduler) return;
+
+        const info = this._getEntityInfo(this._scheduler.entityId);
+        const newIndex = this._scheduler.graphs.length + 1;
+
+        const newGraph = {
+            id: `graph_${Date.now()}`,
+            label: `Schedule ${newIndex}`,
+            weekdays: [0, 1, 2, 3, 4, 5, 6],
+            attribute: null,
+            mode: 'linear',
+            minY: info.minY,
+            maxY: info.maxY,
+            xSnap: undefined,
+            ySnap: 0,
+            stepToZero: false,
+            xAxisType: 'time',
+            xAxisEntity: null,
+            points: [{ x: 0, y: info.minY }, { x: 1440, y: info.minY }],
+            unit: info.unit || '',
+            zoomLevel: 1,
+            zoomOffset: 0
+        };
+
+        // Add the new graph to the local scheduler
+        this._scheduler.graphs.push(newGraph);
+
+        // Save using service call
+        try {
+            await this._saveSchedulerConfig();
+
+            // Select the new graph
+            this._selectedGraphIndex = this._scheduler.graphs.length - 1;
+            this._render();
+        } catch (e) {
+            // Remove the graph on failure
+            this._scheduler.graphs.pop();
+            console.error('Failed to add graph:', e);
+        }
+    }
+
+    async _deleteGraph() {
+        if (!this._scheduler) return;
+
+        const graphs = this._scheduler.graphs || [];
+        if (graphs.length <= 1) return; // Can't delete the last graph
+
+        const graphIndex = this._getGraphIndex();
+
+        // Store the deleted graph for potential recovery
+        const deletedGraph = graphs[graphIndex];
+
+        // Remove from local scheduler
+        this._scheduler.graphs.splice(graphIndex, 1);
+
+        // Save using service call
+        try {
+            await this._saveSchedulerConfig();
+
+            // Adjust selected index
+            if (this._selectedGraphIndex >= this._scheduler.graphs.length) {
+                this._selectedGraphIndex = this._scheduler.graphs.length - 1;
+            }
+            this._render();
+        } catch (e) {
+            // Restore the graph on failure
+            this._scheduler.graphs.splice(graphIndex, 0, deletedGraph);
+            console.error('Failed to delete graph:', e);
+        }
+    }
+
+    async _createScheduler() {
+        if (!this._targetEntity || !this._hass) return;
+
+        const state = this._hass.states[this._targetEntity];
+        if (!state) return;
+
+        const info = this._getEntityInfo(this._targetEntity);
+        const friendlyName = state?.attributes?.friendly_name || this._targetEntity;
+
+        // Create a new scheduler with default graph
+        const defaultGraph = {
+            id: `graph_${Date.now()}`,
+            label: 'Schedule 1',
+            weekdays: [0, 1, 2, 3, 4, 5, 6],
+            attribute: null,
+            mode: 'linear',
+            min_y: info.minY,
+            max_y: info.maxY,
+            x_snap: null,
+            y_snap: 0,
+            step_to_zero: false,
+            x_axis_type: 'time',
+            x_axis_entity: null,
+            x_axis_min: null,
+            x_axis_max: null,
+            x_axis_unit: null,
+            points: [{ x: 0, y: info.minY }, { x: 1440, y: info.minY }]
+        };
+
+        try {
+            await this._hass.callService('universal_scheduler', 'set_schedule_config', {
+                entity_id: this._targetEntity,
+                target_entity: this._targetEntity,
+                domain: info.domain,
+                name: friendlyName,
+                update_interval: 300,
+                enabled: true,
+                graphs_per_row: 1,
+                graphs: [defaultGraph]
+            });
+
+            // Reload data to show the new scheduler
+            sharedSchedulers.invalidate(this._targetEntity);
+            await this._loadSchedulerData();
+        } catch (e) {
+            console.error('Failed to create scheduler:', e);
+        }
+    }
+
+    async _deleteScheduler() {
+        if (!this._scheduler || !this._hass) return;
+
+        // Confirm deletion
+        if (!confirm(`Are you sure you want to delete the entire schedule for ${this._scheduler.name}? This cannot be undone.`)) {
+            return;
+        }
+
+        try {
+            await this._hass.callService('universal_scheduler', 'delete_scheduler', {
+                entity_id: this._scheduler.entityId
+            });
+
+            // Clear local data and reload
+            sharedSchedulers.invalidate(this._scheduler.entityId);
+            this._scheduler = null;
+            await this._loadSchedulerData();
+        } catch (e) {
+            console.error('Failed to delete scheduler:', e);
+        }
+    }
+
+    async _saveSchedulerName(newName) {
+        if (!this._scheduler || !newName) return;
+
+        // Don't save if name unchanged
+        if (newName === this._scheduler.name) return;
+
+        this._scheduler.name = newName;
+        await this._saveSchedulerConfig();
+        this._render();
+    }
+
+    async _saveSchedulerConfig() {
+        if (!this._scheduler) return;
+
+        // Convert frontend graphs format to backend format
+        const graphs = this._scheduler.graphs.map(graph => ({
+            id: graph.id,
+            label: graph.label || 'Schedule',
+            weekdays: graph.weekdays || [0, 1, 2, 3, 4, 5, 6],
+            attribute: graph.attribute || null,
+            mode: graph.mode || 'linear',
+            min_y: graph.minY,
+            max_y: graph.maxY,
+            x_snap: graph.xSnap === undefined ? null : graph.xSnap,
+            y_snap: graph.ySnap || 0,
+            step_to_zero: graph.stepToZero || false,
+            x_axis_type: graph.xAxisType || 'time',
+            x_axis_entity: graph.xAxisEntity || null,
+            x_axis_min: graph.xAxisMin ?? null,
+            x_axis_max: graph.xAxisMax ?? null,
+            x_axis_unit: graph.xAxisUnit || null,
+            x_axis_debounce: graph.xAxisDebounce ?? null,
+            x_axis_deadband: graph.xAxisDeadband ?? null,
+            points: graph.points || []
+        }));
+
+        // Use the target entity (e.g., light.test_lamp), not the switch entity
+        // This matches the panel behavior - the service expects the target entity as entity_id
+        await this._hass.callService('universal_scheduler', 'set_schedule_config', {
+            entity_id: this._scheduler.entityId,
+            target_entity: this._scheduler.entityId,
+            domain: this._scheduler.domain,
+            name: this._scheduler.name,
+            update_interval: this._scheduler.updateInterval || 300,
+            enabled: this._scheduler.enabled,
+            graphs_per_row: this._scheduler.graphsPerRow || 1,
+            override_behavior: this._scheduler.overrideBehavior || 'none',
+            override_duration: this._scheduler.overrideDuration || 3600,
+            graphs: graphs
+        });
+    };
+
+    async _saveChanges() {
+        if (!this._pendingChanges || !this._scheduler) return;
+
+        const graphIndex = this._pendingChanges.graphIndex;
+
+        try {
+            // Apply pending changes to the local scheduler graph
+            const graph = this._scheduler.graphs[graphIndex];
+            if (!graph) return;
+
+            for (const [key, value] of Object.entries(this._pendingChanges.changes)) {
+                graph[key] = value;
+            }
+
+            // Save using service call
+            await this._saveSchedulerConfig();
+
+            // Clear pending changes
+            this._pendingChanges = null;
+            this._undoStack = [];
+            this._redoStack = [];
+            this._originalState = null;
+
+            // Reload data to sync with backend
+            sharedSchedulers.invalidate(this._scheduler.entityId);
+            await this._loadSchedulerData();
+        } catch (e) {
+            console.error('Failed to save changes:', e);
+        }
+    }
+
+    async _updatePoint(pointIndex, field, value) {
+        const graph = this._getDisplayGraph();
+        if (!graph) return;
+
+        const graphIndex = this._getGraphIndex();
+        const newPoints = [...(graph.points || [])];
+        newPoints[pointIndex] = { ...newPoints[pointIndex], [field]: value };
+        newPoints.sort((a, b) => a.x - b.x);
+
+        this._stageChange(graphIndex, 'points', newPoints);
+    }
+
+    async _deletePoint(pointIndex) {
+        const graph = this._getDisplayGraph();
+        if (!graph || (graph.points || []).length <= 2) return;
+
+        const graphIndex = this._getGraphIndex();
+        const newPoints = (graph.points || []).filter((_, i) => i !== pointIndex);
+
+        this._stageChange(graphIndex, 'points', newPoints);
+    }
+
+    async _addPoint() {
+        const graph = this._getDisplayGraph();
+        if (!graph) return;
+
+        const container = this.shadowRoot.querySelector('.scheduler-card-container');
+        const isEntityBased = graph.xAxisType === 'entity';
+
+        let x, y;
+
+        if (isEntityBased) {
+            const xInput = container.querySelector('[data-new-x]');
+            x = parseFloat(xInput?.value);
+        } else {
+            const timeInput = container.querySelector('[data-new-time]');
+            x = this._timeToMinutes(timeInput?.value);
+        }
+
+        const yInput = container.querySelector('[data-new-y]');
+        y = parseFloat(yInput?.value);
+
+        if (x === null || isNaN(x) || isNaN(y)) return;
+
+        const graphIndex = this._getGraphIndex();
+        const newPoints = [...(graph.points || []), { x, y }].sort((a, b) => a.x - b.x);
+
+        this._stageChange(graphIndex, 'points', newPoints);
+    }
+
+    async _updateGraphProperty(graphIndex, property, value) {
+        // This is now only used for weekday toggling and other non-staged updates
+        // For staged changes, use _stageChange
+        if (!this._scheduler) return;
+
+        try {
+            // Get current scheduler config
+            const result = await this._hass.callWS({
+                type: 'universal_scheduler/get_schedulers'
+            });
+
+            const schedulers = result.schedulers || {};
+            const config = schedulers[this._scheduler.entityId];
+
+            if (!config?.graphs?.[graphIndex]) return;
+
+            // Update the property
+            config.graphs[graphIndex][property] = value;
+
+            // Save back
+            await this._hass.callWS({
+                type: 'universal_scheduler/set_config',
+                entity_id: this._scheduler.entityId,
+                config: config
+            });
+
+            // Reload data
+            sharedSchedulers.invalidate(this._scheduler.entityId);
+            await this._loadSchedulerData();
+        } catch (e) {
+            console.error('Failed to update graph property:', e);
+        }
+    }
+
+    async _savePoints(graphIndex, points) {
+        // Use staged changes instead
+        this._stageChange(graphIndex, 'points', points);
+    }
+}
+
+// Called by lovelace-card.js once this module is loaded
+export function installCardEditing(cardClass) {
+    for (const name of Object.getOwnPropertyNames(CardEditing.prototype)) {
+        if (name !== 'constructor') {
+            Object.defineProperty(cardClass.prototype, name, Object.getOwnPropertyDescriptor(CardEditing.prototype, name));
+        }
+    }
+    cardClass.editingStyles = CARD_EDITING_STYLES;
+}
+
+customElements.define('universal-scheduler-card-editor', UniversalSchedulerCardEditor);
@@ -16,7 +16,9 @@ import {
     interpolateValue,
     parsePoints,
     CONTROLLABLE_DOMAINS,
-    getNumericAttributes
+    getNumericAttributes,
+    minuteTicker,
+    timeGraphKey
 } from './utils.js';
 import { GraphHandler } from './graph.js';
 import {
@@ -76,6 +78,7 @@ class UniversalSchedulerPanel extends HTMLElement {
             this.init();
             this._initialized = true;
         }
+        this._subscribeTicker();
     }
 
     set hass(hass) {
@@ -135,10 +138,8 @@ class UniversalSchedulerPanel extends HTMLElement {
         // Load existing schedulers
         this.loadSchedulersFromHA();
 
-        // Start current time marker update interval (every minute)
-        this._timeUpdateInterval = setInterval(() => {
-            this.updateAllTimeMarkers();
-        }, 60000); // Update every minute
+        // Move the current time markers on every new minute
+        this._subscribeTicker();
 
         // Handle window resize to re-render graphs
         this._resizeHandler = () => {
@@ -155,19 +156,32 @@ class UniversalSchedulerPanel extends HTMLElement {
         window.addEventListener('resize', this._resizeHandler);
     }
 
+    _subscribeTicker() {
+        if (this._root && !this._unsubscribeTicker) {
+            this._unsubscribeTicker = minuteTicker.subscribe((minute) => this.updateAllTimeMarkers(minute));
+        }
+    }
+
     // Update time markers for all schedulers (multi-graph)
-    updateAllTimeMarkers() {
+    updateAllTimeMarkers(minute) {
+        // What each open graph section showed at the last tick
+        this._tickKeys = this._tickKeys || new WeakMap();
+
         Object.keys(this.schedulers).forEach(entityId => {
             const scheduler = this.schedulers[entityId];
             const card = this._root.querySelector(`[data-entity="${entityId}"]`);
             if (!card || card.classList.contains('collapsed')) return;
 
-            // Update each open graph section
+            // Only update open graph sections that look different at this minute
+            const target = this._hass?.states?.[scheduler.entityId]?.last_updated;
             card.querySelectorAll('.graph-section').forEach((section, idx) => {
                 if (!section.classList.contains('collapsed')) {
                     const graph = scheduler.graphs[idx];
                     if (graph) {
-                        this.graphHandler.updateCurrentTimeMarkerMulti(section, graph);
+                        const key = `${target}|${this._graphClockKey(graph, minute)}`;
+                        if (this._tickKeys.get(section) === key) return;
+                        this._tickKeys.set(section, key);
+                        this.graphHandler.updateCurrentTimeMarkerMulti(section, graph, this._hass);
                         this.graphHandler.updateCurrentValueMulti(entityId, idx, section);
                     }
                 }
@@ -175,10 +189,21 @@ class UniversalSchedulerPanel extends HTMLElement {
         });
     }
 
+    // What a graph shows at a minute of the day, given its zoom
+    _graphClockKey(graph, minute) {
+        if (graph.xAxisType === 'entity') {
+            const state = this._hass?.states?.[graph.xAxisEntity]?.state;
+            return `${state}|${graph.zoomLevel}|${graph.zoomOffset}`;
+        }
+        const startMinute = graph.zoomOffset || 0;
+        return timeGraphKey(graph, minute, startMinute, startMinute + 1440 / (graph.zoomLevel || 1));
+    }
+
     // Clean up on disconnect
     disconnectedCallback() {
-        if (this._timeUpdateInterval) {
-            clearInterval(this._timeUpdateInterval);
+        if (this._unsubscribeTicker) {
+            this._unsubscribeTicker();
+            this._unsubscribeTicker = null;
         }
         if (this._resizeHandler) {
             window.removeEventListener('resize', this._resizeHandler);
@@ -1071,6 +1096,8 @@ class UniversalSchedulerPanel extends HTMLElement {
             section.querySelector('.x-axis-min-group').style.display = showEntity ? 'flex' : 'none';
             section.querySelector('.x-axis-max-group').style.display = showEntity ? 'flex' : 'none';
             section.querySelector('.x-axis-unit-group').style.display = showEntity ? 'flex' : 'none';
+            section.querySelector('.x-axis-debounce-group').style.display = showEntity ? 'flex' : 'none';
+            section.querySelector('.x-axis-deadband-group').style.display = showEntity ? 'flex' : 'none';
 
             // Toggle add-point input visibility
             const timeInput = section.querySelector('[data-new-point-time]');
@@ -1250,6 +1277,15 @@ class UniversalSchedulerPanel extends HTMLElement {
             this.updateGraphSection(entityId, graphIndex, section);
         });
 
+        // Debounce and deadband only affect how the backend reacts to the X entity
+        ['xAxisDebounce', 'xAxisDeadband'].forEach(setting => {
+            section.querySelector(`[data-graph-setting="${setting}"]`)?.addEventListener('change', (e) => {
+                this.saveUndoState(entityId);
+                const value = parseFloat(e.target.value);
+                getGraph()[setting] = isNaN(value) || value < 0 ? null : value;
+            });
+        });
+
         // Delete graph button
         section.querySelector('[data-action="deleteGraph"]')?.addEventListener('click', (e) => {
             e.stopPropagation();
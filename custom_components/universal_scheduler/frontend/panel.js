@@ -1,12 +1,10 @@
 /**
  * Universal Scheduler Panel (Bundled)
- * Multi-entity scheduler with curve interpolation
  *
  * Auto-generated from modular source files
  * Do not edit directly - edit the source modules instead:
  * - styles.js
  * - templates.js
- * - utils.js
  * - attribute-config.js
  * - graph.js
  * - services.js
@@ -15,8 +13,7 @@
  * Then run: python build.py
  */
 
-(function() {
-'use strict';
+import { CONTROLLABLE_DOMAINS, clamp, generateInterpolatedPath, getControllableEntities, getDomainIcon, getEntityInfo as getEntityInfoUtil, getNumericAttributes, interpolateValue, interpolateValueWithStepToMin, isSortedByX, minuteTicker, minutesToTime, parsePoints, sharedSchedulers, timeGraphKey, timeToMinutes } from './core.js';
 
 // === STYLES ===
 /**
@@ -1848,7 +1845,6 @@ const PANEL_STYLES = `
 `;
 
 
-
 // === TEMPLATES ===
 /**
  * Universal Scheduler - Templates Module
@@ -2182,6 +2178,14 @@ function createGraphHTML(graph, graphIndex, scheduler) {
                                 <label>X Unit</label>
                                 <input type="text" data-graph-setting="xAxisUnit" value="${graph.xAxisUnit || ''}" placeholder="lx" style="width: 50px;">
                             </div>
+                            <div class="input-group x-axis-debounce-group" style="display: ${graph.xAxisType === 'entity' ? 'flex' : 'none'};" title="Seconds to wait after the X entity changes before applying it">
+                                <label>Debounce (s)</label>
+                                <input type="number" data-graph-setting="xAxisDebounce" value="${graph.xAxisDebounce ?? ''}" min="0" placeholder="0" style="width: 60px;">
+                            </div>
+                            <div class="input-group x-axis-deadband-group" style="display: ${graph.xAxisType === 'entity' ? 'flex' : 'none'};" title="Minimum change of the X value that triggers an update">
+                                <label>Deadband</label>
+                                <input type="number" data-graph-setting="xAxisDeadband" value="${graph.xAxisDeadband ?? ''}" min="0" placeholder="0" style="width: 60px;">
+                            </div>
                         </div>
                     </div>
                 </div>
@@ -2310,334 +2314,6 @@ function createSchedulerCardHTML(scheduler, domainIcon) {
 }
 
 
-
-// === UTILITIES ===
-/**
- * Universal Scheduler - Utilities Module
- * Helper functions for entity info, time formatting, icons, and interpolation
- */
-
-// Controllable domains for scheduler
-const CONTROLLABLE_DOMAINS = [
-    'light', 'climate', 'number', 'input_number',
-    'fan', 'cover', 'humidifier', 'media_player'
-];
-
-/**
- * Get entity domain and auto-detect min/max values
- */
-function getEntityInfo(hass, entityId) {
-    if (!entityId || !hass?.states[entityId]) {
-        return { domain: 'number', minY: 0, maxY: 100, unit: '' };
-    }
-
-    const state = hass.states[entityId];
-    const domain = entityId.split('.')[0];
-    const attrs = state.attributes || {};
-
-    let minY = 0, maxY = 100, unit = '';
-
-    switch (domain) {
-        case 'light':
-            minY = 0;
-            maxY = 100;
-            unit = '%';
-            break;
-        case 'climate':
-            minY = attrs.min_temp ?? 10;
-            maxY = attrs.max_temp ?? 30;
-            unit = attrs.temperature_unit || '°C';
-            break;
-        case 'number':
-        case 'input_number':
-            minY = attrs.min ?? 0;
-            maxY = attrs.max ?? 100;
-            unit = attrs.unit_of_measurement || '';
-            break;
-        case 'fan':
-            minY = 0;
-            maxY = 100;
-            unit = '%';
-            break;
-        case 'cover':
-            minY = 0;
-            maxY = 100;
-            unit = '%';
-            break;
-        case 'humidifier':
-            minY = attrs.min_humidity ?? 0;
-            maxY = attrs.max_humidity ?? 100;
-            unit = '%';
-            break;
-        default:
-            minY = attrs.min ?? 0;
-            maxY = attrs.max ?? 100;
-            unit = attrs.unit_of_measurement || '';
-    }
-
-    return { domain, minY, maxY, unit };
-}
-
-/**
- * Get all controllable entities for autocomplete
- */
-function getControllableEntities(hass) {
-    if (!hass?.states) return [];
-
-    return Object.keys(hass.states)
-        .filter(entityId => {
-            const domain = entityId.split('.')[0];
-            return CONTROLLABLE_DOMAINS.includes(domain);
-        })
-        .sort();
-}
-
-/**
- * Get numeric attributes for an entity (to allow selecting which attribute to graph)
- */
-function getNumericAttributes(hass, entityId) {
-    const state = hass?.states?.[entityId];
-    if (!state || !state.attributes) return [];
-
-    return Object.entries(state.attributes)
-        .filter(([, value]) => typeof value === 'number')
-        .map(([key]) => key)
-        .sort();
-}
-
-/**
- * Convert minutes to HH:MM time string
- */
-function minutesToTime(minutes) {
-    const h = Math.floor(minutes / 60) % 24;
-    const m = Math.floor(minutes % 60);
-    return `${h.toString().padStart(2, '0')}:${m.toString().padStart(2, '0')}`;
-}
-
-/**
- * Parse HH:MM time string to minutes
- * Returns null if invalid format
- */
-function timeToMinutes(timeStr) {
-    if (!timeStr) return null;
-
-    const match = timeStr.match(/^(\d{1,2}):(\d{2})$/);
-    if (!match) return null;
-
-    const hours = parseInt(match[1], 10);
-    const mins = parseInt(match[2], 10);
-
-    if (hours < 0 || hours > 23 || mins < 0 || mins > 59) return null;
-
-    return hours * 60 + mins;
-}
-
-/**
- * Get domain-specific icon
- */
-function getDomainIcon(domain) {
-    const icons = {
-        'light': 'mdi:lightbulb',
-        'climate': 'mdi:thermostat',
-        'number': 'mdi:numeric',
-        'input_number': 'mdi:ray-vertex',
-        'fan': 'mdi:fan',
-        'cover': 'mdi:window-shutter',
-        'humidifier': 'mdi:air-humidifier',
-        'media_player': 'mdi:speaker'
-    };
-    return icons[domain] || 'mdi:help-circle';
-}
-
-/**
- * Generate interpolated path points
- * If stepToZero is enabled and a point has y=0, the line will step down to 0 immediately
- */
-function generateInterpolatedPath(scheduler, startMinute, endMinute) {
-    const points = scheduler.points;
-    const mode = scheduler.mode;
-    const stepToZero = scheduler.stepToZero || false;
-    const result = [];
-    const step = Math.max(1, Math.floor((endMinute - startMinute) / 200)); // ~200 points for smooth curve
-
-    // In step mode we want vertical transitions exactly at change boundaries
-    if (mode === 'step' && !stepToZero) {
-        return generateStepPath(points, startMinute, endMinute, scheduler.minY, scheduler.maxY);
-    }
-
-    // If stepToZero is enabled, we need to handle zero points specially
-    if (stepToZero) {
-        for (let x = startMinute; x <= endMinute; x += step) {
-            const y = interpolateValueWithStepToMin(x, points, mode, scheduler.minY, scheduler.maxY);
-            result.push({ x, y });
-        }
-    } else {
-        for (let x = startMinute; x <= endMinute; x += step) {
-            const y = interpolateValue(x, points, mode, scheduler.minY, scheduler.maxY);
-            result.push({ x, y });
-        }
-    }
-
-    // Ensure end point is included
-    if (result.length === 0 || result[result.length - 1].x !== endMinute) {
-        const y = stepToZero
-            ? interpolateValueWithStepToMin(endMinute, points, mode, scheduler.minY, scheduler.maxY)
-            : interpolateValue(endMinute, points, mode, scheduler.minY, scheduler.maxY);
-        result.push({ x: endMinute, y });
-    }
-
-    return result;
-}
-
-// Build a step-path with explicit vertical transitions at change points
-function generateStepPath(points, startMinute, endMinute, minY, maxY) {
-    if (!points?.length) {
-        return [
-            { x: startMinute, y: minY },
-            { x: endMinute, y: minY },
-        ];
-    }
-
-    const sorted = [...points].sort((a, b) => a.x - b.x);
-    const valueAt = (x) => interpolateValue(x, sorted, 'step', minY, maxY);
-
-    const path = [];
-    let lastY = valueAt(startMinute);
-
-    path.push({ x: startMinute, y: lastY });
-
-    for (const p of sorted) {
-        if (p.x <= startMinute) {
-            lastY = p.y;
-            continue;
-        }
-        if (p.x > endMinute) {
-            break;
-        }
-
-        // Horizontal segment to the change point
-        path.push({ x: p.x, y: lastY });
-        // Vertical jump at the change point
-        path.push({ x: p.x, y: p.y });
-        lastY = p.y;
-    }
-
-    // Extend to end of view
-    path.push({ x: endMinute, y: lastY });
-
-    return path;
-}
-
-/**
- * Interpolate value at a given x position
- */
-function interpolateValue(x, points, mode, minY, maxY) {
-    if (points.length === 0) return minY;
-    if (points.length === 1) return points[0].y;
-
-    // Find surrounding points
-    let p1 = points[0];
-    let p2 = points[points.length - 1];
-
-    for (let i = 0; i < points.length - 1; i++) {
-        if (x >= points[i].x && x <= points[i + 1].x) {
-            p1 = points[i];
-            p2 = points[i + 1];
-            break;
-        }
-    }
-
-    // Handle edge cases
-    if (x <= points[0].x) return points[0].y;
-    if (x >= points[points.length - 1].x) return points[points.length - 1].y;
-
-    const t = (x - p1.x) / (p2.x - p1.x);
-
-    switch (mode) {
-        case 'step':
-            return p1.y;
-
-        case 'smooth':
-            // Cosine interpolation
-            const t2 = (1 - Math.cos(t * Math.PI)) / 2;
-            return p1.y + (p2.y - p1.y) * t2;
-
-        case 'linear':
-        default:
-            return p1.y + (p2.y - p1.y) * t;
-    }
-}
-
-/**
- * Interpolate with step-to-zero behavior
- * When stepToZero is enabled and a point has y=minY, the line will hold at the previous
- * value until reaching that point, then immediately drop to minY
- */
-function interpolateValueWithStepToMin(x, points, mode, minY, maxY) {
-    if (points.length === 0) return minY;
-    if (points.length === 1) return points[0].y;
-
-    // Find surrounding points
-    let p1 = points[0];
-    let p2 = points[points.length - 1];
-    let p1Index = 0;
-
-    for (let i = 0; i < points.length - 1; i++) {
-        if (x >= points[i].x && x <= points[i + 1].x) {
-            p1 = points[i];
-            p2 = points[i + 1];
-            p1Index = i;
-            break;
-        }
-    }
-
-    // Handle edge cases
-    if (x <= points[0].x) return points[0].y;
-    if (x >= points[points.length - 1].x) return points[points.length - 1].y;
-
-    // Step-to-min logic: if next point is at/below min, hold at p1's value until we reach p2
-    // Then immediately drop to min at p2's position
-    if (p2.y <= minY) {
-        // At or past p2's position, drop to min
-        if (x >= p2.x) {
-            return minY;
-        }
-        // Before p2, hold at p1's value (no interpolation toward min)
-        return p1.y;
-    }
-
-    // If coming up from min, delay the rise slightly
-    if (p1.y <= minY) {
-        const t = (x - p1.x) / (p2.x - p1.x);
-        if (t < 0.01) return minY;
-    }
-
-    // Otherwise, use normal interpolation
-    return interpolateValue(x, points, mode, minY, maxY);
-}
-
-/**
- * Parse points data from various formats
- */
-function parsePoints(pointsData) {
-    if (Array.isArray(pointsData)) {
-        return pointsData.map(p => ({
-            x: p.x ?? p.time ?? 0,
-            y: p.y ?? p.value ?? 0
-        }));
-    }
-    return [{ x: 0, y: 0 }, { x: 1440, y: 0 }];
-}
-
-/**
- * Clamp a value between min and max
- */
-function clamp(value, min, max) {
-    return Math.max(min, Math.min(max, value));
-}
-
-
-
 // === ATTRIBUTE CONFIG ===
 /**
  * Universal Scheduler - Attribute Configuration
@@ -2795,7 +2471,6 @@ function isKnownAttribute(attributeName) {
 }
 
 
-
 // === GRAPH HANDLER ===
 /**
  * Universal Scheduler - Graph Module
@@ -2803,12 +2478,58 @@ function isKnownAttribute(attributeName) {
  */
 
 
+// Visible windows (zoom level and offset) of which a graph's paths are kept
+const CURVE_PATH_WINDOWS = 8;
+
+// Copy the coordinates of points, to notice when they are edited in place
+function snapshotPoints(points) {
+    const snapshot = new Float64Array(points.length * 2);
+    points.forEach((p, i) => {
+        snapshot[2 * i] = p.x;
+        snapshot[2 * i + 1] = p.y;
+    });
+    return snapshot;
+}
+
+function samePoints(snapshot, points) {
+    if (snapshot.length !== points.length * 2) return false;
+    for (let i = 0; i < points.length; i++) {
+        if (snapshot[2 * i] !== points[i].x || snapshot[2 * i + 1] !== points[i].y) return false;
+    }
+    return true;
+}
+
+// Call fn at most once per animation frame, with the latest argument given
+function frameThrottle(fn) {
+    let frame = null;
+    let latest;
+    const run = () => {
+        frame = null;
+        fn(latest);
+    };
+    return {
+        schedule(arg) {
+            latest = arg;
+            if (frame === null) frame = requestAnimationFrame(run);
+        },
+        // Run a scheduled call right away, e.g. when the drag ends
+        flush() {
+            if (frame !== null) {
+                cancelAnimationFrame(frame);
+                run();
+            }
+        },
+    };
+}
+
 /**
  * Graph rendering and interaction handler
  */
 class GraphHandler {
     constructor(panel) {
         this.panel = panel;
+        // Curve paths per graph, reused until its points or settings change
+        this._curvePaths = new WeakMap();
     }
 
     get schedulers() {
@@ -2835,8 +2556,10 @@ class GraphHandler {
         // Clear existing points
         card.querySelectorAll('.point, .point-tooltip').forEach(el => el.remove());
 
-        // Sort points by x
-        scheduler.points.sort((a, b) => a.x - b.x);
+        // Sort points by x (point elements are indexed in this order)
+        if (!isSortedByX(scheduler.points)) {
+            scheduler.points.sort((a, b) => a.x - b.x);
+        }
 
         // Calculate visible range
         const visibleMinutes = 1440 / scheduler.zoomLevel;
@@ -2844,20 +2567,70 @@ class GraphHandler {
         const endMinute = startMinute + visibleMinutes;
         const yRange = scheduler.maxY - scheduler.minY;
 
-        // Generate interpolated path
-        const pathPoints = generateInterpolatedPath(scheduler, startMinute, endMinute);
-
         // Use viewBox coordinates (0-100 for both axes) to make it resolution-independent
         svg.setAttribute('viewBox', '0 0 100 100');
         svg.setAttribute('preserveAspectRatio', 'none');
 
+        this.setCurvePaths(curvePath, fillPath, scheduler, startMinute, endMinute);
+
+        // Render draggable points
+        scheduler.points.forEach((point, index) => {
+            if (point.x < startMinute || point.x > endMinute) return;
+
+            const px = ((point.x - startMinute) / visibleMinutes) * 100;
+            const py = (1 - (point.y - scheduler.minY) / yRange) * 100;
+
+            const el = document.createElement('div');
+            el.className = 'point';
+            el.style.left = `${px}%`;
+            el.style.top = `${py}%`;
+            el.dataset.index = index;
+
+            // Add tooltip on hover
+            el.addEventListener('mouseenter', (e) => this.showPointTooltip(e, entityId, index));
+            el.addEventListener('mouseleave', () => this.hidePointTooltip(entityId));
+
+            graph.appendChild(el);
+        });
+    }
+
+    /**
+     * Get the SVG curve and fill paths of a graph between startX and endX in
+     * viewBox coordinates (0-100). They are kept for the last few visible
+     * windows of each graph until its points or curve settings change.
+     */
+    getCurvePaths(graph, startX, endX) {
+        const settings = `${graph.mode}|${!!graph.stepToZero}|${graph.minY}|${graph.maxY}`;
+        let cache = this._curvePaths.get(graph);
+        if (!cache || cache.settings !== settings || !samePoints(cache.points, graph.points)) {
+            cache = { settings, points: snapshotPoints(graph.points), windows: new Map() };
+            this._curvePaths.set(graph, cache);
+        }
+
+        const windowKey = `${startX}|${endX}`;
+        let paths = cache.windows.get(windowKey);
+        if (!paths) {
+            paths = this.buildCurvePaths(graph, startX, endX);
+            if (cache.windows.size >= CURVE_PATH_WINDOWS) {
+                cache.windows.delete(cache.windows.keys().next().value);
+            }
+            cache.windows.set(windowKey, paths);
+        }
+        return paths;
+    }
+
+    buildCurvePaths(graph, startX, endX) {
+        const pathPoints = generateInterpolatedPath(graph, startX, endX);
+        const visibleRange = endX - startX;
+        const yRange = graph.maxY - graph.minY;
+
         let pathD = '';
         let fillD = '';
 
         pathPoints.forEach((p, i) => {
             // Use percentage coordinates (0-100)
-            const px = ((p.x - startMinute) / visibleMinutes) * 100;
-            const py = (1 - (p.y - scheduler.minY) / yRange) * 100;
+            const px = ((p.x - startX) / visibleRange) * 100;
+            const py = (1 - (p.y - graph.minY) / yRange) * 100;
 
             if (i === 0) {
                 pathD += `M ${px} ${py}`;
@@ -2870,32 +2643,20 @@ class GraphHandler {
 
         // Close fill area
         if (pathPoints.length > 0) {
-            const lastPx = ((pathPoints[pathPoints.length - 1].x - startMinute) / visibleMinutes) * 100;
+            const lastPx = ((pathPoints[pathPoints.length - 1].x - startX) / visibleRange) * 100;
             fillD += ` L ${lastPx} 100 Z`;
         }
 
-        curvePath.setAttribute('d', pathD);
-        fillPath.setAttribute('d', fillD);
-
-        // Render draggable points
-        scheduler.points.forEach((point, index) => {
-            if (point.x < startMinute || point.x > endMinute) return;
-
-            const px = ((point.x - startMinute) / visibleMinutes) * 100;
-            const py = (1 - (point.y - scheduler.minY) / yRange) * 100;
-
-            const el = document.createElement('div');
-            el.className = 'point';
-            el.style.left = `${px}%`;
-            el.style.top = `${py}%`;
-            el.dataset.index = index;
-
-            // Add tooltip on hover
-            el.addEventListener('mouseenter', (e) => this.showPointTooltip(e, entityId, index));
-            el.addEventListener('mouseleave', () => this.hidePointTooltip(entityId));
+        return { pathD, fillD };
+    }
 
-            graph.appendChild(el);
-        });
+    /**
+     * Set the curve and fill paths of a graph, leaving unchanged paths alone
+     */
+    setCurvePaths(curvePath, fillPath, graph, startX, endX) {
+        const { pathD, fillD } = this.getCurvePaths(graph, startX, endX);
+        if (curvePath.getAttribute('d') !== pathD) curvePath.setAttribute('d', pathD);
+        if (fillPath.getAttribute('d') !== fillD) fillPath.setAttribute('d', fillD);
     }
 
     /**
@@ -3614,8 +3375,10 @@ class GraphHandler {
         // Clear existing points
         graphContainer.querySelectorAll('.point, .point-tooltip').forEach(el => el.remove());
 
-        // Sort points by x
-        graph.points.sort((a, b) => a.x - b.x);
+        // Sort points by x (point elements are indexed in this order)
+        if (!isSortedByX(graph.points)) {
+            graph.points.sort((a, b) => a.x - b.x);
+        }
 
         // Calculate visible range based on X-axis type
         const isEntityBased = graph.xAxisType === 'entity';
@@ -3640,43 +3403,11 @@ class GraphHandler {
 
         const yRange = graph.maxY - graph.minY;
 
-        // Generate interpolated path using graph's points
-        const pathPoints = generateInterpolatedPath({
-            points: graph.points,
-            mode: graph.mode,
-            minY: graph.minY,
-            maxY: graph.maxY,
-            stepToZero: graph.stepToZero
-        }, startX, endX);
-
         // Use viewBox coordinates (0-100 for both axes)
         svg.setAttribute('viewBox', '0 0 100 100');
         svg.setAttribute('preserveAspectRatio', 'none');
 
-        let pathD = '';
-        let fillD = '';
-
-        pathPoints.forEach((p, i) => {
-            const px = ((p.x - startX) / visibleRange) * 100;
-            const py = (1 - (p.y - graph.minY) / yRange) * 100;
-
-            if (i === 0) {
-                pathD += `M ${px} ${py}`;
-                fillD += `M ${px} 100 L ${px} ${py}`;
-            } else {
-                pathD += ` L ${px} ${py}`;
-                fillD += ` L ${px} ${py}`;
-            }
-        });
-
-        // Close fill area
-        if (pathPoints.length > 0) {
-            const lastPx = ((pathPoints[pathPoints.length - 1].x - startX) / visibleRange) * 100;
-            fillD += ` L ${lastPx} 100 Z`;
-        }
-
-        curvePath.setAttribute('d', pathD);
-        fillPath.setAttribute('d', fillD);
+        this.setCurvePaths(curvePath, fillPath, graph, startX, endX);
 
         // Render draggable points
         graph.points.forEach((point, index) => {
@@ -4157,6 +3888,58 @@ class GraphHandler {
         }
     }
 
+    /**
+     * Show a point being dragged: move its element and tooltip, redraw the
+     * curve and update the current value, leaving axes, grid and the other
+     * points alone. Points are sorted again when the drag ends.
+     */
+    updateDraggedPointMulti(entityId, graphIndex, section, pointEl, index) {
+        const graph = this.schedulers[entityId]?.graphs?.[graphIndex];
+        const point = graph?.points?.[index];
+        if (!point) return;
+
+        const isEntityBased = graph.xAxisType === 'entity';
+        const zoomLevel = graph.zoomLevel || 1;
+        let visibleRange, startX;
+        if (isEntityBased) {
+            const xMin = graph.xAxisMin ?? 0;
+            const xRange = (graph.xAxisMax ?? 100) - xMin;
+            visibleRange = xRange / zoomLevel;
+            startX = xMin + (graph.zoomOffset || 0) * xRange;
+        } else {
+            visibleRange = 1440 / zoomLevel;
+            startX = graph.zoomOffset || 0;
+        }
+
+        const xPercent = clamp((point.x - startX) / visibleRange, 0, 1) * 100;
+        const yPercent = clamp(1 - (point.y - graph.minY) / (graph.maxY - graph.minY), 0, 1) * 100;
+        pointEl.style.left = `${xPercent}%`;
+        pointEl.style.top = `${yPercent}%`;
+
+        const svg = section.querySelector('.curve-svg');
+        if (svg) {
+            this.setCurvePaths(svg.querySelector('.curve-line'), svg.querySelector('.fill-area'), graph, startX, startX + visibleRange);
+        }
+        this.updateCurrentValueMulti(entityId, graphIndex, section);
+
+        // Reuse the tooltip while dragging
+        let tooltip = section.querySelector('.point-tooltip');
+        if (!tooltip) {
+            tooltip = document.createElement('div');
+            tooltip.className = 'point-tooltip';
+            tooltip.innerHTML = '<span class="time"></span><span class="value"></span>';
+            pointEl.parentElement.appendChild(tooltip);
+        }
+        tooltip.querySelector('.time').textContent = isEntityBased
+            ? `${point.x.toFixed(1)}${graph.xAxisUnit || ''}`
+            : minutesToTime(Math.round(point.x));
+        tooltip.querySelector('.value').textContent = `${point.y.toFixed(1)}${graph.unit || ''}`;
+        tooltip.style.left = `${xPercent}%`;
+        tooltip.style.top = `${yPercent}%`;
+        tooltip.classList.toggle('below', yPercent < 20);
+        tooltip.classList.toggle('above', yPercent >= 20);
+    }
+
     /**
      * Render points list for multi-graph mode
      * Supports both time-based and entity-based X-axis
@@ -4294,6 +4077,7 @@ class GraphHandler {
             const entityInfo = this.panel.getEntityInfo(scheduler.entityId);
             const entityMinY = entityInfo.minY;
             const entityMaxY = entityInfo.maxY;
+            const render = frameThrottle(() => this.panel.updateGraphSection(entityId, graphIndex, section));
 
             const onMove = (ev) => {
                 const deltaX = lastX - ev.clientX;
@@ -4315,10 +4099,10 @@ class GraphHandler {
 
                 lastX = ev.clientX;
                 lastY = ev.clientY;
-                this.panel.updateGraphSection(entityId, graphIndex, section);
+                render.schedule();
             };
-
             const onUp = () => {
+                render.flush();
                 window.removeEventListener('mousemove', onMove);
                 window.removeEventListener('mouseup', onUp);
             };
@@ -4332,28 +4116,31 @@ class GraphHandler {
 
         if (e.target.classList.contains('point')) {
             // Drag existing point
-            const index = parseInt(e.target.dataset.index);
-            e.target.classList.add('dragging');
+            const pointEl = e.target;
+            const index = parseInt(pointEl.dataset.index);
+            pointEl.classList.add('dragging');
             this.panel.saveUndoState(entityId);
 
             section.querySelectorAll('.curve-tooltip, .hover-line, .hover-dot').forEach(el => el.remove());
 
-            const onMove = (ev) => {
+            const drag = frameThrottle((ev) => {
                 const coords = getCoords(ev);
                 const hasConflict = graph.points.some((p, i) => i !== index && Math.abs(p.x - coords.x) < (isEntityBased ? 0.01 : 1));
                 if (!hasConflict) {
                     graph.points[index] = coords;
-                    this.renderGraphSection(entityId, graphIndex, section);
-                    this.updateCurrentValueMulti(entityId, graphIndex, section);
-                    this.showPointTooltipMulti({ target: graphContainer.querySelector(`[data-index="${index}"]`) }, entityId, graphIndex, index);
+                    this.updateDraggedPointMulti(entityId, graphIndex, section, pointEl, index);
                 }
-            };
+            });
+            const onMove = (ev) => drag.schedule(ev);
 
             const onUp = () => {
-                e.target.classList.remove('dragging');
+                drag.flush();
+                pointEl.classList.remove('dragging');
                 window.removeEventListener('mousemove', onMove);
                 window.removeEventListener('mouseup', onUp);
                 this.hidePointTooltipMulti(section);
+                // Sort and index the points again, they may have passed each other
+                this.renderGraphSection(entityId, graphIndex, section);
             };
 
             window.addEventListener('mousemove', onMove);
@@ -4366,6 +4153,7 @@ class GraphHandler {
             let hasMoved = false;
             let lastX = e.clientX;
             let lastY = e.clientY;
+            const render = frameThrottle(() => this.panel.updateGraphSection(entityId, graphIndex, section));
 
             const onMove = (ev) => {
                 const dx = ev.clientX - startX;
@@ -4390,11 +4178,11 @@ class GraphHandler {
 
                     lastX = ev.clientX;
                     lastY = ev.clientY;
-                    this.panel.updateGraphSection(entityId, graphIndex, section);
+                    render.schedule();
                 }
             };
-
             const onUp = (ev) => {
+                render.flush();
                 window.removeEventListener('mousemove', onMove);
                 window.removeEventListener('mouseup', onUp);
 
@@ -4535,6 +4323,8 @@ class GraphHandler {
         let touchedPoint = null;
         let hasMoved = false;
         let ignoreTouch = false;
+        // Measured once per touch, not on every move
+        let rect = null;
 
         const findNearestPoint = (touch) => {
             const points = Array.from(section.querySelectorAll('.point'));
@@ -4555,48 +4345,6 @@ class GraphHandler {
             return bestDist <= 18 ? best : null;
         };
 
-        const showDragTooltip = (coords) => {
-            if (!coords) return;
-            const scheduler = this.schedulers[entityId];
-            const graph = scheduler?.graphs?.[graphIndex];
-            if (!graph) return;
-            const unit = graph.unit || '';
-            this.hidePointTooltipMulti(section);
-            const tooltip = document.createElement('div');
-            tooltip.className = 'point-tooltip';
-
-            // Format X value based on axis type
-            const isEntityBased = graph.xAxisType === 'entity';
-            const xDisplay = isEntityBased
-                ? `${coords.x.toFixed(1)}${graph.xAxisUnit || ''}`
-                : minutesToTime(Math.round(coords.x));
-
-            tooltip.innerHTML = `
-                <span class="time">${xDisplay}</span>
-                <span class="value">${coords.y.toFixed(1)}${unit}</span>
-            `;
-
-            // Calculate position based on axis type
-            const yRange = graph.maxY - graph.minY;
-            let xRatio;
-            if (isEntityBased) {
-                const xMin = graph.xAxisMin ?? 0;
-                const xMax = graph.xAxisMax ?? 100;
-                const xRange = xMax - xMin;
-                const zoomLevel = graph.zoomLevel || 1;
-                const visibleRange = xRange / zoomLevel;
-                const startX = xMin + (graph.zoomOffset || 0) * xRange;
-                xRatio = (coords.x - startX) / visibleRange;
-            } else {
-                xRatio = (coords.x - (graph.zoomOffset || 0)) / (1440 / (graph.zoomLevel || 1));
-            }
-            const yRatio = 1 - (coords.y - graph.minY) / yRange;
-            tooltip.style.left = `${Math.max(0, Math.min(1, xRatio)) * 100}%`;
-            tooltip.style.top = `${Math.max(0, Math.min(1, yRatio)) * 100}%`;
-            tooltip.classList.add(yRatio * 100 < 20 ? 'below' : 'above');
-            graphContainer.appendChild(tooltip);
-        };
-
         // Helper to get coordinates from touch event
         const getTouchCoords = (touch) => {
             const scheduler = this.schedulers[entityId];
@@ -4604,7 +4352,7 @@ class GraphHandler {
             const graph = scheduler.graphs[graphIndex];
             if (!graph) return null;
 
-            const rect = graphContainer.getBoundingClientRect();
+            rect = rect || graphContainer.getBoundingClientRect();
             const isEntityBased = graph.xAxisType === 'entity';
             const zoomLevel = graph.zoomLevel || 1;
             const zoomOffset = graph.zoomOffset || 0;
@@ -4650,6 +4398,7 @@ class GraphHandler {
             touchStartTime = Date.now();
             hasMoved = false;
             ignoreTouch = false;
+            rect = graphContainer.getBoundingClientRect();
 
             // Ignore touches that originate on the controls menu
             const path = e.composedPath ? e.composedPath() : [];
@@ -4693,6 +4442,25 @@ class GraphHandler {
             }
         }, { passive: false });
 
+        // Move the dragged point and redraw panned graphs once per frame
+        const drag = frameThrottle((touch) => {
+            const graph = this.schedulers[entityId]?.graphs?.[graphIndex];
+            const coords = graph && dragPointIndex >= 0 ? getTouchCoords(touch) : null;
+            if (!coords) return;
+
+            // Calculate tolerance based on X-axis type
+            const isEntityBased = graph.xAxisType === 'entity';
+            const xTolerance = isEntityBased
+                ? ((graph.xAxisMax ?? 100) - (graph.xAxisMin ?? 0)) * 0.005
+                : 1;
+            const hasConflict = graph.points.some((p, i) => i !== dragPointIndex && Math.abs(p.x - coords.x) < xTolerance);
+            if (!hasConflict) {
+                graph.points[dragPointIndex] = coords;
+                this.updateDraggedPointMulti(entityId, graphIndex, section, touchedPoint, dragPointIndex);
+            }
+        });
+        const render = frameThrottle(() => this.panel.updateGraphSection(entityId, graphIndex, section));
+
         graphContainer.addEventListener('touchmove', (e) => {
             const scheduler = this.schedulers[entityId];
             if (!scheduler || !Array.isArray(scheduler.graphs)) return;
@@ -4717,49 +4485,14 @@ class GraphHandler {
                             touchedPoint.classList.add('dragging');
                             this.panel.saveUndoState(entityId);
                         }
-                        const coords = getTouchCoords(touch);
-                        if (coords) {
-                            // Calculate tolerance based on X-axis type
-                            const isEntityBased = graph.xAxisType === 'entity';
-                            const xTolerance = isEntityBased
-                                ? ((graph.xAxisMax ?? 100) - (graph.xAxisMin ?? 0)) * 0.005
-                                : 1;
-                            const hasConflict = graph.points.some((p, i) => i !== dragPointIndex && Math.abs(p.x - coords.x) < xTolerance);
-                            if (!hasConflict) {
-                                graph.points[dragPointIndex] = coords;
-
-                                // Move the point visually without full rerender to keep touch contact
-                                const rect = graphContainer.getBoundingClientRect();
-                                const zoomLevel = graph.zoomLevel || 1;
-
-                                let visibleRange, startX;
-                                if (isEntityBased) {
-                                    const xMin = graph.xAxisMin ?? 0;
-                                    const xMax = graph.xAxisMax ?? 100;
-                                    const xRange = xMax - xMin;
-                                    visibleRange = xRange / zoomLevel;
-                                    startX = xMin + (graph.zoomOffset || 0) * xRange;
-                                } else {
-                                    visibleRange = 1440 / zoomLevel;
-                                    startX = graph.zoomOffset || 0;
-                                }
-
-                                const yRange = graph.maxY - graph.minY;
-                                const xRatio = (coords.x - startX) / visibleRange;
-                                const yRatio = 1 - (coords.y - graph.minY) / yRange;
-                                touchedPoint.style.left = `${Math.max(0, Math.min(1, xRatio)) * 100}%`;
-                                touchedPoint.style.top = `${Math.max(0, Math.min(1, yRatio)) * 100}%`;
-                                this.updateCurrentValueMulti(entityId, graphIndex, section);
-                                showDragTooltip(coords);
-                            }
-                        }
+                        drag.schedule(touch);
                     } else {
                         // Started on empty area - pan (if zoomed)
                         const zoomLevel = graph.zoomLevel || 1;
                         if (zoomLevel > 1) {
                             e.preventDefault();
                             isPanning = true;
-                            const rect = graphContainer.getBoundingClientRect();
+                            rect = rect || graphContainer.getBoundingClientRect();
                             const deltaX = lastTouchX - touch.clientX;
 
                             // Calculate pan based on X-axis type
@@ -4777,7 +4510,7 @@ class GraphHandler {
                                 const minutesPerPixel = (1440 / zoomLevel) / rect.width;
                                 graph.zoomOffset = Math.max(0, Math.min(1440 - 1440 / zoomLevel, (graph.zoomOffset || 0) + deltaX * minutesPerPixel));
                             }
-                            this.panel.updateGraphSection(entityId, graphIndex, section);
+                            render.schedule();
                         }
                     }
                     lastTouchX = touch.clientX;
@@ -4813,6 +4546,8 @@ class GraphHandler {
         }, { passive: false });
 
         graphContainer.addEventListener('touchend', (e) => {
+            drag.flush();
+            render.flush();
             const touchDuration = Date.now() - touchStartTime;
             const now = Date.now();
 
@@ -4971,7 +4706,6 @@ class GraphHandler {
 }
 
 
-
 // === SERVICES ===
 /**
  * Universal Scheduler - Services Module
@@ -5115,6 +4849,8 @@ function saveScheduler(hass, entityId, scheduler) {
         x_axis_min: graph.xAxisMin ?? null,
         x_axis_max: graph.xAxisMax ?? null,
         x_axis_unit: graph.xAxisUnit || null,
+        x_axis_debounce: graph.xAxisDebounce ?? null,
+        x_axis_deadband: graph.xAxisDeadband ?? null,
         points: graph.points || []
     }));
 
@@ -5130,6 +4866,7 @@ function saveScheduler(hass, entityId, scheduler) {
         override_behavior: scheduler.overrideBehavior || 'none',
         override_duration: scheduler.overrideDuration || 3600
     }).then(() => {
+        sharedSchedulers.invalidate(entityId);
         console.log('Scheduler saved:', entityId);
     });
 }
@@ -5141,6 +4878,7 @@ function deleteScheduler(hass, entityId) {
     return hass.callService('universal_scheduler', 'delete_scheduler', {
         entity_id: entityId
     }).then(() => {
+        sharedSchedulers.invalidate(entityId);
         console.log('Scheduler deleted:', entityId);
     });
 }
@@ -5149,10 +4887,7 @@ function deleteScheduler(hass, entityId) {
  * Load schedulers from Home Assistant via WebSocket (multi-graph format)
  */
 function loadSchedulersFromHA(hass, getEntityInfo) {
-    return hass.callWS({
-        type: 'universal_scheduler/get_schedulers'
-    }).then(response => {
-        const schedulers = response?.schedulers || {};
+    return sharedSchedulers.fetch(hass).then(schedulers => {
         const result = {};
 
         Object.entries(schedulers).forEach(([entityId, config]) => {
@@ -5184,7 +4919,7 @@ function loadSchedulersFromHA(hass, getEntityInfo) {
                 return {
                 id: graph.id || `graph_${index + 1}`,
                 label: graph.label || `Schedule ${index + 1}`,
-                weekdays: graph.weekdays || [0, 1, 2, 3, 4, 5, 6],
+                weekdays: [...(graph.weekdays || [0, 1, 2, 3, 4, 5, 6])],
                 attribute: graph.attribute || null,
                 mode: graph.mode || 'linear',
                 minY: graph.min_y ?? info.minY,
@@ -5198,7 +4933,10 @@ function loadSchedulersFromHA(hass, getEntityInfo) {
                 xAxisMin: graph.x_axis_min ?? null,
                 xAxisMax: graph.x_axis_max ?? null,
                 xAxisUnit: graph.x_axis_unit || '',
-                points: graph.points || defaultPoints,
+                xAxisDebounce: graph.x_axis_debounce ?? null,
+                xAxisDeadband: graph.x_axis_deadband ?? null,
+                // Copied, the panel edits points and weekdays in place and the configs are shared
+                points: (graph.points || defaultPoints).map(point => ({ ...point })),
                 unit: graphUnit,
                 // UI state (not persisted)
                 zoomLevel: 1,
@@ -5212,7 +4950,7 @@ function loadSchedulersFromHA(hass, getEntityInfo) {
                 graphs.push({
                     id: 'graph_1',
                     label: config.graph_label || 'Schedule 1',
-                    weekdays: config.weekdays || [0, 1, 2, 3, 4, 5, 6],
+                    weekdays: [...(config.weekdays || [0, 1, 2, 3, 4, 5, 6])],
                     attribute: config.attribute || null,
                     mode: config.mode || 'linear',
                     minY: config.min_y ?? info.minY,
@@ -5222,7 +4960,7 @@ function loadSchedulersFromHA(hass, getEntityInfo) {
                     stepToZero: config.step_to_zero ?? false,
                     xAxisType: 'time',
                     xAxisEntity: null,
-                    points: config.points || [{ x: 0, y: info.minY }, { x: 1440, y: info.minY }],
+                    points: (config.points || [{ x: 0, y: info.minY }, { x: 1440, y: info.minY }]).map(point => ({ ...point })),
                     unit: info.unit || '',
                     zoomLevel: 1,
                     zoomOffset: 0,
@@ -5290,10 +5028,8 @@ function loadSchedulersFromEntities(hass, getEntityInfo, parsePoints) {
 }
 
 
-
 // === MAIN PANEL ===
 // Import aliases
-const getEntityInfoUtil = getEntityInfo;
 const applySchedulerNowAPI = applySchedulerNow;
 const saveSchedulerAPI = saveScheduler;
 const deleteSchedulerAPI = deleteScheduler;
@@ -5359,6 +5095,7 @@ class UniversalSchedulerPanel extends HTMLElement {
             this.init();
             this._initialized = true;
         }
+        this._subscribeTicker();
     }
 
     set hass(hass) {
@@ -5418,10 +5155,8 @@ class UniversalSchedulerPanel extends HTMLElement {
         // Load existing schedulers
         this.loadSchedulersFromHA();
 
-        // Start current time marker update interval (every minute)
-        this._timeUpdateInterval = setInterval(() => {
-            this.updateAllTimeMarkers();
-        }, 60000); // Update every minute
+        // Move the current time markers on every new minute
+        this._subscribeTicker();
 
         // Handle window resize to re-render graphs
         this._resizeHandler = () => {
@@ -5438,19 +5173,32 @@ class UniversalSchedulerPanel extends HTMLElement {
         window.addEventListener('resize', this._resizeHandler);
     }
 
+    _subscribeTicker() {
+        if (this._root && !this._unsubscribeTicker) {
+            this._unsubscribeTicker = minuteTicker.subscribe((minute) => this.updateAllTimeMarkers(minute));
+        }
+    }
+
     // Update time markers for all schedulers (multi-graph)
-    updateAllTimeMarkers() {
+    updateAllTimeMarkers(minute) {
+        // What each open graph section showed at the last tick
+        this._tickKeys = this._tickKeys || new WeakMap();
+
         Object.keys(this.schedulers).forEach(entityId => {
             const scheduler = this.schedulers[entityId];
             const card = this._root.querySelector(`[data-entity="${entityId}"]`);
             if (!card || card.classList.contains('collapsed')) return;
 
-            // Update each open graph section
+            // Only update open graph sections that look different at this minute
+            const target = this._hass?.states?.[scheduler.entityId]?.last_updated;
             card.querySelectorAll('.graph-section').forEach((section, idx) => {
                 if (!section.classList.contains('collapsed')) {
                     const graph = scheduler.graphs[idx];
                     if (graph) {
-                        this.graphHandler.updateCurrentTimeMarkerMulti(section, graph);
+                        const key = `${target}|${this._graphClockKey(graph, minute)}`;
+                        if (this._tickKeys.get(section) === key) return;
+                        this._tickKeys.set(section, key);
+                        this.graphHandler.updateCurrentTimeMarkerMulti(section, graph, this._hass);
                         this.graphHandler.updateCurrentValueMulti(entityId, idx, section);
                     }
                 }
@@ -5458,10 +5206,21 @@ class UniversalSchedulerPanel extends HTMLElement {
         });
     }
 
+    // What a graph shows at a minute of the day, given its zoom
+    _graphClockKey(graph, minute) {
+        if (graph.xAxisType === 'entity') {
+            const state = this._hass?.states?.[graph.xAxisEntity]?.state;
+            return `${state}|${graph.zoomLevel}|${graph.zoomOffset}`;
+        }
+        const startMinute = graph.zoomOffset || 0;
+        return timeGraphKey(graph, minute, startMinute, startMinute + 1440 / (graph.zoomLevel || 1));
+    }
+
     // Clean up on disconnect
     disconnectedCallback() {
-        if (this._timeUpdateInterval) {
-            clearInterval(this._timeUpdateInterval);
+        if (this._unsubscribeTicker) {
+            this._unsubscribeTicker();
+            this._unsubscribeTicker = null;
         }
         if (this._resizeHandler) {
             window.removeEventListener('resize', this._resizeHandler);
@@ -6354,6 +6113,8 @@ class UniversalSchedulerPanel extends HTMLElement {
             section.querySelector('.x-axis-min-group').style.display = showEntity ? 'flex' : 'none';
             section.querySelector('.x-axis-max-group').style.display = showEntity ? 'flex' : 'none';
             section.querySelector('.x-axis-unit-group').style.display = showEntity ? 'flex' : 'none';
+            section.querySelector('.x-axis-debounce-group').style.display = showEntity ? 'flex' : 'none';
+            section.querySelector('.x-axis-deadband-group').style.display = showEntity ? 'flex' : 'none';
 
             // Toggle add-point input visibility
             const timeInput = section.querySelector('[data-new-point-time]');
@@ -6533,6 +6294,15 @@ class UniversalSchedulerPanel extends HTMLElement {
             this.updateGraphSection(entityId, graphIndex, section);
         });
 
+        // Debounce and deadband only affect how the backend reacts to the X entity
+        ['xAxisDebounce', 'xAxisDeadband'].forEach(setting => {
+            section.querySelector(`[data-graph-setting="${setting}"]`)?.addEventListener('change', (e) => {
+                this.saveUndoState(entityId);
+                const value = parseFloat(e.target.value);
+                getGraph()[setting] = isNaN(value) || value < 0 ? null : value;
+            });
+        });
+
         // Delete graph button
         section.querySelector('[data-action="deleteGraph"]')?.addEventListener('click', (e) => {
             e.stopPropagation();
@@ -7414,7 +7184,7 @@ class UniversalSchedulerPanel extends HTMLElement {
         const graph = scheduler.graphs?.[graphIndex];
         if (!graph || graph.xAxisType !== 'entity') return;
 
-        const { interpolateValue, interpolateValueWithStepToMin } = await import('./utils.js');
+        const { interpolateValue, interpolateValueWithStepToMin } = await import('./core.js');
 
         // Clamp X value to bounds
         const xMin = graph.xAxisMin ?? 0;
@@ -7499,5 +7269,4 @@ customElements.define('universal-curve-scheduler', UniversalSchedulerPanel);
 console.log('UniversalSchedulerPanel v3 (modular) loaded');
 
 
-
-})();
+export { PANEL_STYLES, PANEL_TEMPLATE, createGraphHTML, createSchedulerCardHTML, ATTRIBUTE_CONFIG, getAttributeConfig, getAttributeUnit, getAttributeRange, isKnownAttribute, GraphHandler, saveScheduler, deleteScheduler, loadSchedulersFromHA, loadSchedulersFromEntities };
@@ -3,7 +3,7 @@
  * Home Assistant service calls for applying values, saving, and deleting schedulers
  */
 
-import { interpolateValue, interpolateValueWithStepToMin } from './utils.js';
+import { interpolateValue, interpolateValueWithStepToMin, sharedSchedulers } from './utils.js';
 import { getAttributeUnit } from './attribute-config.js';
 
 /**
@@ -141,6 +141,8 @@ export function saveScheduler(hass, entityId, scheduler) {
         x_axis_min: graph.xAxisMin ?? null,
         x_axis_max: graph.xAxisMax ?? null,
         x_axis_unit: graph.xAxisUnit || null,
+        x_axis_debounce: graph.xAxisDebounce ?? null,
+        x_axis_deadband: graph.xAxisDeadband ?? null,
         points: graph.points || []
     }));
 
@@ -156,6 +158,7 @@ export function saveScheduler(hass, entityId, scheduler) {
         override_behavior: scheduler.overrideBehavior || 'none',
         override_duration: scheduler.overrideDuration || 3600
     }).then(() => {
+        sharedSchedulers.invalidate(entityId);
         console.log('Scheduler saved:', entityId);
     });
 }
@@ -167,6 +170,7 @@ export function deleteScheduler(hass, entityId) {
     return hass.callService('universal_scheduler', 'delete_scheduler', {
         entity_id: entityId
     }).then(() => {
+        sharedSchedulers.invalidate(entityId);
         console.log('Scheduler deleted:', entityId);
     });
 }
@@ -175,10 +179,7 @@ export function deleteScheduler(hass, entityId) {
  * Load schedulers from Home Assistant via WebSocket (multi-graph format)
  */
 export function loadSchedulersFromHA(hass, getEntityInfo) {
-    return hass.callWS({
-        type: 'universal_scheduler/get_schedulers'
-    }).then(response => {
-        const schedulers = response?.schedulers || {};
+    return sharedSchedulers.fetch(hass).then(schedulers => {
         const result = {};
 
         Object.entries(schedulers).forEach(([entityId, config]) => {
@@ -210,7 +211,7 @@ export function loadSchedulersFromHA(hass, getEntityInfo) {
                 return {
                 id: graph.id || `graph_${index + 1}`,
                 label: graph.label || `Schedule ${index + 1}`,
-                weekdays: graph.weekdays || [0, 1, 2, 3, 4, 5, 6],
+                weekdays: [...(graph.weekdays || [0, 1, 2, 3, 4, 5, 6])],
                 attribute: graph.attribute || null,
                 mode: graph.mode || 'linear',
                 minY: graph.min_y ?? info.minY,
@@ -224,7 +225,10 @@ export function loadSchedulersFromHA(hass, getEntityInfo) {
                 xAxisMin: graph.x_axis_min ?? null,
                 xAxisMax: graph.x_axis_max ?? null,
                 xAxisUnit: graph.x_axis_unit || '',
-                points: graph.points || defaultPoints,
+                xAxisDebounce: graph.x_axis_debounce ?? null,
+                xAxisDeadband: graph.x_axis_deadband ?? null,
+                // Copied, the panel edits points and weekdays in place and the configs are shared
+                points: (graph.points || defaultPoints).map(point => ({ ...point })),
                 unit: graphUnit,
                 // UI state (not persisted)
                 zoomLevel: 1,
@@ -238,7 +242,7 @@ export function loadSchedulersFromHA(hass, getEntityInfo) {
                 graphs.push({
                     id: 'graph_1',
                     label: config.graph_label || 'Schedule 1',
-                    weekdays: config.weekdays || [0, 1, 2, 3, 4, 5, 6],
+                    weekdays: [...(config.weekdays || [0, 1, 2, 3, 4, 5, 6])],
                     attribute: config.attribute || null,
                     mode: config.mode || 'linear',
                     minY: config.min_y ?? info.minY,
@@ -248,7 +252,7 @@ export function loadSchedulersFromHA(hass, getEntityInfo) {
                     stepToZero: config.step_to_zero ?? false,
                     xAxisType: 'time',
                     xAxisEntity: null,
-                    points: config.points || [{ x: 0, y: info.minY }, { x: 1440, y: info.minY }],
+                    points: (config.points || [{ x: 0, y: info.minY }, { x: 1440, y: info.minY }]).map(point => ({ ...point })),
                     unit: info.unit || '',
                     zoomLevel: 1,
                     zoomOffset: 0,
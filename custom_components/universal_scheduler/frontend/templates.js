@@ -330,6 +330,14 @@ export function createGraphHTML(graph, graphIndex, scheduler) {
                                 <label>X Unit</label>
                                 <input type="text" data-graph-setting="xAxisUnit" value="${graph.xAxisUnit || ''}" placeholder="lx" style="width: 50px;">
                             </div>
+                            <div class="input-group x-axis-debounce-group" style="display: ${graph.xAxisType === 'entity' ? 'flex' : 'none'};" title="Seconds to wait after the X entity changes before applying it">
+                                <label>Debounce (s)</label>
+                                <input type="number" data-graph-setting="xAxisDebounce" value="${graph.xAxisDebounce ?? ''}" min="0" placeholder="0" style="width: 60px;">
+                            </div>
+                            <div class="input-group x-axis-deadband-group" style="display: ${graph.xAxisType === 'entity' ? 'flex' : 'none'};" title="Minimum change of the X value that triggers an update">
+                                <label>Deadband</label>
+                                <input type="number" data-graph-setting="xAxisDeadband" value="${graph.xAxisDeadband ?? ''}" min="0" placeholder="0" style="width: 60px;">
+                            </div>
                         </div>
                     </div>
                 </div>
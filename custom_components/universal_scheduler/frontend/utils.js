@@ -135,44 +135,117 @@ export function getDomainIcon(domain) {
     return icons[domain] || 'mdi:help-circle';
 }
 
+// Samples of smooth segments per visible range
+const SMOOTH_PATH_SAMPLES = 200;
+
 /**
- * Generate interpolated path points
- * If stepToZero is enabled and a point has y=0, the line will step down to 0 immediately
+ * Generate the points of a graph's curve between startMinute and endMinute,
+ * to be joined by straight lines. Walks the segments once: linear and step
+ * segments are exact, smooth segments are sampled by their visible width.
+ * If stepToZero is enabled and a point has y=minY, the line holds the
+ * previous value and steps down to minY at that point
  */
 export function generateInterpolatedPath(scheduler, startMinute, endMinute) {
-    const points = scheduler.points;
     const mode = scheduler.mode;
     const stepToZero = scheduler.stepToZero || false;
-    const result = [];
-    const step = Math.max(1, Math.floor((endMinute - startMinute) / 200)); // ~200 points for smooth curve
+    const minY = scheduler.minY;
 
     // In step mode we want vertical transitions exactly at change boundaries
     if (mode === 'step' && !stepToZero) {
-        return generateStepPath(points, startMinute, endMinute, scheduler.minY, scheduler.maxY);
+        return generateStepPath(scheduler.points, startMinute, endMinute, minY, scheduler.maxY);
     }
 
-    // If stepToZero is enabled, we need to handle zero points specially
-    if (stepToZero) {
-        for (let x = startMinute; x <= endMinute; x += step) {
-            const y = interpolateValueWithStepToMin(x, points, mode, scheduler.minY, scheduler.maxY);
-            result.push({ x, y });
-        }
-    } else {
-        for (let x = startMinute; x <= endMinute; x += step) {
-            const y = interpolateValue(x, points, mode, scheduler.minY, scheduler.maxY);
-            result.push({ x, y });
+    const points = sortedByX(scheduler.points || []);
+    if (points.length === 0) {
+        return [
+            { x: startMinute, y: minY },
+            { x: endMinute, y: minY },
+        ];
+    }
+
+    const result = [];
+    const add = (x, y) => {
+        const last = result[result.length - 1];
+        if (!last || last.x !== x || last.y !== y) result.push({ x, y });
+    };
+    const first = points[0];
+    const last = points[points.length - 1];
+    const samples = SMOOTH_PATH_SAMPLES / Math.max(endMinute - startMinute, 1);
+
+    // Before the first and after the last point the curve is flat
+    if (startMinute < first.x) {
+        add(startMinute, first.y);
+        add(Math.min(first.x, endMinute), first.y);
+    }
+    for (let i = 0; i < points.length - 1; i++) {
+        const p1 = points[i];
+        const p2 = points[i + 1];
+        if (p2.x <= startMinute || p1.x === p2.x) continue;
+        if (p1.x >= endMinute) break;
+
+        const from = Math.max(p1.x, startMinute);
+        const to = Math.min(p2.x, endMinute);
+        if (stepToZero && p2.y <= minY) {
+            // Hold until the next point, then drop to min
+            add(from, p1.y);
+            add(to, p1.y);
+            if (to === p2.x) add(to, minY);
+        } else if (stepToZero && p1.y <= minY) {
+            // Rising from min starts after 1% of the segment
+            const rise = p1.x + (p2.x - p1.x) * 0.01;
+            if (from < rise) {
+                add(from, minY);
+                add(Math.min(rise, to), minY);
+            }
+            if (to > rise) addSegment(add, p1, p2, Math.max(from, rise), to, mode, samples);
+        } else {
+            addSegment(add, p1, p2, from, to, mode, samples);
         }
     }
+    if (endMinute > last.x) {
+        add(Math.max(last.x, startMinute), last.y);
+        add(endMinute, last.y);
+    }
+    return result;
+}
 
-    // Ensure end point is included
-    if (result.length === 0 || result[result.length - 1].x !== endMinute) {
-        const y = stepToZero
-            ? interpolateValueWithStepToMin(endMinute, points, mode, scheduler.minY, scheduler.maxY)
-            : interpolateValue(endMinute, points, mode, scheduler.minY, scheduler.maxY);
-        result.push({ x: endMinute, y });
+// Add the part of the curve between two points from x=from to x=to
+function addSegment(add, p1, p2, from, to, mode, samples) {
+    if (mode === 'step') {
+        add(from, p1.y);
+        add(to, p1.y);
+        return;
     }
 
-    return result;
+    const width = p2.x - p1.x;
+    const dy = p2.y - p1.y;
+    if (mode !== 'smooth') {
+        add(from, from === p1.x ? p1.y : p1.y + (dy * (from - p1.x)) / width);
+        add(to, to === p2.x ? p2.y : p1.y + (dy * (to - p1.x)) / width);
+        return;
+    }
+
+    // Cosine interpolation, sampled more densely the wider it shows
+    const count = dy === 0 ? 1 : Math.ceil((to - from) * samples);
+    for (let k = 0; k <= count; k++) {
+        const x = k === count ? to : from + ((to - from) * k) / count;
+        add(x, p1.y + (dy * (1 - Math.cos(((x - p1.x) / width) * Math.PI))) / 2);
+    }
+}
+
+// Return points sorted by x, copying them only if they are not yet
+function sortedByX(points) {
+    return isSortedByX(points) ? points : [...points].sort((a, b) => a.x - b.x);
+}
+
+/**
+ * Check whether points are sorted by x
+ */
+export function isSortedByX(points) {
+    for (let i = 1; i < points.length; i++) {
+        if (points[i].x < points[i - 1].x) return false;
+    }
+    return true;
 }
 
 // Build a step-path with explicit vertical transitions at change points
@@ -184,7 +257,7 @@ function generateStepPath(points, startMinute, endMinute, minY, maxY) {
         ];
     }
 
-    const sorted = [...points].sort((a, b) => a.x - b.x);
+    const sorted = sortedByX(points);
     const valueAt = (x) => interpolateValue(x, sorted, 'step', minY, maxY);
 
     const path = [];
@@ -321,3 +394,207 @@ export function parsePoints(pointsData) {
 export function clamp(value, min, max) {
     return Math.max(min, Math.min(max, value));
 }
+
+/**
+ * Live copy of all scheduler configs, kept up to date by one
+ * universal_scheduler/subscribe WebSocket subscription shared by all listeners.
+ * The backend sends a snapshot first and then one delta per changed scheduler.
+ * Without a subscription, fetch() serves configs from one shared request.
+ */
+export class SchedulerSubscription {
+    constructor() {
+        this.schedulers = null;
+        this.revision = 0;
+        this._listeners = new Set();
+        this._unsubscribe = null;
+        // Configs fetched while not subscribed
+        this._cache = null;
+        this._stale = new Set();
+        this._request = null;
+    }
+
+    get connected() {
+        return this._unsubscribe !== null;
+    }
+
+    /**
+     * Call listener(schedulers, entityId) on the snapshot (entityId null) and
+     * on every change. Returns a function removing the listener again.
+     */
+    subscribe(hass, listener) {
+        this._listeners.add(listener);
+        if (!this._unsubscribe) {
+            this._unsubscribe = hass.connection.subscribeMessage(
+                (msg) => this._handleMessage(msg),
+                { type: 'universal_scheduler/subscribe' }
+            );
+            this._unsubscribe.catch((err) => {
+                console.error('Failed to subscribe to schedulers:', err);
+                this._unsubscribe = null;
+                // Let listeners fall back to fetching the configs themselves
+                this._listeners.forEach((listener) => listener(null, null));
+            });
+        } else if (this.schedulers) {
+            listener(this.schedulers, null);
+        }
+
+        return () => {
+            this._listeners.delete(listener);
+            if (this._listeners.size === 0 && this._unsubscribe) {
+                this._unsubscribe.then((unsub) => unsub()).catch(() => {});
+                this._unsubscribe = null;
+                this.schedulers = null;
+                this.revision = 0;
+            }
+        };
+    }
+
+    /**
+     * Return all scheduler configs: the live copy while subscribed, else the
+     * cached configs unless entityId (or any scheduler, without entityId) was
+     * invalidated. Concurrent callers share one get_schedulers request.
+     * The configs are shared, so callers must not modify them.
+     */
+    async fetch(hass, entityId = null) {
+        if (this.schedulers) return this.schedulers;
+        const stale = entityId ? this._stale.has(entityId) : this._stale.size > 0;
+        if (this._cache && !stale) return this._cache;
+
+        if (!this._request) {
+            const request = hass.callWS({ type: 'universal_scheduler/get_schedulers' })
+                .then((result) => {
+                    // Only keep the result if nothing was invalidated meanwhile
+                    if (request === this._request) {
+                        this._cache = result.schedulers || {};
+                        this._stale.clear();
+                    }
+                    return result.schedulers || {};
+                })
+                .finally(() => {
+                    if (request === this._request) this._request = null;
+                });
+            this._request = request;
+        }
+        return this._request;
+    }
+
+    /**
+     * Mark the config of a scheduler (or of all, without entityId) as
+     * changed, so the next fetch() gets it from the backend again.
+     */
+    invalidate(entityId = null) {
+        if (entityId) {
+            this._stale.add(entityId);
+        } else {
+            this._cache = null;
+        }
+        this._request = null;
+    }
+
+    _handleMessage(msg) {
+        if (msg.action === 'snapshot') {
+            // Also sent again after a reconnect
+            this.schedulers = { ...msg.schedulers };
+            this._cache = null;
+        } else if (!this.schedulers || msg.revision <= this.revision) {
+            return;
+        } else if (msg.action === 'removed') {
+            delete this.schedulers[msg.entity_id];
+        } else {
+            this.schedulers[msg.entity_id] = msg.config;
+        }
+        this.revision = msg.revision;
+
+        const entityId = msg.action === 'snapshot' ? null : msg.entity_id;
+        this._listeners.forEach((listener) => listener(this.schedulers, entityId));
+    }
+}
+
+/**
+ * Get the current minute of the day
+ */
+export function currentMinute() {
+    const now = new Date();
+    return now.getHours() * 60 + now.getMinutes();
+}
+
+/**
+ * Describe what a time-based graph shows at a minute of the day: the time
+ * marker if it is within the visible minutes, the curve segment the current
+ * value lies on and, unless that segment is flat, the minute itself.
+ * The graph only needs updating when this changes.
+ */
+export function timeGraphKey(graph, minute, startMinute = 0, endMinute = 1440) {
+    let prev = null;
+    let next = null;
+    for (const p of graph.points || []) {
+        if (p.x <= minute) {
+            if (!prev || p.x >= prev.x) prev = p;
+        } else if (!next || p.x < next.x) {
+            next = p;
+        }
+    }
+    const flat = graph.mode === 'step' || !prev || !next || prev.y === next.y;
+    const marker = minute >= startMinute && minute <= endMinute ? minute : '';
+    return `${startMinute}-${endMinute}@${marker}|${prev?.x}-${next?.x}|${flat ? '' : minute}`;
+}
+
+/**
+ * One timer for all cards and graphs on the page, calling its listeners
+ * with the minute of the day right after every minute boundary.
+ * It only runs while there are listeners and the page is visible; when the
+ * page becomes visible again listeners catch up on the missed minutes.
+ */
+export class MinuteTicker {
+    constructor() {
+        this._listeners = new Set();
+        this._timer = null;
+        this._minute = null;
+        this._onVisibilityChange = () => this._tick();
+    }
+
+    /**
+     * Call listener(minute) on every new minute. Returns a function removing
+     * the listener again.
+     */
+    subscribe(listener) {
+        this._listeners.add(listener);
+        if (this._listeners.size === 1) {
+            document.addEventListener('visibilitychange', this._onVisibilityChange);
+            this._minute = currentMinute();
+            this._schedule();
+        }
+
+        return () => {
+            this._listeners.delete(listener);
+            if (this._listeners.size === 0) {
+                document.removeEventListener('visibilitychange', this._onVisibilityChange);
+                clearTimeout(this._timer);
+                this._timer = null;
+            }
+        };
+    }
+
+    _schedule() {
+        clearTimeout(this._timer);
+        this._timer = null;
+        if (document.hidden || this._listeners.size === 0) return;
+
+        const now = new Date();
+        const delay = 60000 - (now.getSeconds() * 1000 + now.getMilliseconds());
+        this._timer = setTimeout(() => this._tick(), delay);
+    }
+
+    _tick() {
+        const minute = currentMinute();
+        if (!document.hidden && minute !== this._minute) {
+            this._minute = minute;
+            this._listeners.forEach((listener) => listener(minute));
+        }
+        this._schedule();
+    }
+}
+
+// Shared by the panel and all cards
+export const sharedSchedulers = new SchedulerSubscription();
+export const minuteTicker = new MinuteTicker();
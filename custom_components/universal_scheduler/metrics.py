@@ -0,0 +1,131 @@
+"""Runtime metrics of the Universal Scheduler engine."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+# Counters summed over all schedulers, including removed ones
+COUNTERS = (
+    "evaluations",
+    "dispatches",
+    "suppressed",
+    "service_calls",
+    "dropped",
+    "errors",
+    "dispatch_errors",
+)
+
+
+class SchedulerMetrics:
+    """Counters and timings of one scheduler since it was created."""
+
+    __slots__ = (
+        "evaluations",
+        "dispatches",
+        "suppressed",
+        "service_calls",
+        "dropped",
+        "errors",
+        "dispatch_errors",
+        "last_duration",
+        "max_duration",
+        "last_lag",
+        "max_lag",
+    )
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self.evaluations = 0  # Schedule evaluations
+        self.dispatches = 0  # Command sequences queued for the target
+        self.suppressed = 0  # Command sequences skipped as unchanged
+        self.service_calls = 0  # Service calls sent successfully
+        self.dropped = 0  # Queued sequences replaced before being sent
+        self.errors = 0  # Evaluations that raised
+        self.dispatch_errors = 0  # Service calls that raised
+        self.last_duration = 0.0  # Seconds spent in the last evaluation
+        self.max_duration = 0.0
+        self.last_lag = 0.0  # Seconds the last timed evaluation started late
+        self.max_lag = 0.0
+
+    def record_evaluation(self, duration: float) -> None:
+        """Record one evaluation taking duration seconds."""
+        self.evaluations += 1
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+
+    def record_lag(self, lag: float) -> None:
+        """Record how late a timed evaluation started versus its target time."""
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics, with timings in milliseconds."""
+        return {
+            "evaluations": self.evaluations,
+            "dispatches": self.dispatches,
+            "suppressed": self.suppressed,
+            "service_calls": self.service_calls,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "dispatch_errors": self.dispatch_errors,
+            "last_duration_ms": round(self.last_duration * 1000, 3),
+            "max_duration_ms": round(self.max_duration * 1000, 3),
+            "last_lag_ms": round(self.last_lag * 1000, 3),
+            "max_lag_ms": round(self.max_lag * 1000, 3),
+        }
+
+
+@callback
+def async_retire_metrics(hass: HomeAssistant, metrics: SchedulerMetrics) -> None:
+    """Keep the counters of a removed scheduler in the integration totals.
+
+    The totals then never decrease while the integration is loaded, as the
+    total_increasing metrics sensor requires.
+    """
+    retired = hass.data[DOMAIN].setdefault(
+        "retired_metrics", dict.fromkeys(COUNTERS, 0)
+    )
+    for key in COUNTERS:
+        retired[key] += getattr(metrics, key)
+
+
+@callback
+def async_aggregate_metrics(hass: HomeAssistant) -> dict[str, Any]:
+    """Return the metrics of all schedulers summed up, plus engine load."""
+    domain_data = hass.data[DOMAIN]
+    entities = domain_data.get("switch_entities", {}).values()
+    all_metrics = [entity.metrics for entity in entities]
+    retired = domain_data.get("retired_metrics", {})
+
+    totals: dict[str, Any] = {
+        "schedulers": len(all_metrics),
+        "active_schedulers": sum(1 for entity in entities if entity.is_on),
+    }
+    for key in COUNTERS:
+        totals[key] = retired.get(key, 0) + sum(
+            getattr(metrics, key) for metrics in all_metrics
+        )
+
+    durations = [metrics.last_duration for metrics in all_metrics]
+    totals["mean_duration_ms"] = round(
+        sum(durations) / len(durations) * 1000 if durations else 0.0, 3
+    )
+    totals["max_duration_ms"] = round(
+        max((metrics.max_duration for metrics in all_metrics), default=0.0) * 1000,
+        3,
+    )
+    totals["max_lag_ms"] = round(
+        max((metrics.max_lag for metrics in all_metrics), default=0.0) * 1000, 3
+    )
+
+    if dispatcher := domain_data.get("dispatcher"):
+        totals.update(dispatcher.async_stats())
+    if queue := domain_data.get("command_queue"):
+        lanes = queue.async_lane_stats()
+        totals["queue_depth"] = sum(lane["depth"] for lane in lanes.values())
+        totals["queues"] = lanes
+    return totals
@@ -0,0 +1,232 @@
+"""Typed graph model of Universal Scheduler."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    DEFAULT_MAX_Y,
+    DEFAULT_MIN_Y,
+    DEFAULT_MODE,
+    MODE_LINEAR,
+    MODE_SMOOTH,
+    MODE_STEP,
+)
+from .curve import CompiledCurve
+
+ALL_WEEKDAYS = (0, 1, 2, 3, 4, 5, 6)  # 0=Sunday
+DEFAULT_POINTS = ({"x": 0, "y": 0}, {"x": 1440, "y": 0})
+X_AXIS_TIME = "time"
+X_AXIS_ENTITY = "entity"
+
+POINT_SCHEMA = vol.Schema(
+    {
+        vol.Required("x"): vol.Coerce(float),
+        vol.Required("y"): vol.Coerce(float),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+# Graph schema for individual graphs within a scheduler. Keys the engine does
+# not know are kept, so frontend-only settings survive a round trip.
+GRAPH_SCHEMA = vol.Schema(
+    {
+        vol.Required("id"): cv.string,
+        vol.Optional("label"): cv.string,
+        vol.Optional("weekdays"): [vol.All(vol.Coerce(int), vol.Range(min=0, max=6))],
+        vol.Optional("attribute"): vol.Any(None, cv.string),
+        vol.Optional("mode"): vol.In([MODE_LINEAR, MODE_SMOOTH, MODE_STEP]),
+        vol.Optional("min_y"): vol.Coerce(float),
+        vol.Optional("max_y"): vol.Coerce(float),
+        vol.Optional("x_snap"): vol.Any(None, vol.Coerce(float)),
+        vol.Optional("y_snap"): vol.Any(None, vol.Coerce(float)),
+        vol.Optional("step_to_zero"): cv.boolean,
+        vol.Optional("x_axis_type"): vol.In([X_AXIS_TIME, X_AXIS_ENTITY]),
+        vol.Optional("x_axis_entity"): vol.Any(
+            None, cv.string
+        ),  # entity for x-axis value
+        vol.Optional("x_axis_min"): vol.Any(
+            None, vol.Coerce(float)
+        ),  # min value for entity-based x-axis
+        vol.Optional("x_axis_max"): vol.Any(
+            None, vol.Coerce(float)
+        ),  # max value for entity-based x-axis
+        vol.Optional("x_axis_unit"): vol.Any(
+            None, cv.string
+        ),  # unit for entity-based x-axis display
+        vol.Optional("x_axis_debounce"): vol.Any(
+            None, vol.All(vol.Coerce(float), vol.Range(min=0))
+        ),  # seconds to wait for the x-axis entity to settle
+        vol.Optional("x_axis_deadband"): vol.Any(
+            None, vol.All(vol.Coerce(float), vol.Range(min=0))
+        ),  # minimum x-axis change that triggers an update
+        vol.Optional("points"): [POINT_SCHEMA],
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+def _valid_range(config: dict[str, Any]) -> dict[str, Any]:
+    """Reject a date range ending before it starts."""
+    if "start" in config and config["end"] < config["start"]:
+        raise vol.Invalid("end must not be before start")
+    return config
+
+
+_ISO_DATE = vol.All(cv.date, date.isoformat)
+
+# A day exception replaces the weekday's graph on the matching dates, by the
+# graph of another weekday, a graph by id, or no graph at all (scheduler idle).
+# Dates are given as a list and/or a range; entity_id limits the exception to
+# days the entity is in the given state when the day is resolved.
+DAY_EXCEPTION_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional("label"): cv.string,
+            vol.Optional("dates"): [_ISO_DATE],
+            vol.Inclusive("start", "range"): _ISO_DATE,
+            vol.Inclusive("end", "range"): _ISO_DATE,
+            vol.Optional("entity_id"): cv.entity_id,
+            vol.Optional("state"): cv.string,  # default "on"
+            vol.Exclusive("weekday", "use"): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=6)
+            ),
+            vol.Exclusive("graph", "use"): cv.string,
+        }
+    ),
+    cv.has_at_least_one_key("dates", "start", "entity_id"),
+    _valid_range,
+)
+
+
+def _float(value: Any, default: float) -> float:
+    """Return value as a float, or default if it is unset."""
+    return float(default if value is None else value)
+
+
+@dataclass(frozen=True, slots=True)
+class Point:
+    """A point of a graph: X in minutes or X-axis units, Y in output units."""
+
+    x: float
+    y: float
+
+
+@dataclass(slots=True)
+class Graph:
+    """The settings of one graph the engine needs, normalized and typed.
+
+    Built once from the stored or received graph config, so evaluating a
+    scheduler never has to look up, default or convert config values.
+    """
+
+    id: str
+    label: str
+    weekdays: frozenset[int]
+    attribute: str | None
+    mode: str
+    min_y: float
+    max_y: float
+    step_to_min: bool
+    points: tuple[Point, ...]
+    # Entity providing the X value; None for the time of day
+    x_axis_entity: str | None = None
+    x_axis_min: float = 0.0
+    x_axis_max: float = 100.0
+    x_axis_debounce: float = 0.0  # Seconds to wait for the entity to settle
+    x_axis_deadband: float = 0.0  # Smallest X change causing an update
+    curve: CompiledCurve = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compile the points for fast evaluation."""
+        self.curve = CompiledCurve(
+            self.points, self.mode, self.min_y, self.max_y, self.step_to_min
+        )
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> Graph:
+        """Build a graph from its config, filling in defaults for unset keys."""
+        weekdays = config.get("weekdays")
+        points = config.get("points")
+        entity_based = config.get("x_axis_type") == X_AXIS_ENTITY
+        return cls(
+            id=str(config.get("id", "")),
+            label=str(config.get("label") or config.get("id", "")),
+            weekdays=frozenset(
+                int(day) for day in (ALL_WEEKDAYS if weekdays is None else weekdays)
+            ),
+            attribute=config.get("attribute") or None,
+            mode=config.get("mode") or DEFAULT_MODE,
+            min_y=_float(config.get("min_y"), DEFAULT_MIN_Y),
+            max_y=_float(config.get("max_y"), DEFAULT_MAX_Y),
+            step_to_min=bool(config.get("step_to_zero", False)),  # legacy flag name
+            points=tuple(
+                sorted(
+                    (
+                        Point(float(point["x"]), float(point["y"]))
+                        for point in (DEFAULT_POINTS if points is None else points)
+                    ),
+                    key=lambda point: point.x,
+                )
+            ),
+            x_axis_entity=(
+                (config.get("x_axis_entity") or None) if entity_based else None
+            ),
+            x_axis_min=_float(config.get("x_axis_min"), 0.0),
+            x_axis_max=_float(config.get("x_axis_max"), 100.0),
+            x_axis_debounce=_float(config.get("x_axis_debounce"), 0.0),
+            x_axis_deadband=_float(config.get("x_axis_deadband"), 0.0),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DayException:
+    """A date-specific replacement of the graph a weekday would use."""
+
+    label: str
+    dates: frozenset[date]
+    start: date | None
+    end: date | None
+    entity_id: str | None
+    state: str
+    weekday: int | None  # Use this weekday's graph (0=Sunday)
+    graph_id: str | None  # Use this graph; neither set means no graph
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> DayException:
+        """Build an exception from its config (dates as ISO strings)."""
+        start = config.get("start")
+        end = config.get("end")
+        weekday = config.get("weekday")
+        return cls(
+            label=config.get("label", ""),
+            dates=frozenset(
+                date.fromisoformat(str(day)) for day in config.get("dates", ())
+            ),
+            start=date.fromisoformat(str(start)) if start else None,
+            end=date.fromisoformat(str(end)) if end else None,
+            entity_id=config.get("entity_id") or None,
+            state=config.get("state", "on"),
+            weekday=None if weekday is None else int(weekday),
+            graph_id=config.get("graph"),
+        )
+
+    def matches(self, day: date, entity_state: str | None) -> bool:
+        """Return whether the exception applies to a day.
+
+        entity_state is the current state of entity_id, if the exception has
+        one. Date list and range match if either contains the day.
+        """
+        if self.entity_id is not None and entity_state != self.state:
+            return False
+        if not self.dates and self.start is None:
+            return True
+        if day in self.dates:
+            return True
+        return self.start is not None and self.start <= day <= (self.end or self.start)
@@ -0,0 +1,60 @@
+"""Engine metrics sensor for Universal Scheduler."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .metrics import async_aggregate_metrics
+
+# Metrics are aggregated over all schedulers, so refresh them sparingly
+SCAN_INTERVAL = timedelta(seconds=60)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the engine metrics sensor from config entry."""
+    async_add_entities([UniversalSchedulerMetricsSensor(hass, config_entry)], True)
+
+
+class UniversalSchedulerMetricsSensor(SensorEntity):
+    """Service calls made by all schedulers, with engine metrics as attributes."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:chart-timeline-variant"
+    _attr_name = "Universal Scheduler metrics"
+    _attr_native_unit_of_measurement = "calls"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    # Counters keep growing; long-term statistics only need the state
+    _unrecorded_attributes = frozenset({"metrics"})
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        """Initialize the metrics sensor."""
+        self.hass = hass
+        self._attr_unique_id = f"{config_entry.entry_id}_metrics"
+        self._metrics: dict[str, Any] = {}
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the service calls sent since the integration was loaded."""
+        return self._metrics.get("service_calls")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the aggregated engine metrics."""
+        return {"metrics": self._metrics}
+
+    async def async_update(self) -> None:
+        """Aggregate the metrics of all schedulers."""
+        if DOMAIN in self.hass.data:
+            self._metrics = async_aggregate_metrics(self.hass)
@@ -0,0 +1,220 @@
+"""Persistent storage for Universal Scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import hashlib
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback, valid_entity_id
+from homeassistant.helpers.storage import Store
+from homeassistant.util import slugify
+
+from .const import DOMAIN, SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.schedulers"
+STORAGE_VERSION = 2  # Bumped for multi-graph support
+STORAGE_MINOR_VERSION = 1
+GRAPHS_STORAGE_KEY = f"{DOMAIN}.graphs"
+GRAPHS_STORAGE_VERSION = 1
+
+
+class SchedulerStore(Store):
+    """Store for scheduler data with migration support."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict
+    ) -> dict:
+        """Migrate to the new version."""
+        if old_major_version == 1:
+            # Migrate from version 1 to version 2 (multi-graph format)
+            _LOGGER.info("Migrating scheduler storage from version 1 to 2")
+            schedulers = old_data.get("schedulers", {})
+
+            for cfg in schedulers.values():
+                if "graphs" not in cfg:
+                    # Extract graph-specific fields to create first graph
+                    graph = {
+                        "id": "graph_1",
+                        "label": cfg.pop("graph_label", "Schedule 1"),
+                        "weekdays": cfg.pop("weekdays", [0, 1, 2, 3, 4, 5, 6]),
+                        "attribute": cfg.pop("attribute", None),
+                        "mode": cfg.pop("mode", "linear"),
+                        "min_y": cfg.pop("min_y", 0),
+                        "max_y": cfg.pop("max_y", 100),
+                        "x_snap": cfg.pop("snap_minutes", 0)
+                        or 0,  # Convert snap_minutes to x_snap
+                        "y_snap": cfg.pop("y_snap", 0),
+                        "step_to_zero": cfg.pop("step_to_zero", False),
+                        "x_axis_type": "time",
+                        "x_axis_entity": None,
+                        "x_axis_min": None,
+                        "x_axis_max": None,
+                        "x_axis_unit": None,
+                        "points": cfg.pop(
+                            "points", [{"x": 0, "y": 0}, {"x": 1440, "y": 0}]
+                        ),
+                    }
+                    cfg["graphs"] = [graph]
+                    cfg.setdefault("graphs_per_row", 1)
+
+            old_data["multi_graph_migrated"] = True
+            return old_data
+
+        # For same major version, just return data
+        return old_data
+
+
+class SchedulerStorage:
+    """Scheduler configs, sharded into one store file per scheduler's graphs.
+
+    The main store holds the scheduler index with the top-level settings of
+    each scheduler, which are small. The graphs, which make up almost all of
+    the data, live in a store per scheduler so that editing one scheduler
+    only rewrites its own file. Saves are delayed and coalesced: any number
+    of changes within SAVE_DELAY seconds result in one write per changed file.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the storage."""
+        self.hass = hass
+        self._store = SchedulerStore(
+            hass, STORAGE_VERSION, STORAGE_KEY, minor_version=STORAGE_MINOR_VERSION
+        )
+        self._shards: dict[str, Store] = {}
+        # Stores with a delayed save pending -> function returning their data
+        self._pending: dict[Store, Callable[[], dict]] = {}
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Load the main store and merge in the graphs of every scheduler.
+
+        Graphs still stored inline in the main store (before sharding) are
+        moved to their own store files right away.
+        """
+        stored_data = await self._store.async_load()
+        if not stored_data:
+            return None
+
+        schedulers = stored_data.get("schedulers", {})
+        inline = [entity_id for entity_id, cfg in schedulers.items() if "graphs" in cfg]
+        sharded = [
+            entity_id for entity_id, cfg in schedulers.items() if "graphs" not in cfg
+        ]
+
+        shards = await asyncio.gather(
+            *(self._shard(entity_id).async_load() for entity_id in sharded)
+        )
+        for entity_id, shard_data in zip(sharded, shards, strict=True):
+            if shard_data is not None:
+                schedulers[entity_id]["graphs"] = shard_data.get("graphs", [])
+            elif stored_data.get("multi_graph_migrated"):
+                _LOGGER.warning("No stored graphs found for scheduler %s", entity_id)
+
+        if inline:
+            _LOGGER.info("Moving graphs of %s schedulers to own files", len(inline))
+            # Write the graphs first so they are never missing from both places
+            await asyncio.gather(
+                *(
+                    self._shard(entity_id).async_save(
+                        {"graphs": schedulers[entity_id]["graphs"]}
+                    )
+                    for entity_id in inline
+                )
+            )
+            await self._store.async_save(_without_graphs(stored_data))
+
+        return stored_data
+
+    @callback
+    def async_schedule_save(
+        self, entity_id: str | None = None, graphs_changed: bool = False
+    ) -> None:
+        """Schedule a delayed save of the main store and a changed shard.
+
+        Pass the scheduler's entity_id with graphs_changed=True when its
+        graphs changed; all other settings live in the main store.
+        """
+        if entity_id is not None and graphs_changed:
+            self._delay_save(
+                self._shard(entity_id), lambda: self._shard_data(entity_id)
+            )
+        self._delay_save(self._store, self._main_data)
+
+    async def async_remove(self, entity_id: str) -> None:
+        """Remove the graphs file of a deleted scheduler."""
+        shard = self._shard(entity_id)
+        del self._shards[entity_id]
+        self._pending.pop(shard, None)
+        await shard.async_remove()
+
+    async def async_flush(self) -> None:
+        """Write all pending delayed saves now."""
+        pending, self._pending = self._pending, {}
+        await asyncio.gather(
+            *(store.async_save(data_func()) for store, data_func in pending.items())
+        )
+
+    def _shard(self, entity_id: str) -> Store:
+        """Return the store holding the graphs of a scheduler."""
+        if (shard := self._shards.get(entity_id)) is None:
+            shard = self._shards[entity_id] = Store(
+                self.hass,
+                GRAPHS_STORAGE_VERSION,
+                f"{GRAPHS_STORAGE_KEY}.{_shard_name(entity_id)}",
+            )
+        return shard
+
+    def _delay_save(self, store: Store, data_func: Callable[[], dict]) -> None:
+        """Schedule a delayed save, replacing a pending one of the same store."""
+
+        def pending_data() -> dict:
+            """Return the data to write and clear the pending mark."""
+            self._pending.pop(store, None)
+            return data_func()
+
+        self._pending[store] = data_func
+        store.async_delay_save(pending_data, SAVE_DELAY)
+
+    def _main_data(self) -> dict[str, Any]:
+        """Return the current main store data."""
+        domain_data = self.hass.data[DOMAIN]
+        return _without_graphs(
+            {
+                "schedulers": domain_data["schedulers"],
+                "interval_in_seconds": domain_data.get("interval_in_seconds", True),
+                "multi_graph_migrated": domain_data.get("multi_graph_migrated", True),
+                "rate_limits": domain_data["rate_limits"],
+            }
+        )
+
+    def _shard_data(self, entity_id: str) -> dict[str, Any]:
+        """Return the current graphs store data of a scheduler."""
+        cfg = self.hass.data[DOMAIN]["schedulers"].get(entity_id, {})
+        return {"graphs": cfg.get("graphs", [])}
+
+
+def _shard_name(entity_id: str) -> str:
+    """Return a safe file name part for a scheduler's graphs store.
+
+    Entity IDs are used as is. Keys stored before they were validated are
+    slugified, with a hash of the original keeping them apart.
+    """
+    if valid_entity_id(entity_id):
+        return entity_id
+    digest = hashlib.sha1(entity_id.encode()).hexdigest()[:8]
+    return f"{slugify(entity_id)}_{digest}"
+
+
+def _without_graphs(data: dict[str, Any]) -> dict[str, Any]:
+    """Return main store data with the graphs left out of every scheduler."""
+    return {
+        **data,
+        "schedulers": {
+            entity_id: {key: value for key, value in cfg.items() if key != "graphs"}
+            for entity_id, cfg in data.get("schedulers", {}).items()
+        },
+    }
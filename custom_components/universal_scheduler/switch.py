@@ -1,25 +1,23 @@
 """Complete switch implementation for Universal Scheduler."""
 
+import hashlib
 import logging
 import json
-import math
+import time
 from typing import Any
-from datetime import datetime
-from datetime import timedelta
+from datetime import date, datetime, timedelta
 
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CoreState, HomeAssistant, State, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.event import (
-    async_track_time_interval,
     async_track_state_change_event,
     async_track_point_in_time,
 )
 from homeassistant.util import dt as dt_util
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.exceptions import HomeAssistantError
-from datetime import timedelta
 
 from .const import (
     DOMAIN,
@@ -35,10 +33,14 @@ from .const import (
     DEFAULT_MIN_Y,
     DEFAULT_MAX_Y,
     DEFAULT_UPDATE_INTERVAL,
-    MODE_LINEAR,
-    MODE_SMOOTH,
-    MODE_STEP,
+    MAX_NEXT_CHANGE_DELAY,
+    MIN_NEXT_CHANGE_DELAY,
 )
+from .commands import ServiceCommand, target_state_matches
+from .curve import CompiledCurve
+from .dispatcher import next_aligned_time
+from .metrics import SchedulerMetrics, async_retire_metrics
+from .models import DEFAULT_POINTS, DayException, Graph
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -74,9 +76,42 @@ async def async_setup_entry(
         async_add_entities(entities)
 
 
+async def async_remove_scheduler(hass: HomeAssistant, entity_id: str) -> None:
+    """Remove the switch entity of a deleted scheduler.
+
+    Removing the entity cancels all of its timers and listeners; the entity
+    registry entry goes too, so the switch does not linger as unavailable.
+    """
+    entity = hass.data[DOMAIN].get("switch_entities", {}).pop(entity_id, None)
+    if entity is None:
+        return
+
+    async_retire_metrics(hass, entity.metrics)
+    await entity.async_remove(force_remove=True)
+    registry = er.async_get(hass)
+    if registry.async_get(entity.entity_id):
+        registry.async_remove(entity.entity_id)
+    _LOGGER.debug("Removed scheduler switch %s", entity.entity_id)
+
+
 class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
     """Represents a Universal Scheduler switch entity."""
 
+    # Configuration changes rarely and carries no history value
+    _unrecorded_attributes = frozenset(
+        {
+            ATTR_TARGET_ENTITY,
+            "attribute",
+            ATTR_DOMAIN,
+            ATTR_MODE,
+            ATTR_MIN_Y,
+            ATTR_MAX_Y,
+            ATTR_UPDATE_INTERVAL,
+            "override_behavior",
+            "override_duration",
+        }
+    )
+
     def __init__(
         self, hass: HomeAssistant, name: str, entity_id: str, config: dict
     ) -> None:
@@ -87,7 +122,9 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
         # Respect the stored "enabled" flag so schedulers can start updating automatically
         self._is_on = bool(config.get("enabled", True))
         self._remove_listener = None
+        self._next_update_at: datetime | None = None  # Pending exact-change wakeup
         self._remove_x_axis_listeners: list = []  # For entity-based X-axis state tracking
+        self._remove_day_listener = None  # For entities of day exceptions
         self._remove_target_listener = None  # For manual override detection
         self._remove_override_timer = None  # For timed override recovery
 
@@ -111,13 +148,26 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
         self._is_overridden = False
         self._override_until = None  # datetime when override expires
         self._last_applied_value = None  # Track what we last applied
-
-        # Multi-graph support - store entire graphs array
-        self._graphs = config.get("graphs", [])
+        # Service calls last sent to the target, for write suppression
+        self._last_dispatched: tuple[ServiceCommand, ...] | None = None
+        # Evaluation, dispatch and error counters for diagnostics
+        self.metrics = SchedulerMetrics()
+        self._check_target_state = bool(config.get("check_target_state", False))
+        # The first evaluation catches up with the schedule, so it is compared
+        # with the target state to avoid re-sending values it already has
+        self._verify_target = True
+        # Order of the first evaluations after startup (higher goes first)
+        self._startup_priority = int(config.get("startup_priority", 0))
+        # X-axis value of the last evaluation, for the per-graph deadband
+        self._last_x_value: float | None = None
+
+        # Multi-graph support - typed graphs built from the graphs array
+        self._graphs: list[Graph] = []
+        graphs = config.get("graphs", [])
 
         # Legacy fallback - if no graphs array, create one from flat config
-        if not self._graphs:
-            self._graphs = [
+        if not graphs:
+            graphs = [
                 {
                     "id": "graph_1",
                     "label": config.get("graph_label", "Schedule 1"),
@@ -136,26 +186,53 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
                 }
             ]
 
-        # For backward compatibility, expose first graph's settings as primary
-        self._attribute = self._graphs[0].get("attribute") if self._graphs else None
-        self._mode = (
-            self._graphs[0].get("mode", DEFAULT_MODE) if self._graphs else DEFAULT_MODE
-        )
-        self._min_y = (
-            float(self._graphs[0].get("min_y", DEFAULT_MIN_Y))
-            if self._graphs
-            else DEFAULT_MIN_Y
-        )
-        self._max_y = (
-            float(self._graphs[0].get("max_y", DEFAULT_MAX_Y))
-            if self._graphs
-            else DEFAULT_MAX_Y
-        )
-        self._points = (
-            self._graphs[0].get("points", [{"x": 0, "y": 0}, {"x": 1440, "y": 0}])
-            if self._graphs
-            else []
+        # Graph of each weekday (0=Sunday), rebuilt with the graphs, and the
+        # graph resolved for one date including its day exceptions
+        self._day_table: tuple[Graph | None, ...] = ()
+        self._graphs_by_id: dict[str, Graph] = {}
+        self._resolved_day: tuple[date, Graph | None] | None = None
+        self._day_exceptions = [
+            DayException.from_config(exception)
+            for exception in config.get("day_exceptions", [])
+        ]
+
+        self._curve_hash = ""
+        self._load_graphs(graphs)
+
+        # Configuration part of the state attributes, rebuilt after changes
+        self._config_attributes: dict[str, Any] | None = None
+
+    def _load_graphs(self, graphs: list[dict]) -> None:
+        """Build the typed graphs, with compiled curves, from their configs."""
+        self._graphs = [Graph.from_config(graph) for graph in graphs]
+        self._graphs_by_id = {graph.id: graph for graph in self._graphs}
+        # First graph listing the weekday wins
+        self._day_table = tuple(
+            next((graph for graph in self._graphs if day in graph.weekdays), None)
+            for day in range(7)
         )
+        self._resolved_day = None
+        # Short fingerprint of the graphs, exposed instead of the points
+        self._curve_hash = hashlib.sha1(
+            json.dumps(graphs, sort_keys=True, default=str).encode()
+        ).hexdigest()[:12]
+
+        # For backward compatibility, expose first graph's settings as primary
+        if self._graphs:
+            primary = self._graphs[0]
+            self._attribute = primary.attribute
+            self._mode = primary.mode
+            self._min_y = primary.min_y
+            self._max_y = primary.max_y
+            self._points = graphs[0].get(
+                "points", [dict(point) for point in DEFAULT_POINTS]
+            )
+        else:
+            self._attribute = None
+            self._mode = DEFAULT_MODE
+            self._min_y = float(DEFAULT_MIN_Y)
+            self._max_y = float(DEFAULT_MAX_Y)
+            self._points = []
 
     @property
     def name(self) -> str:
@@ -177,6 +254,21 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
         """Set the entity ID."""
         pass  # Prevent Home Assistant from changing it
 
+    @property
+    def target_entity(self) -> str:
+        """Return the entity controlled by this scheduler."""
+        return self._target_entity
+
+    @property
+    def startup_priority(self) -> int:
+        """Return the priority of the first evaluation after startup."""
+        return self._startup_priority
+
+    @property
+    def next_update_at(self) -> datetime | None:
+        """Return the time of the pending exact-change update, if any."""
+        return self._next_update_at
+
     @property
     def is_on(self) -> bool:
         """Return True if switch is on."""
@@ -185,19 +277,20 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        attrs = {
-            ATTR_TARGET_ENTITY: self._target_entity,
-            "attribute": self._attribute,
-            ATTR_DOMAIN: self._domain,
-            ATTR_MODE: self._mode,
-            ATTR_MIN_Y: self._min_y,
-            ATTR_MAX_Y: self._max_y,
-            ATTR_UPDATE_INTERVAL: self._update_interval,
-            ATTR_POINTS: json.dumps(self._points),
-            "override_behavior": self._override_behavior,
-            "override_duration": self._override_duration,
-            "is_overridden": self._is_overridden,
-        }
+        if self._config_attributes is None:
+            self._config_attributes = {
+                ATTR_TARGET_ENTITY: self._target_entity,
+                "attribute": self._attribute,
+                ATTR_DOMAIN: self._domain,
+                ATTR_MODE: self._mode,
+                ATTR_MIN_Y: self._min_y,
+                ATTR_MAX_Y: self._max_y,
+                ATTR_UPDATE_INTERVAL: self._update_interval,
+                "curve_hash": self._curve_hash,
+                "override_behavior": self._override_behavior,
+                "override_duration": self._override_duration,
+            }
+        attrs = {**self._config_attributes, "is_overridden": self._is_overridden}
         if self._override_until:
             attrs["override_until"] = self._override_until.isoformat()
         return attrs
@@ -205,6 +298,7 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the scheduler."""
         self._is_on = True
+        self._last_dispatched = None
         self.async_write_ha_state()
 
         _LOGGER.debug(
@@ -222,9 +316,7 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
         self.async_write_ha_state()
 
         # Stop the update loop
-        if self._remove_listener:
-            self._remove_listener()
-            self._remove_listener = None
+        self._cancel_next_update()
 
         # Stop X-axis entity listeners
         for remove_listener in self._remove_x_axis_listeners:
@@ -258,20 +350,32 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
         # Set up target entity listener for manual change detection
         await self._setup_target_listener()
 
-        # If enabled (from restored state or config), start the interval immediately
+        # If enabled (from restored state or config), start updating right away,
+        # or during startup once Home Assistant runs, staggered with the others
         if self._is_on:
-            await self._start_update_listener()
+            if self.hass.state is CoreState.running:
+                await self._start_update_listener()
+            else:
+                self.hass.data[DOMAIN]["dispatcher"].async_defer_start(self)
 
     async def async_will_remove_from_hass(self) -> None:
         """Clean up on removal."""
-        if self._remove_listener:
-            self._remove_listener()
-            self._remove_listener = None
+        # Evaluations already in flight must not arm new timers
+        self._is_on = False
+        self._cancel_next_update()
+        domain_data = self.hass.data[DOMAIN]
+        if dispatcher := domain_data.get("dispatcher"):
+            dispatcher.async_cancel_start(self)
+        if queue := domain_data.get("command_queue"):
+            queue.async_cancel(self)
 
         # Clean up X-axis entity listeners
         for remove_listener in self._remove_x_axis_listeners:
             remove_listener()
         self._remove_x_axis_listeners.clear()
+        if self._remove_day_listener:
+            self._remove_day_listener()
+            self._remove_day_listener = None
 
         # Clean up target entity listener
         if self._remove_target_listener:
@@ -283,8 +387,20 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
             self._remove_override_timer()
             self._remove_override_timer = None
 
-    async def _start_update_listener(self) -> None:
-        """Start or restart the periodic update listener and run an immediate update."""
+        # Release the compiled graphs, a removed entity is never added again
+        self._graphs = []
+        self._graphs_by_id = {}
+        self._day_table = (None,) * 7
+        self._resolved_day = None
+        self._day_exceptions = []
+        self._last_dispatched = None
+
+    async def _start_update_listener(self, batch: list | None = None) -> None:
+        """Start or restart the periodic update listener and run an immediate update.
+
+        When a batch list is given, the service calls of the immediate update
+        are appended to it, as in _update_entity.
+        """
         if not self._is_on:
             _LOGGER.debug(
                 "Skip starting listener for %s because scheduler is off",
@@ -292,67 +408,54 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
             )
             return
 
-        # Restart the listener if it already exists so interval changes take effect
-        if self._remove_listener:
-            self._remove_listener()
-
-        # Use clock-aligned scheduling for precise timing
-        # This ensures updates happen at exact intervals (e.g., 19:00:00, 19:00:30)
-        # rather than offset from when the scheduler started
-        self._schedule_next_aligned_update()
+        # Restart the listener so interval changes take effect
+        self._cancel_next_update()
 
         # Set up X-axis entity listeners for entity-based graphs
         await self._setup_x_axis_listeners()
+        self._setup_day_listener()
 
-        # Trigger an immediate update so the target reflects the schedule right away
-        await self._update_entity()
+        # Trigger an immediate update so the target reflects the schedule right away.
+        # This also arms the timer for the next time the output changes.
+        await self._update_entity(batch=batch)
 
         _LOGGER.debug(
-            "Listener started for %s; interval=%ss (clock-aligned)",
+            "Listener started for %s; next update at %s (interval=%ss)",
             self._target_entity,
+            self._next_update_at.isoformat() if self._next_update_at else "interval",
             self._update_interval,
         )
 
-    def _schedule_next_aligned_update(self) -> None:
-        """Schedule the next update aligned to clock boundaries."""
-        now = dt_util.now()
-        interval_seconds = self._update_interval
-
-        # Calculate seconds since midnight
-        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        seconds_since_midnight = (now - midnight).total_seconds()
-
-        # Find the next aligned time slot
-        # e.g., if interval is 30s and current time is 19:00:17, next slot is 19:00:30
-        current_slot = int(seconds_since_midnight / interval_seconds)
-        next_slot_seconds = (current_slot + 1) * interval_seconds
-
-        # Handle day rollover
-        if next_slot_seconds >= 86400:
-            next_slot_seconds = 0
-            midnight = midnight + timedelta(days=1)
-
-        next_update_time = midnight + timedelta(seconds=next_slot_seconds)
-
-        _LOGGER.debug(
-            "Scheduling next update for %s at %s (interval=%ss)",
-            self._target_entity,
-            next_update_time.isoformat(),
-            interval_seconds,
-        )
+    def _cancel_next_update(self) -> None:
+        """Cancel the pending update, whether interval-based or exact."""
+        if self._remove_listener:
+            self._remove_listener()
+            self._remove_listener = None
+        self._next_update_at = None
 
-        self._remove_listener = async_track_point_in_time(
-            self.hass, self._aligned_update_callback, next_update_time
-        )
+    def _schedule_next_update(self, next_change: datetime | None) -> None:
+        """Arm the next update at the next output change.
 
-    @callback
-    def _aligned_update_callback(self, now: datetime) -> None:
-        """Handle aligned update callback and schedule the next one."""
-        # Schedule the next update first
-        self._schedule_next_aligned_update()
+        When the next change cannot be predicted (entity-based X-axis, unknown
+        domain, errors) the scheduler falls back to clock-aligned interval
+        updates, e.g. 19:00:00, 19:00:30. The integration-wide dispatcher
+        evaluates all schedulers due at the same moment in one pass.
+        """
+        dispatcher = self.hass.data[DOMAIN]["dispatcher"]
+        if next_change is None:
+            if self._remove_listener and self._next_update_at is None:
+                return  # Already on interval updates
+            self._cancel_next_update()
+            self._remove_listener = dispatcher.async_subscribe(
+                self._update_interval, self
+            )
+            return
 
-        # Then perform the update
-        self.hass.async_create_task(self._update_entity(now))
+        if next_change == self._next_update_at:
+            return
+        self._cancel_next_update()
+        self._remove_listener = dispatcher.async_schedule(next_change, self)
+        self._next_update_at = next_change
 
     async def _setup_target_listener(self) -> None:
         """Set up state change listener for target entity to detect manual changes."""
@@ -484,52 +587,90 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
         _LOGGER.info("Scheduler %s override cleared manually", self._target_entity)
 
     async def _setup_x_axis_listeners(self) -> None:
-        """Set up state change listeners for entity-based X-axis graphs."""
-        # Clean up existing X-axis listeners
+        """Subscribe to the X-axis entities of entity-based graphs."""
+        # Clean up existing X-axis subscriptions
         for remove_listener in self._remove_x_axis_listeners:
             remove_listener()
         self._remove_x_axis_listeners.clear()
 
         # Find all unique X-axis entities that need monitoring
-        x_axis_entities = set()
-        for graph in self._graphs:
-            if graph.get("x_axis_type") == "entity":
-                entity_id = graph.get("x_axis_entity")
-                if entity_id:
-                    x_axis_entities.add(entity_id)
-
-        if not x_axis_entities:
-            return
-
-        # Set up state change listener for X-axis entities
-        @callback
-        def handle_x_axis_state_change(event):
-            """Handle state change for X-axis entity."""
-            new_state = event.data.get("new_state")
-            if new_state is None:
-                return
+        x_axis_entities = {
+            graph.x_axis_entity for graph in self._graphs if graph.x_axis_entity
+        }
 
-            entity_id = event.data.get("entity_id")
+        # One shared listener per entity fans out to all schedulers using it
+        tracker = self.hass.data[DOMAIN]["x_axis"]
+        for entity_id in x_axis_entities:
+            self._remove_x_axis_listeners.append(
+                tracker.async_subscribe(entity_id, self)
+            )
             _LOGGER.debug(
-                "X-axis entity %s changed to %s, triggering scheduler update for %s",
+                "Set up X-axis listener for %s (target: %s)",
                 entity_id,
-                new_state.state,
                 self._target_entity,
             )
 
-            # Schedule an immediate update
-            self.hass.async_create_task(self._update_entity())
+    def _setup_day_listener(self) -> None:
+        """Re-resolve today's graph when an entity of a day exception changes."""
+        if self._remove_day_listener:
+            self._remove_day_listener()
+            self._remove_day_listener = None
 
-        for entity_id in x_axis_entities:
-            remove_listener = async_track_state_change_event(
-                self.hass, [entity_id], handle_x_axis_state_change
-            )
-            self._remove_x_axis_listeners.append(remove_listener)
+        entity_ids = {
+            exception.entity_id
+            for exception in self._day_exceptions
+            if exception.entity_id
+        }
+        if not entity_ids:
+            return
+
+        @callback
+        def handle_exception_entity_change(event) -> None:
+            """Apply a different graph right away if today's graph changed."""
+            previous = self._resolved_day
+            self._resolved_day = None
+            now = dt_util.now()
+            graph = self._get_active_graph(now)
+            if previous is not None and previous == (now.date(), graph):
+                return
             _LOGGER.debug(
-                "Set up X-axis listener for %s (target: %s)",
-                entity_id,
+                "Day exception entity %s changed, scheduler %s now uses graph %s",
+                event.data["entity_id"],
                 self._target_entity,
+                graph.label if graph else None,
             )
+            self._last_x_value = None
+            if self._is_on:
+                self.hass.data[DOMAIN]["dispatcher"].async_evaluate_now([self])
+
+        self._remove_day_listener = async_track_state_change_event(
+            self.hass, list(entity_ids), handle_exception_entity_change
+        )
+
+    @callback
+    def x_axis_update_delay(self, entity_id: str, state: State) -> float | None:
+        """Decide how to react to a new state of an X-axis entity.
+
+        Returns None if the change does not affect the output: today's graph
+        does not use the entity, the value is not numeric, or it moved less
+        than the graph's x_axis_deadband since the last evaluation. Otherwise
+        returns the graph's x_axis_debounce in seconds (0 = update now).
+        """
+        graph = self._get_active_graph(dt_util.now())
+        if graph is None or graph.x_axis_entity != entity_id:
+            return None
+
+        try:
+            value = float(state.state)
+        except (ValueError, TypeError):
+            return None
+        value = max(graph.x_axis_min, min(graph.x_axis_max, value))
+
+        if self._last_x_value is not None and (
+            abs(value - self._last_x_value) <= graph.x_axis_deadband
+        ):
+            return None
+        return graph.x_axis_debounce
 
     async def set_config(
         self,
@@ -545,8 +686,16 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
         graphs: list | None = None,
         override_behavior: str | None = None,
         override_duration: int | None = None,
+        check_target_state: bool | None = None,
+        day_exceptions: list | None = None,
+        startup_priority: int | None = None,
     ) -> None:
         """Update the scheduler configuration."""
+        # Anything may have changed, so the next update always dispatches
+        self._last_dispatched = None
+        self._config_attributes = None
+        self._last_x_value = None
+
         self._target_entity = target_entity
         self._domain = domain
         self._attribute = attribute
@@ -566,18 +715,21 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
         if override_duration is not None:
             self._override_duration = int(override_duration)
 
+        if check_target_state is not None:
+            self._check_target_state = bool(check_target_state)
+
+        if startup_priority is not None:
+            self._startup_priority = int(startup_priority)
+
         # Update full graphs payload when provided (multi-graph support)
         if graphs is not None:
-            self._graphs = graphs
-            if self._graphs:
-                primary = self._graphs[0]
-                self._attribute = primary.get("attribute")
-                self._mode = primary.get("mode", DEFAULT_MODE)
-                self._min_y = float(primary.get("min_y", DEFAULT_MIN_Y))
-                self._max_y = float(primary.get("max_y", DEFAULT_MAX_Y))
-                self._points = primary.get(
-                    "points", [{"x": 0, "y": 0}, {"x": 1440, "y": 0}]
-                )
+            self._load_graphs(graphs)
+
+        if day_exceptions is not None:
+            self._day_exceptions = [
+                DayException.from_config(exception) for exception in day_exceptions
+            ]
+            self._resolved_day = None
 
         if update_interval is not None and update_interval != self._update_interval:
             self._update_interval = int(update_interval)
@@ -588,32 +740,97 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
         if self._is_on:
             await self._start_update_listener()
         else:
-            if self._remove_listener:
-                self._remove_listener()
-                self._remove_listener = None
+            self._cancel_next_update()
 
         self.async_write_ha_state()
 
-    def _get_active_graph_for_day(self, weekday: int) -> dict | None:
-        """Get the graph that should be active for the given weekday.
+    def _get_active_graph_for_day(self, weekday: int) -> Graph | None:
+        """Get the graph of the given weekday, without day exceptions.
 
-        Returns the first graph whose weekdays list includes the given day.
+        Returns the first graph whose weekdays include the given day.
         weekday: 0=Sunday, 1=Monday, ..., 6=Saturday (JavaScript convention)
         """
-        for graph in self._graphs:
-            weekdays = graph.get("weekdays", [0, 1, 2, 3, 4, 5, 6])
-            if weekday in weekdays:
+        return self._day_table[weekday]
+
+    def _get_active_graph(self, now: datetime) -> Graph | None:
+        """Get the graph active at the given local time.
+
+        The graph is resolved once per date, day exceptions included, and
+        reused by every evaluation of that day.
+        """
+        day = now.date()
+        if self._resolved_day is None or self._resolved_day[0] != day:
+            self._resolved_day = (day, self._resolve_graph(day))
+        return self._resolved_day[1]
+
+    def _resolve_graph(self, day: date) -> Graph | None:
+        """Return the graph of the first day exception matching a date.
+
+        Without a matching exception, the graph of the date's weekday.
+        """
+        for exception in self._day_exceptions:
+            entity_state = None
+            if exception.entity_id and (
+                state := self.hass.states.get(exception.entity_id)
+            ):
+                entity_state = state.state
+            if not exception.matches(day, entity_state):
+                continue
+
+            _LOGGER.debug(
+                "Day exception %s applies to %s on %s",
+                exception.label or exception.entity_id,
+                self._target_entity,
+                day.isoformat(),
+            )
+            if exception.graph_id is not None:
+                if (graph := self._graphs_by_id.get(exception.graph_id)) is None:
+                    _LOGGER.warning(
+                        "Day exception of %s uses unknown graph %s",
+                        self._target_entity,
+                        exception.graph_id,
+                    )
                 return graph
-        return None
+            if exception.weekday is not None:
+                return self._day_table[exception.weekday]
+            return None  # No graph: the scheduler idles that day
+
+        return self._day_table[(day.weekday() + 1) % 7]
+
+    async def _update_entity(
+        self,
+        now: datetime | None = None,
+        force: bool = False,
+        batch: list | None = None,
+    ) -> None:
+        """Update the target entity and arm the timer for its next change.
 
-    async def _update_entity(self, now: datetime | None = None) -> None:
-        """Update the target entity based on the current schedule."""
+        force sends the service calls even if the output is unchanged. When a
+        batch list is given, the service calls are appended to it for the
+        caller to queue together with other schedulers.
+        """
         if not self._target_entity or not self._is_on:
             _LOGGER.debug(
                 "Skip update: target=%s is_on=%s", self._target_entity, self._is_on
             )
             return
 
+        pending = [] if batch is None else batch
+        started = time.perf_counter()
+        next_change = await self._async_apply_schedule(now, force, pending)
+        self.metrics.record_evaluation(time.perf_counter() - started)
+        self._schedule_next_update(next_change)
+        if batch is None and pending:
+            self.hass.data[DOMAIN]["command_queue"].async_enqueue(pending)
+
+    async def _async_apply_schedule(
+        self, now: datetime | None, force: bool, batch: list
+    ) -> datetime | None:
+        """Compute the current scheduled value and queue its service calls.
+
+        Returns the time at which the applied output next changes, or None if
+        it cannot be predicted.
+        """
         # Check override state
         if self._is_overridden:
             # For "until_next" behavior, clear override on each update cycle
@@ -633,7 +850,7 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
                     if self._override_until
                     else "manual",
                 )
-                return
+                return None
 
         try:
             # 1. Calculate current time in minutes and get weekday
@@ -662,48 +879,41 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
             )
 
             # 2. Find the active graph for today
-            active_graph = self._get_active_graph_for_day(js_weekday)
-            if not active_graph:
+            active_graph = self._get_active_graph(current_time)
+            if active_graph is None:
                 _LOGGER.debug(
-                    "No active graph for weekday %s, skipping update", js_weekday
+                    "No active graph for %s (weekday %s), skipping update",
+                    current_time.date().isoformat(),
+                    js_weekday,
                 )
-                return
+                # Another graph may be active tomorrow
+                return dt_util.start_of_local_day(current_time) + timedelta(days=1)
 
             # Get graph-specific settings
-            mode = active_graph.get("mode", DEFAULT_MODE)
-            min_y = float(active_graph.get("min_y", DEFAULT_MIN_Y))
-            max_y = float(active_graph.get("max_y", DEFAULT_MAX_Y))
-            points = active_graph.get("points", [{"x": 0, "y": 0}, {"x": 1440, "y": 0}])
-            attribute = active_graph.get("attribute")
-            step_to_min = bool(
-                active_graph.get("step_to_zero", False)
-            )  # legacy flag name
-
-            # Check if this graph uses entity-based X-axis
-            x_axis_type = active_graph.get("x_axis_type", "time")
-            x_axis_entity = active_graph.get("x_axis_entity")
-            x_axis_min = active_graph.get("x_axis_min", 0)
-            x_axis_max = active_graph.get("x_axis_max", 100)
-
-            if x_axis_type == "entity" and x_axis_entity:
+            curve = active_graph.curve
+            min_y = active_graph.min_y
+            max_y = active_graph.max_y
+            attribute = active_graph.attribute
+            x_axis_entity = active_graph.x_axis_entity
+
+            if x_axis_entity:
                 # Entity-based X-axis: get current value from X-axis entity
                 current_x_value = await self._get_entity_x_value(
-                    x_axis_entity, x_axis_min, x_axis_max
+                    x_axis_entity, active_graph.x_axis_min, active_graph.x_axis_max
                 )
                 if current_x_value is None:
                     _LOGGER.debug(
                         "X-axis entity %s not available, skipping update",
                         x_axis_entity,
                     )
-                    return
+                    return None
+                self._last_x_value = current_x_value
             else:
                 # Time-based X-axis: use current time in minutes
                 current_x_value = current_minute
 
             # 3. Get the Y value at this X value using the active graph
-            val_ratio = self._calculate_y_ratio_from_points(
-                current_x_value, points, mode, min_y, max_y, step_to_min
-            )
+            val_ratio = curve.ratio_at(current_x_value)
 
             # 4. Map ratio to actual value
             actual_value = min_y + (val_ratio * (max_y - min_y))
@@ -712,12 +922,12 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
                 "Scheduler %s domain=%s graph=%s value=%.3f (ratio=%.3f) min=%.2f max=%.2f x_axis=%s x_value=%.2f",
                 self._target_entity,
                 self._domain,
-                active_graph.get("label", "unknown"),
+                active_graph.label,
                 actual_value,
                 val_ratio,
                 min_y,
                 max_y,
-                x_axis_type,
+                x_axis_entity or "time",
                 current_x_value,
             )
 
@@ -725,24 +935,78 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
             self._last_applied_value = actual_value
 
             # 5. Apply based on domain (with attribute support)
-            if self._domain == "light":
-                await self._apply_light(actual_value, attribute)
-            elif self._domain == "climate":
-                await self._apply_climate(actual_value)
-            elif self._domain in ("number", "input_number"):
-                await self._apply_number(actual_value)
-            elif self._domain == "fan":
-                await self._apply_fan(actual_value)
-            elif self._domain == "cover":
-                await self._apply_cover(actual_value)
-            elif self._domain == "humidifier":
-                await self._apply_humidifier(actual_value)
-            elif self._domain == "media_player":
-                await self._apply_media_player(actual_value)
-            else:
-                _LOGGER.warning("Unknown domain: %s", self._domain)
+            commands = self._build_commands(actual_value, attribute)
+            if commands and self._should_dispatch(commands, force):
+                self.metrics.dispatches += 1
+                batch.append((self, commands))
+
+            if x_axis_entity:
+                # Entity-based X-axis changes are driven by the X-axis entity
+                return None
+            return self._next_change_time(
+                curve, current_time, current_x_value, attribute
+            )
         except Exception as err:
+            self.metrics.errors += 1
             _LOGGER.error("Error updating scheduler: %s", err)
+            return None
+
+    def _next_change_time(
+        self,
+        curve: CompiledCurve,
+        current_time: datetime,
+        current_minute: float,
+        attribute: str | None,
+    ) -> datetime | None:
+        """Return when the quantized output of a time-based curve next changes.
+
+        Never later than the next midnight, when another graph may become
+        active, or MAX_NEXT_CHANGE_DELAY seconds from now, and never sooner
+        than MIN_NEXT_CHANGE_DELAY seconds from now. When the output does not
+        change again, the next aligned update interval slot is used instead.
+        """
+        quantum = self._output_quantum(attribute)
+        if quantum is None:
+            return None
+
+        next_minute = curve.next_change_x(current_minute, *quantum)
+        day_start = dt_util.start_of_local_day(current_time)
+        if next_minute is None:
+            ceiling = next_aligned_time(current_time, self._update_interval)
+        else:
+            ceiling = current_time + timedelta(seconds=MAX_NEXT_CHANGE_DELAY)
+        if next_minute is None or next_minute >= 1440:
+            next_time = day_start + timedelta(days=1)
+        else:
+            next_time = day_start + timedelta(minutes=next_minute)
+
+        _LOGGER.debug(
+            "Next output change for %s at %s",
+            self._target_entity,
+            next_time.isoformat(),
+        )
+        next_time = min(next_time, ceiling)
+        return max(next_time, current_time + timedelta(seconds=MIN_NEXT_CHANGE_DELAY))
+
+    def _output_quantum(self, attribute: str | None) -> tuple[float, bool] | None:
+        """Return the (step, round_half) resolution of the value sent to the target.
+
+        Mirrors the int()/round() conversions of the command builders, in the
+        units of the graph's Y axis. Returns None for unknown domains.
+        """
+        if self._domain == "light":
+            if attribute in ("brightness", "color_temp", "color_temp_kelvin"):
+                return 1, False
+            return 100 / 255, False  # Percentage mapped to brightness 0-255
+        if self._domain == "climate":
+            return 0.1, True
+        if self._domain in ("number", "input_number"):
+            return 0.01, True
+        if self._domain in ("fan", "cover", "humidifier"):
+            return 1, False
+        if self._domain == "media_player":
+            return 1, True  # Volume level rounded to 2 decimals of 0.0-1.0
+        return None
 
     async def _get_entity_x_value(
         self, entity_id: str, x_min: float, x_max: float
@@ -791,8 +1055,71 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
             _LOGGER.error("Error getting X-axis entity value: %s", err)
             return None
 
-    async def _apply_light(self, value: float, attribute: str | None = None) -> None:
-        """Apply value to a light entity."""
+    def _build_commands(
+        self, value: float, attribute: str | None = None
+    ) -> tuple[ServiceCommand, ...] | None:
+        """Build the service calls applying a value, based on domain."""
+        if self._domain == "light":
+            return self._light_commands(value, attribute)
+        if self._domain == "climate":
+            return self._climate_commands(value)
+        if self._domain in ("number", "input_number"):
+            return self._number_commands(value)
+        if self._domain == "fan":
+            return self._fan_commands(value)
+        if self._domain == "cover":
+            return self._cover_commands(value)
+        if self._domain == "humidifier":
+            return self._humidifier_commands(value)
+        if self._domain == "media_player":
+            return self._media_player_commands(value)
+        _LOGGER.warning("Unknown domain: %s", self._domain)
+        return None
+
+    def _should_dispatch(
+        self, commands: tuple[ServiceCommand, ...], force: bool = False
+    ) -> bool:
+        """Return True unless the service calls would change nothing.
+
+        Calls are suppressed when they equal the last dispatched ones or, with
+        check_target_state enabled and on the first evaluation, when the target
+        state already matches.
+        """
+        verify_target = self._check_target_state or self._verify_target
+        self._verify_target = False
+        if not force:
+            if verify_target:
+                unchanged = target_state_matches(
+                    self.hass.states.get(self._target_entity), commands
+                )
+            else:
+                unchanged = commands == self._last_dispatched
+            if unchanged:
+                _LOGGER.debug(
+                    "Skip dispatch for %s: output unchanged", self._target_entity
+                )
+                self._last_dispatched = commands
+                self.metrics.suppressed += 1
+                return False
+
+        self._last_dispatched = commands
+        return True
+
+    def handle_dispatch_error(self, err: Exception) -> None:
+        """Handle a failed dispatch of this scheduler's service calls."""
+        self.metrics.dispatch_errors += 1
+        _LOGGER.error("Error applying scheduler %s: %s", self._target_entity, err)
+        # Make sure the next update sends again, within one update interval
+        self._last_dispatched = None
+        if self._next_update_at is not None:
+            retry_at = next_aligned_time(dt_util.now(), self._update_interval)
+            if retry_at < self._next_update_at:
+                self._schedule_next_update(retry_at)
+
+    def _light_commands(
+        self, value: float, attribute: str | None = None
+    ) -> tuple[ServiceCommand, ...]:
+        """Build the service calls for a light entity."""
         if attribute == "brightness":
             # Direct brightness value (0-255)
             brightness = int(value)
@@ -801,16 +1128,11 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
             _LOGGER.debug(
                 "Apply light %s %s=%.2f", self._target_entity, attribute, value
             )
-            await self.hass.services.async_call(
-                "light",
-                "turn_on",
-                {
-                    "entity_id": self._target_entity,
-                    attribute: int(value),
-                    "transition": 5,
-                },
+            return (
+                ServiceCommand(
+                    "light", "turn_on", ((attribute, int(value)), ("transition", 5))
+                ),
             )
-            return
         else:
             # Default: percentage-based brightness
             brightness = int((value / 100) * 255) if value > 0 else 0
@@ -824,90 +1146,63 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
 
         if brightness > 0:
             # Ensure the light turns on with the requested brightness
-            await self.hass.services.async_call(
-                "light",
-                "turn_on",
-                {
-                    "entity_id": self._target_entity,
-                    "brightness": brightness,
-                    "transition": 5,
-                },
-            )
-        else:
-            await self.hass.services.async_call(
-                "light",
-                "turn_off",
-                {"entity_id": self._target_entity, "transition": 5},
+            return (
+                ServiceCommand(
+                    "light",
+                    "turn_on",
+                    (("brightness", brightness), ("transition", 5)),
+                ),
             )
+        return (ServiceCommand("light", "turn_off", (("transition", 5),)),)
 
-    async def _apply_climate(self, value: float) -> None:
-        """Apply value to a climate entity."""
+    def _climate_commands(self, value: float) -> tuple[ServiceCommand, ...]:
+        """Build the service calls for a climate entity."""
         _LOGGER.debug("Apply climate %s temp=%.2f", self._target_entity, value)
-        await self.hass.services.async_call(
-            "climate",
-            "set_temperature",
-            {"entity_id": self._target_entity, "temperature": round(value, 1)},
+        return (
+            ServiceCommand(
+                "climate", "set_temperature", (("temperature", round(value, 1)),)
+            ),
         )
 
-    async def _apply_number(self, value: float) -> None:
-        """Apply value to a number entity."""
+    def _number_commands(self, value: float) -> tuple[ServiceCommand, ...]:
+        """Build the service calls for a number entity."""
         _LOGGER.debug("Apply number %s value=%.2f", self._target_entity, value)
-        await self.hass.services.async_call(
-            "input_number",
-            "set_value",
-            {"entity_id": self._target_entity, "value": round(value, 2)},
+        return (
+            ServiceCommand("input_number", "set_value", (("value", round(value, 2)),)),
         )
 
-    async def _apply_fan(self, value: float) -> None:
-        """Apply value to a fan entity (percentage)."""
+    def _fan_commands(self, value: float) -> tuple[ServiceCommand, ...]:
+        """Build the service calls for a fan entity (percentage)."""
         percentage = int(value)
 
         _LOGGER.debug(
             "Apply fan %s pct=%s (value=%.2f)", self._target_entity, percentage, value
         )
 
-        # If fan is off and we want non-zero, turn it on first
-        if percentage > 0:
-            await self.hass.services.async_call(
-                "fan",
-                "turn_on",
-                {"entity_id": self._target_entity},
-            )
-
         if percentage > 0:
-            await self.hass.services.async_call(
-                "fan",
-                "set_percentage",
-                {"entity_id": self._target_entity, "percentage": percentage},
-            )
-        else:
-            await self.hass.services.async_call(
-                "fan",
-                "turn_off",
-                {"entity_id": self._target_entity},
+            # If fan is off and we want non-zero, turn it on first
+            return (
+                ServiceCommand("fan", "turn_on"),
+                ServiceCommand("fan", "set_percentage", (("percentage", percentage),)),
             )
+        return (ServiceCommand("fan", "turn_off"),)
 
-    async def _apply_cover(self, value: float) -> None:
-        """Apply value to a cover entity (position)."""
+    def _cover_commands(self, value: float) -> tuple[ServiceCommand, ...]:
+        """Build the service calls for a cover entity (position)."""
         position = int(value)
         _LOGGER.debug(
             "Apply cover %s pos=%s (value=%.2f)", self._target_entity, position, value
         )
+        set_position = ServiceCommand(
+            "cover", "set_cover_position", (("position", position),)
+        )
         if position > 0:
             # Best-effort to ensure movement: open command before setting position
-            await self.hass.services.async_call(
-                "cover",
-                "open_cover",
-                {"entity_id": self._target_entity},
-            )
-        await self.hass.services.async_call(
-            "cover",
-            "set_cover_position",
-            {"entity_id": self._target_entity, "position": position},
-        )
+            return (ServiceCommand("cover", "open_cover"), set_position)
+        return (set_position,)
 
-    async def _apply_humidifier(self, value: float) -> None:
-        """Apply value to a humidifier entity (humidity)."""
+    def _humidifier_commands(self, value: float) -> tuple[ServiceCommand, ...]:
+        """Build the service calls for a humidifier entity (humidity)."""
         humidity = int(value)
         _LOGGER.debug(
             "Apply humidifier %s humidity=%s (value=%.2f)",
@@ -915,20 +1210,15 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
             humidity,
             value,
         )
-        if humidity > 0:
-            await self.hass.services.async_call(
-                "humidifier",
-                "turn_on",
-                {"entity_id": self._target_entity},
-            )
-        await self.hass.services.async_call(
-            "humidifier",
-            "set_humidity",
-            {"entity_id": self._target_entity, "humidity": humidity},
+        set_humidity = ServiceCommand(
+            "humidifier", "set_humidity", (("humidity", humidity),)
         )
+        if humidity > 0:
+            return (ServiceCommand("humidifier", "turn_on"), set_humidity)
+        return (set_humidity,)
 
-    async def _apply_media_player(self, value: float) -> None:
-        """Apply value to a media player entity (volume)."""
+    def _media_player_commands(self, value: float) -> tuple[ServiceCommand, ...]:
+        """Build the service calls for a media player entity (volume)."""
         # Volume is 0.0 to 1.0 for media_player
         volume = value / 100.0
         _LOGGER.debug(
@@ -937,147 +1227,9 @@ class UniversalSchedulerSwitch(SwitchEntity, RestoreEntity):
             volume,
             value,
         )
-        if volume > 0:
-            await self.hass.services.async_call(
-                "media_player",
-                "turn_on",
-                {"entity_id": self._target_entity},
-            )
-        await self.hass.services.async_call(
-            "media_player",
-            "volume_set",
-            {"entity_id": self._target_entity, "volume_level": round(volume, 2)},
-        )
-
-    def _calculate_y_ratio_from_points(
-        self,
-        current_minute: float,
-        points: list,
-        mode: str,
-        min_y: float,
-        max_y: float,
-        step_to_min: bool = False,
-    ) -> float:
-        """Calculate the Y value (0.0 to 1.0) at the given minute for specific graph points."""
-        if not points or len(points) < 2:
-            return 0.0
-
-        # Sort points by x coordinate
-        sorted_points = sorted(points, key=lambda p: p["x"])
-
-        # Handle wrap-around (points across midnight)
-        if current_minute < sorted_points[0]["x"]:
-            # We're before the first point, use the last point's value
-            return (
-                (sorted_points[-1]["y"] - min_y) / (max_y - min_y)
-                if max_y != min_y
-                else 0.0
-            )
-
-        # Find the two points we're between
-        for i in range(len(sorted_points) - 1):
-            p1 = sorted_points[i]
-            p2 = sorted_points[i + 1]
-
-            if p1["x"] <= current_minute <= p2["x"]:
-                # We're between these two points
-                return self._interpolate_points(
-                    p1, p2, current_minute, mode, min_y, max_y, step_to_min
-                )
-
-        # We're after the last point
-        return (
-            (sorted_points[-1]["y"] - min_y) / (max_y - min_y)
-            if max_y != min_y
-            else 0.0
+        set_volume = ServiceCommand(
+            "media_player", "volume_set", (("volume_level", round(volume, 2)),)
         )
-
-    def _interpolate_points(
-        self,
-        p1: dict,
-        p2: dict,
-        current_minute: float,
-        mode: str,
-        min_y: float,
-        max_y: float,
-        step_to_min: bool = False,
-    ) -> float:
-        """Interpolate between two points based on mode."""
-        if p1["x"] == p2["x"]:
-            return (p1["y"] - min_y) / (max_y - min_y) if max_y != min_y else 0.0
-
-        ratio = (current_minute - p1["x"]) / (p2["x"] - p1["x"])
-        y1 = (p1["y"] - min_y) / (max_y - min_y) if max_y != min_y else 0.0
-        y2 = (p2["y"] - min_y) / (max_y - min_y) if max_y != min_y else 0.0
-
-        if mode == MODE_STEP:
-            # Step function - stay at p1's value until we reach p2
-            # When we're at or past p2's x position, use p2's value (immediate step)
-            if current_minute >= p2["x"]:
-                return y2
-            # For step_to_min: only step to min AT the min point, not before
-            # This keeps p1's value until we reach p2
-            return y1
-
-        # For non-step modes with step_to_min enabled:
-        # Hold at p1's value until reaching p2, then drop to min
-        if step_to_min and max_y != min_y:
-            # If next point is at min, hold at p1's value until we reach p2
-            if p2["y"] <= min_y:
-                if current_minute >= p2["x"]:
-                    return 0.0  # At p2, drop to min
-                return y1  # Before p2, hold at p1's value
-            # If coming up from min, delay the rise slightly
-            if p1["y"] <= min_y and ratio < 0.01:
-                return 0.0
-
-        if mode == MODE_SMOOTH:
-            # Cosine interpolation for smooth curves
-            return y1 + (y2 - y1) * (1 - math.cos(ratio * math.pi)) / 2
-        else:
-            # Linear interpolation (default)
-            return y1 + (y2 - y1) * ratio
-
-    def _calculate_y_ratio(self, current_minute: int) -> float:
-        """Calculate the Y value (0.0 to 1.0) at the given minute of the day."""
-        if not self._points or len(self._points) < 2:
-            return 0.0
-
-        # Sort points by x coordinate
-        sorted_points = sorted(self._points, key=lambda p: p["x"])
-
-        # Handle wrap-around (points across midnight)
-        if current_minute < sorted_points[0]["x"]:
-            # We're before the first point, use the last point's value
-            return sorted_points[-1]["y"] / 100.0
-
-        # Find the two points we're between
-        for i in range(len(sorted_points) - 1):
-            p1 = sorted_points[i]
-            p2 = sorted_points[i + 1]
-
-            if p1["x"] <= current_minute <= p2["x"]:
-                # We're between these two points
-                return self._interpolate(p1, p2, current_minute)
-
-        # We're after the last point
-        return sorted_points[-1]["y"] / 100.0
-
-    def _interpolate(self, p1: dict, p2: dict, current_minute: int) -> float:
-        """Interpolate between two points based on mode."""
-        if p1["x"] == p2["x"]:
-            return p1["y"] / 100.0
-
-        ratio = (current_minute - p1["x"]) / (p2["x"] - p1["x"])
-        y1 = p1["y"] / 100.0
-        y2 = p2["y"] / 100.0
-
-        if self._mode == MODE_STEP:
-            # Step function - stay at p1's value until we reach p2
-            return y1
-        elif self._mode == MODE_SMOOTH:
-            # Cosine interpolation for smooth curves
-            return y1 + (y2 - y1) * (1 - math.cos(ratio * math.pi)) / 2
-        else:
-            # Linear interpolation (default)
-            return y1 + (y2 - y1) * ratio
+        if volume > 0:
+            return (ServiceCommand("media_player", "turn_on"), set_volume)
+        return (set_volume,)
@@ -0,0 +1,120 @@
+"""Shared X-axis entity subscriptions for Universal Scheduler."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .switch import UniversalSchedulerSwitch
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class XAxisTracker:
+    """Track the X-axis entities of all schedulers with one listener each.
+
+    State changes of an X-axis entity fan out to the schedulers depending on
+    it through an index. Each scheduler decides whether the change matters
+    (deadband) and how long to wait before applying it (debounce window).
+    Schedulers due immediately are evaluated together in one pass.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self._index: dict[str, set[UniversalSchedulerSwitch]] = {}
+        self._listeners: dict[str, CALLBACK_TYPE] = {}
+        self._debounced: dict[UniversalSchedulerSwitch, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_subscribe(
+        self, entity_id: str, scheduler: UniversalSchedulerSwitch
+    ) -> CALLBACK_TYPE:
+        """Update a scheduler when the given X-axis entity changes.
+
+        Returns a callback that removes the subscription again.
+        """
+        schedulers = self._index.setdefault(entity_id, set())
+        schedulers.add(scheduler)
+        if entity_id not in self._listeners:
+            self._listeners[entity_id] = async_track_state_change_event(
+                self.hass, [entity_id], self._handle_state_change
+            )
+            _LOGGER.debug("Tracking X-axis entity %s", entity_id)
+
+        @callback
+        def unsubscribe() -> None:
+            """Remove the scheduler and drop the listener of an unused entity."""
+            schedulers.discard(scheduler)
+            if remove_timer := self._debounced.pop(scheduler, None):
+                remove_timer()
+            if not schedulers and self._index.get(entity_id) is schedulers:
+                del self._index[entity_id]
+                self._listeners.pop(entity_id)()
+
+        return unsubscribe
+
+    @callback
+    def async_stats(self) -> dict[str, int]:
+        """Return the number of tracked entities, subscriptions and pending windows."""
+        return {
+            "x_axis_entities": len(self._listeners),
+            "x_axis_schedulers": sum(len(s) for s in self._index.values()),
+            "x_axis_debounced": len(self._debounced),
+        }
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Remove all listeners and pending updates."""
+        for remove in (*self._listeners.values(), *self._debounced.values()):
+            remove()
+        self._listeners.clear()
+        self._debounced.clear()
+        self._index.clear()
+
+    @callback
+    def _handle_state_change(self, event: Event) -> None:
+        """Fan a state change out to the schedulers using the entity."""
+        entity_id = event.data["entity_id"]
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            return
+
+        due_now = []
+        for scheduler in self._index.get(entity_id, ()):
+            delay = scheduler.x_axis_update_delay(entity_id, new_state)
+            if delay is None:
+                continue
+            if delay <= 0:
+                due_now.append(scheduler)
+            elif scheduler not in self._debounced:
+                # Later changes within the window are picked up when it ends
+                self._debounced[scheduler] = async_call_later(
+                    self.hass, delay, self._debounce_handler(scheduler)
+                )
+
+        if due_now:
+            _LOGGER.debug(
+                "X-axis entity %s changed to %s, updating %s scheduler(s)",
+                entity_id,
+                new_state.state,
+                len(due_now),
+            )
+            self.hass.data[DOMAIN]["dispatcher"].async_evaluate_now(due_now)
+
+    def _debounce_handler(self, scheduler: UniversalSchedulerSwitch):
+        """Return the callback ending the debounce window of a scheduler."""
+
+        @callback
+        def handle_debounce_end(_now) -> None:
+            """Apply the latest X-axis value to the scheduler."""
+            self._debounced.pop(scheduler, None)
+            self.hass.data[DOMAIN]["dispatcher"].async_evaluate_now([scheduler])
+
+        return handle_debounce_end